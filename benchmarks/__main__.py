@@ -0,0 +1,85 @@
+"""Mapping extraction and model materialization benchmarks.
+
+    python -m benchmarks --sizes 10 1000 10000 --output results.json
+    python -m benchmarks --baseline results.json --threshold 0.1
+"""
+import argparse
+import json
+import sys
+
+from orm_bridge.mapping import FieldType
+
+from benchmarks.suite import BRIDGES, compare, run
+
+
+def field_mix(value: str) -> dict[FieldType, float]:
+    mix: dict[FieldType, float] = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        mix[FieldType(name)] = float(weight or 1)
+    return mix
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--bridges", nargs="+", choices=list(BRIDGES), default=list(BRIDGES))
+    parser.add_argument("--fields", type=int, default=8, help="fields per model")
+    parser.add_argument(
+        "--mix",
+        type=field_mix,
+        help="field type weights, e.g. integer=3,string=4,boolean=2,float=1",
+    )
+    parser.add_argument("--fk-density", type=float, default=0.5, help="FKs per model")
+    parser.add_argument("--m2m-density", type=float, default=0.1, help="M2Ms per model")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to save results as JSON")
+    parser.add_argument("--baseline", help="results JSON to check for regressions")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed throughput drop"
+    )
+    args = parser.parse_args()
+
+    spec = dict(
+        fields=args.fields,
+        fk_density=args.fk_density,
+        m2m_density=args.m2m_density,
+        seed=args.seed,
+    )
+    if args.mix:
+        spec["field_mix"] = args.mix
+    results = run(args.sizes, args.bridges, **spec)
+
+    for result in results["results"]:
+        # translate_many builds all models in one call, it has no per-model times
+        percentiles = {
+            key: "-" if result[key] is None else f"{result[key]:.1f}"
+            for key in ("p50_us", "p99_us")
+        }
+        print(
+            "{case:>14} {pair:<22} {models:>6} models {throughput:>10.0f}/s "
+            "p50 {p50:>8}us p99 {p99:>8}us peak {peak_kib:>9.0f}KiB".format(
+                pair="->".join(
+                    filter(None, (result.get("source"), result.get("target")))
+                ),
+                p50=percentiles["p50_us"],
+                p99=percentiles["p99_us"],
+                **result,
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(json.load(file), results, args.threshold)
+        for regression in regressions:
+            print("regression:", regression, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
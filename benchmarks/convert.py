@@ -0,0 +1,91 @@
+"""Compiled row converters against a generic per-field loop.
+
+    python -m benchmarks.convert [rows]
+"""
+import enum
+import sys
+import time
+import typing
+
+from orm_bridge.convert import COERCIONS, Correspondence, columns, compile_converter
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+SOURCE = ModelMapping.trusted(
+    "users",
+    [
+        FieldMapping.trusted(name="id", type=FieldType.INTEGER, primary_key=True),
+        FieldMapping.trusted(name="username", type=FieldType.STRING, max_length=31),
+        FieldMapping.trusted(name="role", type=FieldType.STRING, nullable=True),
+        FieldMapping.trusted(name="score", type=FieldType.INTEGER, nullable=True),
+        FieldMapping.trusted(name="active", type=FieldType.BOOLEAN, nullable=True),
+    ],
+)
+TARGET = ModelMapping.trusted(
+    "members",
+    [
+        FieldMapping.trusted(name="id", type=FieldType.INTEGER, primary_key=True),
+        FieldMapping.trusted(name="name", type=FieldType.STRING, max_length=31),
+        FieldMapping.trusted(
+            name="role", type=FieldType.STRING, choices={"customer", "seller"}, default="customer"
+        ),
+        FieldMapping.trusted(name="score", type=FieldType.FLOAT, nullable=True),
+        FieldMapping.trusted(name="active", type=FieldType.BOOLEAN, default=True),
+    ],
+)
+CORRESPONDENCE = {"name": "username"}
+
+
+def naive_converter(
+    source: ModelMapping,
+    target: ModelMapping,
+    correspondence: Correspondence,
+) -> typing.Callable[[tuple], tuple]:
+    """Same conversion as a loop over field mappings looked up by name"""
+
+    positions = {field.name: i for i, field in enumerate(columns(source))}
+    types = {field.name: field.type for field in source.fields}
+    fields = columns(target)
+
+    def convert(row: tuple) -> tuple:
+        values = []
+        for field in fields:
+            origin = correspondence.get(field.name, field.name)
+            value = row[positions[origin]] if origin in positions else None
+            if value is None and field.default is not None:
+                value = field.default
+            if isinstance(value, enum.Enum):
+                value = value.value
+            if value is not None and types.get(origin) != field.type:
+                value = COERCIONS[field.type](value)
+            if field.choices and value is not None and value not in field.choices:
+                raise ValueError(f"{field.name}: {value!r} is not a choice")
+            if value is None and not field.nullable:
+                raise ValueError(f"{field.name} is not nullable")
+            values.append(value)
+        return tuple(values)
+
+    return convert
+
+
+def measure(convert: typing.Callable[[tuple], tuple], rows: list[tuple]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        convert(row)
+    return time.perf_counter() - start
+
+
+def main(count: int = 1_000_000) -> None:
+    roles = ("customer", "seller", None)
+    rows = [(i, f"user {i}", roles[i % 3], i % 100, None) for i in range(count)]
+    naive = naive_converter(SOURCE, TARGET, CORRESPONDENCE)
+    compiled = compile_converter(SOURCE, TARGET, CORRESPONDENCE)
+    assert all(naive(row) == compiled(row) for row in rows[:1000])
+
+    print(f"{count} rows")
+    for name, convert in (("naive", naive), ("compiled", compiled)):
+        elapsed = measure(convert, rows)
+        print(f"{name:>10}: {elapsed:6.2f} s {count / elapsed:12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""Schema bootstrap through ORM models against direct DDL compilation.
+
+    python -m benchmarks.ddl [models]
+"""
+import sqlite3
+import sys
+import time
+
+import sqlalchemy
+
+from orm_bridge.bridge.sqlalchemy import SQLAlchemyBridge
+from orm_bridge.ddl import DDLCompiler, apply
+
+from benchmarks.schema import SchemaSpec, generate
+
+
+def through_models(models: int) -> float:
+    mappings = generate(SchemaSpec(models), relations=False)
+    start = time.perf_counter()
+    bridge = SQLAlchemyBridge()
+    for mapping in mappings:
+        bridge.get_model(mapping)
+    bridge.metadata.create_all(sqlalchemy.create_engine("sqlite://"))
+    return time.perf_counter() - start
+
+
+def direct(models: int, compiler: DDLCompiler) -> float:
+    mappings = generate(SchemaSpec(models), relations=False)
+    start = time.perf_counter()
+    apply(sqlite3.connect(":memory:"), mappings, compiler=compiler)
+    return time.perf_counter() - start
+
+
+def main(models: int = 1000) -> None:
+    compiler = DDLCompiler("sqlite")
+    print(f"{models} tables")
+    print(f"{'orm models':>12}: {through_models(models) * 1e3:8.1f} ms")
+    print(f"{'ddl cold':>12}: {direct(models, compiler) * 1e3:8.1f} ms")
+    print(f"{'ddl cached':>12}: {direct(models, compiler) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
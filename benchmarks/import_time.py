@@ -0,0 +1,61 @@
+"""Import time and memory of orm_bridge with lazily resolved backends.
+
+    python -m benchmarks.import_time [runs]
+
+Each case runs in a fresh interpreter, eager imports every backend the way
+importing all bridge modules did before the registry
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1e3,
+    "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "orms": [name for name in ("ormar", "tortoise", "sqlalchemy") if name in sys.modules],
+}}))
+"""
+
+CASES: dict[str, str] = {
+    "core": "import orm_bridge",
+    "ormar": "from orm_bridge.bridge import get_bridge; get_bridge('ormar')",
+    "tortoise": "from orm_bridge.bridge import get_bridge; get_bridge('tortoise')",
+    "sqlalchemy": "from orm_bridge.bridge import get_bridge; get_bridge('sqlalchemy')",
+    "eager": (
+        "import orm_bridge.bridge.ormar, orm_bridge.bridge.tortoise, "
+        "orm_bridge.bridge.sqlalchemy; orm_bridge.bridge.sqlalchemy.Base"
+    ),
+}
+
+
+def probe(code: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(runs: int = 5) -> None:
+    for case, code in CASES.items():
+        samples = [probe(code) for _ in range(runs)]
+        print(
+            "{:>10}: {:7.1f} ms {:9.0f} KiB rss  {}".format(
+                case,
+                statistics.median(sample["ms"] for sample in samples),
+                statistics.median(sample["rss_kib"] for sample in samples),
+                ", ".join(samples[0]["orms"]) or "no ORM",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""Memory per field of validated, trusted, compact and interned mappings.
+
+Catalogs are measured twice: with field names distinct in every table, as in
+earlier runs of this script, and with a share of fields repeating across tables.
+
+    python -m benchmarks.mapping_memory [models] [fields per model] [shared %]
+"""
+import gc
+import sys
+import tracemalloc
+import typing
+
+from orm_bridge.intern import Interner
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping, ModelRecord
+
+FIELD_KINDS: list[dict[str, typing.Any]] = [
+    dict(type=FieldType.INTEGER, primary_key=True, autoincrement=True),
+    dict(type=FieldType.STRING, max_length=63),
+    dict(type=FieldType.STRING, max_length=15, choices={"draft", "published"}),
+    dict(type=FieldType.BOOLEAN, default=True),
+    dict(type=FieldType.FLOAT, nullable=True, ge=0),
+    dict(type=FieldType.INTEGER, index=True, unique=True),
+]
+
+
+def field_values(model: int, fields: int, shared: int) -> list[dict[str, typing.Any]]:
+    """Values of fields of a table, the first `shared` ones are common to all tables"""
+
+    return [
+        # like `id` or `created_at`, shared columns repeat across tables
+        {
+            **FIELD_KINDS[i % len(FIELD_KINDS)],
+            "name": f"field_{i}" if i < shared else f"field_{model}_{i}",
+        }
+        for i in range(fields)
+    ]
+
+
+def validated(models: int, fields: int, shared: int) -> list[ModelMapping]:
+    return [
+        ModelMapping(
+            name=f"table_{m}",
+            fields=[FieldMapping(**values) for values in field_values(m, fields, shared)],
+        )
+        for m in range(models)
+    ]
+
+
+def trusted(models: int, fields: int, shared: int) -> list[ModelMapping]:
+    return [
+        ModelMapping.trusted(
+            f"table_{m}",
+            [FieldMapping.trusted(**values) for values in field_values(m, fields, shared)],
+        )
+        for m in range(models)
+    ]
+
+
+def compact(models: int, fields: int, shared: int) -> list[ModelRecord]:
+    return [
+        ModelRecord.from_mapping(mapping) for mapping in trusted(models, fields, shared)
+    ]
+
+
+def interned(models: int, fields: int, shared: int) -> list[ModelMapping]:
+    return Interner().intern_catalog(trusted(models, fields, shared))
+
+
+def measure(
+    build: typing.Callable[[int, int, int], list], models: int, fields: int, shared: int
+) -> float:
+    gc.collect()
+    tracemalloc.start()
+    catalog = build(models, fields, shared)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return size / (models * fields)
+
+
+def main(models: int = 10_000, fields: int = 8, shared_percent: int = 25) -> None:
+    mixed = fields * shared_percent // 100
+    for shared, label in ((0, "distinct names"), (mixed, f"{mixed} shared fields")):
+        print(f"{models} models x {fields} fields, {label}")
+        for build in (validated, trusted, compact, interned):
+            size = measure(build, models, fields, shared)
+            print(f"{build.__name__:>10}: {size:8.1f} bytes per field")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
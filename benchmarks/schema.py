@@ -0,0 +1,92 @@
+import random
+import typing
+
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+DEFAULT_FIELD_MIX: dict[FieldType, float] = {
+    FieldType.INTEGER: 3,
+    FieldType.STRING: 4,
+    FieldType.BOOLEAN: 2,
+    FieldType.FLOAT: 1,
+}
+
+
+class SchemaSpec(typing.NamedTuple):
+    """Shape of a synthetic schema"""
+
+    models: int
+    fields: int = 8
+    field_mix: dict[FieldType, float] = DEFAULT_FIELD_MIX
+    fk_density: float = 0.5
+    m2m_density: float = 0.1
+    seed: int = 0
+
+
+def relations_count(rng: random.Random, density: float) -> int:
+    count = int(density)
+    return count + (rng.random() < density - count)
+
+
+def scalar_field(rng: random.Random, name: str, field_type: FieldType) -> FieldMapping:
+    values: dict[str, typing.Any] = {}
+    if field_type == FieldType.STRING:
+        values["max_length"] = rng.choice((15, 63, 255, 1023))
+        if rng.random() < 0.1:
+            values["choices"] = {"draft", "published", "archived"}
+            values["max_length"] = 15
+    elif field_type == FieldType.BOOLEAN:
+        values["default"] = rng.random() < 0.5
+    elif field_type in (FieldType.INTEGER, FieldType.FLOAT):
+        if rng.random() < 0.2:
+            values["ge"] = 0
+    return FieldMapping.trusted(
+        name=name,
+        type=field_type,
+        nullable=rng.random() < 0.3,
+        index=rng.random() < 0.1,
+        **values,
+    )
+
+
+def generate(
+    spec: SchemaSpec,
+    prefix: str = "bench",
+    relations: bool = True,
+) -> list[ModelMapping]:
+    """Generates mappings, relations only point to previously generated tables"""
+
+    rng = random.Random(spec.seed)
+    types = list(spec.field_mix)
+    weights = list(spec.field_mix.values())
+    mappings: list[ModelMapping] = []
+
+    for i in range(spec.models):
+        tablename = f"{prefix}_table_{i}"
+        fields = [
+            FieldMapping.trusted(
+                name="id", type=FieldType.INTEGER, primary_key=True, autoincrement=True
+            )
+        ]
+        for j, field_type in enumerate(rng.choices(types, weights, k=spec.fields - 1)):
+            fields.append(scalar_field(rng, f"field_{j}", field_type))
+
+        if relations and i:
+            for j in range(relations_count(rng, spec.fk_density)):
+                fields.append(
+                    FieldMapping.trusted(
+                        name=f"fk_{j}",
+                        type=FieldType.FOREIGN_KEY,
+                        tablename=f"{prefix}_table_{rng.randrange(i)}",
+                        related_name=f"{tablename}_fk_{j}",
+                    )
+                )
+            for j in range(relations_count(rng, spec.m2m_density)):
+                fields.append(
+                    FieldMapping.trusted(
+                        name=f"m2m_{j}",
+                        type=FieldType.MANY2MANY,
+                        tablename=f"{prefix}_table_{rng.randrange(i)}",
+                    )
+                )
+        mappings.append(ModelMapping.trusted(tablename, fields))
+    return mappings
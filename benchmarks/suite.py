@@ -0,0 +1,223 @@
+import gc
+import itertools
+import platform
+import time
+import tracemalloc
+import typing
+
+from orm_bridge.bridge import Bridge
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.sqlalchemy import SQLAlchemyBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.translator import Translator
+
+from benchmarks.schema import SchemaSpec, generate
+
+BRIDGES: dict[str, typing.Type[Bridge]] = {
+    "ormar": OrmarBridge,
+    "tortoise": TortoiseBridge,
+    "sqlalchemy": SQLAlchemyBridge,
+}
+
+Result = dict[str, typing.Any]
+
+_prefixes = itertools.count()
+
+
+def supports_relations(bridge_cls: typing.Type[Bridge]) -> bool:
+    """Whether bridge can build models with foreign key and many-to-many fields"""
+
+    probe = ModelMapping.trusted(
+        "probe",
+        [
+            FieldMapping.trusted(name=field_type.value, type=field_type, tablename="probe")
+            for field_type in (FieldType.FOREIGN_KEY, FieldType.MANY2MANY)
+        ],
+    )
+    bridge = bridge_cls()
+    try:
+        for field in probe.fields:
+            bridge.get_field_bridge(field.type).mapping_to_field(field)
+    except Exception:
+        return False
+    return True
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(
+    case: str,
+    models: int,
+    total: float,
+    samples: typing.Optional[list[float]],
+    peak: int,
+    **labels: typing.Any,
+) -> Result:
+    """Result of a case, percentiles are None for cases not timed per model"""
+
+    return {
+        "case": case,
+        **labels,
+        "models": models,
+        "total_s": total,
+        "throughput": models / total if total else float("inf"),
+        "p50_us": percentile(samples, 0.5) * 1e6 if samples else None,
+        "p99_us": percentile(samples, 0.99) * 1e6 if samples else None,
+        "peak_kib": peak / 1024,
+    }
+
+
+def measure(
+    setup: typing.Callable[[], typing.Any],
+    run: typing.Callable[[typing.Any], typing.Any],
+) -> tuple[float, int, typing.Any]:
+    """Wall time and result of a run, peak memory of a second traced run.
+
+    Setup is not measured
+    """
+
+    data = setup()
+    gc.collect()
+    start = time.perf_counter()
+    result = run(data)
+    total = time.perf_counter() - start
+
+    data = setup()
+    gc.collect()
+    tracemalloc.start()
+    run(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, peak, result
+
+
+def timed_each(
+    call: typing.Callable[[typing.Any], typing.Any],
+    items: list[typing.Any],
+) -> list[float]:
+    samples: list[float] = []
+    for item in items:
+        start = time.perf_counter()
+        call(item)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def mappings_for(spec: SchemaSpec, relations: bool) -> list[ModelMapping]:
+    # Tables get a fresh prefix so repeated runs don't collide in shared ORM registries
+    return generate(spec, prefix=f"bench{next(_prefixes)}", relations=relations)
+
+
+def models_for(name: str, spec: SchemaSpec, relations: bool) -> list[typing.Any]:
+    bridge = BRIDGES[name]()
+    return [bridge.get_model(mapping) for mapping in mappings_for(spec, relations)]
+
+
+def bench_bridge(name: str, spec: SchemaSpec, relations: bool) -> list[Result]:
+    bridge_cls = BRIDGES[name]
+    labels = dict(source=name, relations=relations)
+
+    total, peak, samples = measure(
+        lambda: mappings_for(spec, relations),
+        lambda mappings: timed_each(bridge_cls().get_model, mappings),
+    )
+    get_model = summarize("get_model", spec.models, total, samples, peak, **labels)
+
+    models = models_for(name, spec, relations)
+    total, peak, samples = measure(
+        lambda: models,
+        lambda models: timed_each(bridge_cls().get_mapping, models),
+    )
+    get_mapping = summarize("get_mapping", spec.models, total, samples, peak, **labels)
+    return [get_model, get_mapping]
+
+
+def bench_pair(source: str, target: str, spec: SchemaSpec, relations: bool) -> Result:
+    def translate(models: list[typing.Any]) -> None:
+        translator = Translator(BRIDGES[source](), BRIDGES[target]())
+        translator.translate_many(*models)
+
+    total, peak, _ = measure(lambda: models_for(source, spec, relations), translate)
+    return summarize(
+        "translate_many",
+        spec.models,
+        total,
+        None,
+        peak,
+        source=source,
+        target=target,
+        relations=relations,
+    )
+
+
+def run(
+    sizes: typing.Iterable[int],
+    bridges: typing.Iterable[str] = tuple(BRIDGES),
+    **spec: typing.Any,
+) -> dict[str, typing.Any]:
+    """Runs the suite, relation fields are only generated for capable bridges"""
+
+    names = list(bridges)
+    relations = {name: supports_relations(BRIDGES[name]) for name in names}
+    results: list[Result] = []
+
+    for size in sizes:
+        schema = SchemaSpec(models=size, **spec)
+        for name in names:
+            results.extend(bench_bridge(name, schema, relations[name]))
+        for source, target in itertools.permutations(names, 2):
+            results.append(
+                bench_pair(
+                    source, target, schema, relations[source] and relations[target]
+                )
+            )
+
+    return {
+        "python": platform.python_version(),
+        "spec": {
+            key: {k.value: v for k, v in value.items()} if key == "field_mix" else value
+            for key, value in SchemaSpec(0, **spec)._asdict().items()
+            if key != "models"
+        },
+        "results": results,
+    }
+
+
+def case_key(result: Result) -> tuple:
+    return (
+        result["case"],
+        result.get("source"),
+        result.get("target"),
+        result["models"],
+    )
+
+
+def compare(
+    baseline: dict[str, typing.Any],
+    current: dict[str, typing.Any],
+    threshold: float = 0.1,
+) -> list[str]:
+    """Cases whose throughput dropped by more than threshold against baseline"""
+
+    previous = {case_key(result): result for result in baseline["results"]}
+    regressions: list[str] = []
+    for result in current["results"]:
+        old = previous.get(case_key(result))
+        if old is None or not old["throughput"]:
+            continue
+        change = result["throughput"] / old["throughput"] - 1
+        if change < -threshold:
+            regressions.append(
+                "{} {}: {:.0f} -> {:.0f} models/s ({:+.1%})".format(
+                    result["case"],
+                    "->".join(filter(None, case_key(result)[1:3])),
+                    old["throughput"],
+                    result["throughput"],
+                    change,
+                )
+            )
+    return regressions
@@ -0,0 +1,92 @@
+"""Vectorized batch validation against a per-row loop over field mappings.
+
+    python -m benchmarks.validate [rows]
+"""
+import sys
+import time
+import typing
+
+from orm_bridge.convert import columns
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.validate import BatchValidator
+
+MAPPING = ModelMapping.trusted(
+    "users",
+    [
+        FieldMapping.trusted(name="id", type=FieldType.INTEGER, primary_key=True),
+        FieldMapping.trusted(name="username", type=FieldType.STRING, max_length=31),
+        FieldMapping.trusted(
+            name="role", type=FieldType.STRING, choices={"customer", "seller"}, nullable=True
+        ),
+        FieldMapping.trusted(name="score", type=FieldType.FLOAT, ge=0, le=100),
+        FieldMapping.trusted(name="active", type=FieldType.BOOLEAN, nullable=True),
+    ],
+)
+
+
+def naive_validate(mapping: ModelMapping, rows: list[tuple]) -> dict[str, dict[str, int]]:
+    """Same checks row by row, failures counted by field and check"""
+
+    summary: dict[str, dict[str, int]] = {}
+    fields = list(enumerate(columns(mapping)))
+
+    def fail(field: FieldMapping, check: str) -> None:
+        checks = summary.setdefault(field.name, {})
+        checks[check] = checks.get(check, 0) + 1
+
+    for row in rows:
+        for i, field in fields:
+            value: typing.Any = row[i]
+            if value is None:
+                if not field.nullable and not (field.primary_key and field.autoincrement):
+                    fail(field, "null")
+                continue
+            if field.type in (FieldType.INTEGER, FieldType.FLOAT):
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    fail(field, "type")
+                    continue
+                if field.ge is not None and value < field.ge:
+                    fail(field, "ge")
+                if field.le is not None and value > field.le:
+                    fail(field, "le")
+            if field.type == FieldType.STRING and len(str(value)) > field.max_length:
+                fail(field, "max_length")
+            if field.choices and value not in field.choices:
+                fail(field, "choices")
+    return summary
+
+
+def main(count: int = 1_000_000) -> None:
+    roles = ("customer", "seller", None, "admin")
+    rows = [
+        (i, f"user {i}" * (1 + (i % 97 == 0) * 5), roles[i % 4], i % 120 - 1, i % 2 == 0)
+        for i in range(count)
+    ]
+    validator = BatchValidator(MAPPING)
+
+    start = time.perf_counter()
+    expected = naive_validate(MAPPING, rows)
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = validator.validate_records(rows)
+    summary = report.summary()
+    vectorized = time.perf_counter() - start
+    assert summary == expected, (summary, expected)
+
+    arrays = {
+        field.name: column
+        for field, column in zip(columns(MAPPING), map(list, zip(*rows)))
+    }
+    start = time.perf_counter()
+    assert validator.validate(arrays).summary() == expected
+    prepared = time.perf_counter() - start
+
+    print(f"{count} rows, {len(report.invalid_rows())} invalid")
+    timings = (("naive", naive), ("records", vectorized), ("columns", prepared))
+    for name, elapsed in timings:
+        print(f"{name:>10}: {elapsed:6.2f} s {count / elapsed:12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -2,4 +2,7 @@ from orm_bridge.bridge import Bridge, FieldBridge  # noqa
 from orm_bridge.errors import BridgeError, MappingError  # noqa
 from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping  # noqa
 from orm_bridge.translator import Translator  # noqa
+from orm_bridge.cache import TranslationCache  # noqa
 from orm_bridge.environment import Environment  # noqa
+from orm_bridge.lazy import LazyModel  # noqa
+from orm_bridge.instrument import Instrumentation, Collector, JSONSink  # noqa
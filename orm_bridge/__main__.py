@@ -0,0 +1,74 @@
+"""Command line of orm-bridge.
+
+    python -m orm_bridge generate --source ormar --target tortoise --output models app.models
+"""
+import argparse
+import sys
+import typing
+
+from orm_bridge.bridge import available_bridges, get_bridge
+from orm_bridge.codegen import RENDERERS, generate_package
+from orm_bridge.errors import BridgeError
+from orm_bridge.extract import extract_mappings
+from orm_bridge.mapping import ModelMapping
+from orm_bridge.persist import MappingCache
+
+
+def module_name(path: str) -> str:
+    """Name of generated module of models of `module` or `module:Model` path"""
+    return path.partition(":")[0].replace(".", "_")
+
+
+def generate(args: argparse.Namespace) -> int:
+    cache = MappingCache(args.cache) if args.cache else None
+    extraction = extract_mappings(
+        get_bridge(args.source), args.paths, workers=args.workers, cache=cache
+    )
+    extraction.check()
+
+    catalogs: dict[str, list[ModelMapping]] = {}
+    for tablename, mapping in extraction.mappings.items():
+        catalogs.setdefault(module_name(extraction.models[tablename]), []).append(mapping)
+    options = {"database_url": args.database_url} if args.database_url else {}
+    written = generate_package(
+        catalogs,
+        args.target,
+        args.output,
+        workers=args.workers,
+        compile=not args.no_compile,
+        **options,
+    )
+    for path in written:
+        print(path)
+    return 0
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m orm_bridge")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_generate = commands.add_parser(
+        "generate", help="write a package of target models translated from source modules"
+    )
+    parser_generate.add_argument("--source", required=True, choices=available_bridges())
+    parser_generate.add_argument("--target", required=True, choices=list(RENDERERS))
+    parser_generate.add_argument("--output", required=True, help="package directory")
+    parser_generate.add_argument("--workers", type=int, help="processes, CPU count by default")
+    parser_generate.add_argument("--cache", help="directory of extracted mappings")
+    parser_generate.add_argument("--database-url", help="bind ormar models to a database")
+    parser_generate.add_argument(
+        "--no-compile", action="store_true", help="do not write bytecode"
+    )
+    parser_generate.add_argument("paths", nargs="+", help="`module` or `module:Model` paths")
+    parser_generate.set_defaults(run=generate)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.run(args)
+    except BridgeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,81 @@
+import importlib
+import typing
+
 from orm_bridge.bridge.abc import Bridge, FieldBridge  # noqa
+from orm_bridge.errors import BridgeError
+
+ENTRY_POINT_GROUP = "orm_bridge.bridges"
+
+# Backends are imported on first lookup, importing one ORM does not import the others
+BACKENDS: dict[str, str] = {
+    "ormar": "orm_bridge.bridge.ormar:OrmarBridge",
+    "tortoise": "orm_bridge.bridge.tortoise:TortoiseBridge",
+    "sqlalchemy": "orm_bridge.bridge.sqlalchemy:SQLAlchemyBridge",
+}
+_bridges: dict[str, typing.Type[Bridge]] = {}
+
+
+def register_bridge(name: str, bridge: typing.Union[str, typing.Type[Bridge]]) -> None:
+    """Registers bridge class or its `module:Class` path under name"""
+
+    _bridges.pop(name, None)
+    if isinstance(bridge, str):
+        BACKENDS[name] = bridge
+    else:
+        BACKENDS.pop(name, None)
+        _bridges[name] = bridge
+
+
+def load_bridge(path: str) -> typing.Type[Bridge]:
+    module_name, _, class_name = path.partition(":")
+    bridge = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(bridge, type) and issubclass(bridge, Bridge)):
+        raise BridgeError(f"`{path}` is not a bridge")
+    return bridge
+
+
+def entry_points() -> dict[str, str]:
+    """Bridge paths declared by installed packages"""
+
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    group = (
+        found.select(group=ENTRY_POINT_GROUP)
+        if hasattr(found, "select")
+        else found.get(ENTRY_POINT_GROUP, ())  # type: ignore
+    )
+    return {point.name: point.value for point in group}
+
+
+def get_bridge(name: str) -> typing.Type[Bridge]:
+    """Bridge class by backend name, imported on first use.
+
+    Names are looked up in registered backends, then in `orm_bridge.bridges` entry points
+    """
+
+    bridge = _bridges.get(name)
+    if bridge is not None:
+        return bridge
+    path = BACKENDS.get(name) or entry_points().get(name)
+    if path is None:
+        raise BridgeError(f"There is no bridge backend `{name}`")
+    bridge = _bridges[name] = load_bridge(path)
+    return bridge
+
+
+def available_bridges() -> list[str]:
+    return sorted({*BACKENDS, *_bridges, *entry_points()})
+
+
+_CLASSES = {
+    "OrmarBridge": "ormar",
+    "TortoiseBridge": "tortoise",
+    "SQLAlchemyBridge": "sqlalchemy",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _CLASSES:
+        return get_bridge(_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
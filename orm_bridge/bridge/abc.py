@@ -1,9 +1,22 @@
 import abc
 import enum
+import threading
+import time
+import types
 import typing
 
+from orm_bridge.cache import GENERATED_TYPES, TypeCache
+from orm_bridge.errors import FieldBridgeError, NoFieldBridge
 from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
 from orm_bridge.environment import Environment
+from orm_bridge.instrument import (
+    CLASS_CREATION,
+    FIELD_BRIDGING,
+    INTROSPECTION,
+    Instrumentation,
+    Measurement,
+    timed,
+)
 
 Model = typing.TypeVar("Model")
 ORMField = typing.TypeVar("ORMField")
@@ -33,16 +46,172 @@ class Bridge(abc.ABC, typing.Generic[Model]):
     """Base class for bridges"""
 
     fields: dict[FieldType, typing.Type[FieldBridge]]
+    field_types: dict[type, FieldType] = {}
+    _field_type_plan: dict[type, typing.Optional[FieldType]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_type_plan = {}
 
     def __init__(
         self,
         environment: typing.Optional[Environment[Model]] = None,
         field_error: ErrorMode = ErrorMode.PANIC,
+        instrumentation: typing.Optional[Instrumentation] = None,
+        types: typing.Optional[TypeCache] = None,
         **kwargs,
     ) -> None:
         self.field_error = field_error
         self.environment: Environment = environment or Environment()
+        # generated enums, validators and column types, shared by bridges by default
+        self.types = types if types is not None else GENERATED_TYPES
         self.kwargs = kwargs
+        self.instrumentation: typing.Optional[Instrumentation] = None
+        self._field_bridges: dict[FieldType, FieldBridge] = {}
+        # held while creating classes, ORM registries aren't thread-safe; fields are
+        # bridged outside of it, so models can be built on several threads
+        self.creation_lock = threading.RLock()
+        if instrumentation is not None:
+            self.instrument(instrumentation)
+
+    def instrument(self, instrumentation: Instrumentation) -> None:
+        """Measures introspection, field bridging and class creation of this bridge.
+
+        Methods are wrapped on the instance, uninstrumented bridges run unchanged
+        """
+
+        if self.instrumentation is not None:
+            return
+        self.instrumentation = instrumentation
+        for field_bridge in self._field_bridges.values():
+            self._instrument_field_bridge(field_bridge)
+
+        get_model = self.get_model
+
+        def build_model(mapping: ModelMapping) -> typing.Type[Model]:
+            field_time = instrumentation.field_time()
+            start = time.perf_counter()
+            model = get_model(mapping)
+            duration = time.perf_counter() - start
+            instrumentation.emit(
+                Measurement(
+                    CLASS_CREATION,
+                    duration - (instrumentation.field_time() - field_time),
+                    model=mapping.name,
+                    fields=len(mapping.fields),
+                )
+            )
+            return model
+
+        self.get_model = build_model  # type: ignore
+        self.get_mapping = timed(  # type: ignore
+            instrumentation,
+            self.get_mapping,
+            lambda duration, mapping, _: Measurement(
+                INTROSPECTION, duration, model=mapping.name, fields=len(mapping.fields)
+            ),
+        )
+
+    def _instrument_field_bridge(self, field_bridge: FieldBridge) -> None:
+        instrumentation = self.instrumentation
+        assert instrumentation is not None
+        bridge = type(field_bridge).__name__
+        mapping_to_field = field_bridge.mapping_to_field
+
+        def to_field(mapping: FieldMapping) -> typing.Any:
+            start = time.perf_counter()
+            field = mapping_to_field(mapping)
+            duration = time.perf_counter() - start
+            instrumentation.add_field_time(duration)
+            instrumentation.emit(
+                Measurement(FIELD_BRIDGING, duration, field_type=mapping.type, bridge=bridge)
+            )
+            return field
+
+        field_bridge.mapping_to_field = to_field  # type: ignore
+        field_bridge.field_to_mapping = timed(  # type: ignore
+            instrumentation,
+            field_bridge.field_to_mapping,
+            lambda duration, mapping, _: Measurement(
+                FIELD_BRIDGING, duration, field_type=mapping.type, bridge=bridge
+            ),
+        )
+
+    def get_field_bridge(self, field_type: FieldType, name: str = "") -> FieldBridge:
+        """Returns field bridge of this bridge, created once per field type"""
+
+        try:
+            return self._field_bridges[field_type]
+        except KeyError:
+            if field_type not in self.fields:
+                raise NoFieldBridge(name, field_type)
+            field_bridge = self._field_bridges[field_type] = self.fields[field_type](self)
+            if self.instrumentation is not None:
+                self._instrument_field_bridge(field_bridge)
+            return field_bridge
+
+    def bridge_fields(self, mapping: ModelMapping) -> dict[str, typing.Any]:
+        """Converts field mappings of model mapping to ORM fields"""
+
+        field_bridges = self._field_bridges
+        fields: dict[str, typing.Any] = {}
+        for field in mapping.fields:
+            field_bridge = field_bridges.get(field.type) or self.get_field_bridge(
+                field.type, field.name
+            )
+            fields[field.name] = field_bridge.mapping_to_field(field)
+        return fields
+
+    def check_relations(self, mapping: ModelMapping) -> None:
+        """Raises on reverse relations another table already defines on the same table"""
+
+        for field in mapping.fields:
+            if field.tablename is None or not field.related_name or field.skip_reverse:
+                continue
+            ref = self.environment.get_related(field.tablename, field.related_name)
+            if ref is not None and ref.tablename != mapping.name:
+                raise FieldBridgeError(
+                    field.name,
+                    f"reverse relation `{field.related_name}` of `{field.tablename}` "
+                    f"is already defined by `{ref.tablename}.{ref.field.name}`",
+                )
+
+    def get_field_type(self, field: typing.Any) -> typing.Optional[FieldType]:
+        """Resolves field type of ORM field, None if it has no translation"""
+        return self.resolve_field_type(type(field))
+
+    @classmethod
+    def resolve_field_type(cls, field_cls: type) -> typing.Optional[FieldType]:
+        """Resolves field type of ORM field class along its MRO, memoized per class"""
+
+        try:
+            return cls._field_type_plan[field_cls]
+        except KeyError:
+            field_type = cls._field_type_plan[field_cls] = cls.lookup_field_type(
+                field_cls
+            )
+            return field_type
+
+    @classmethod
+    def lookup_field_type(cls, field_cls: type) -> typing.Optional[FieldType]:
+        for base in field_cls.__mro__:
+            if base in cls.field_types:
+                return cls.field_types[base]
+        return None
+
+    @classmethod
+    def is_model(cls, obj: typing.Any) -> bool:
+        """Whether object is a model class this bridge can get mapping of"""
+        return False
+
+    @classmethod
+    def discover_models(cls, module: types.ModuleType) -> list[typing.Type[Model]]:
+        """Models defined in module, in definition order"""
+        return [
+            obj
+            for obj in vars(module).values()
+            if cls.is_model(obj) and obj.__module__ == module.__name__
+        ]
 
     @abc.abstractmethod
     def get_model(self, mapping: ModelMapping) -> typing.Type[Model]:
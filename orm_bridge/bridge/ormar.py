@@ -2,7 +2,7 @@ import typing
 
 import ormar
 
-from orm_bridge.errors import BridgeError, FieldBridgeError, NoFieldBridge
+from orm_bridge.errors import BridgeError, FieldBridgeError
 from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
 
 from orm_bridge.bridge.abc import Bridge, FieldBridge, ErrorMode
@@ -22,18 +22,30 @@ ORMAR_TYPE_MAPPING = {
 class OrmarBridge(Bridge[ormar.Model]):
 
     fields = {}
+    field_types = {
+        ormar.fields.ManyToManyField: FieldType.MANY2MANY,
+        ormar.fields.ForeignKeyField: FieldType.FOREIGN_KEY,
+    }
 
     def get_model(self, mapping: ModelMapping) -> typing.Type[ormar.Model]:
-        fields: dict[str, ormar.BaseField] = {}
-
-        for field in mapping.fields:
-            if field.type not in self.fields:
-                raise NoFieldBridge(field.name, field.type)
-            field_mapping = self.fields[field.type](self)
-            fields[field.name] = field_mapping.mapping_to_field(field)
+        self.check_relations(mapping)
+        fields: dict[str, ormar.BaseField] = self.bridge_fields(mapping)
 
         params: dict[str, typing.Any] = {**fields}
-        return type(mapping.name, (ormar.Model,), params)  # type: ignore
+
+        meta: dict[str, typing.Any] = {"tablename": mapping.name}
+        if "metadata" in self.kwargs and "database" in self.kwargs:
+            meta["metadata"] = self.kwargs["metadata"]
+            meta["database"] = self.kwargs["database"]
+        else:
+            meta["abstract"] = True
+        params["Meta"] = type("Meta", (ormar.ModelMeta,), meta)
+        with self.creation_lock:
+            return type(mapping.name, (ormar.Model,), params)  # type: ignore
+
+    @classmethod
+    def is_model(cls, obj: typing.Any) -> bool:
+        return isinstance(obj, type) and issubclass(obj, ormar.Model) and obj is not ormar.Model
 
     def get_mapping(self, model: typing.Type[ormar.Model]) -> ModelMapping:
         meta: typing.Optional[ormar.ModelMeta] = getattr(model, "Meta", None)
@@ -45,7 +57,7 @@ class OrmarBridge(Bridge[ormar.Model]):
             field_info = model_field.__dict__
             if field_info["skip_field"] or field_info["virtual"]:
                 continue
-            field_type = ORMAR_TYPE_MAPPING.get(model_field.__class__.__name__)
+            field_type = self.get_field_type(model_field)
             if not field_type:
                 if self.field_error == ErrorMode.IGNORE:
                     continue
@@ -53,10 +65,17 @@ class OrmarBridge(Bridge[ormar.Model]):
                     name,
                     f"no translation for ormar type {model_field.__class__.__name__}",
                 )
-            field_mapping = self.fields[field_type](self)
-            fields.append(field_mapping.field_to_mapping(name, model_field))
+            field_bridge = self.get_field_bridge(field_type, name)
+            fields.append(field_bridge.field_to_mapping(name, model_field))
 
-        return ModelMapping(name=meta.tablename, fields=fields)
+        return ModelMapping.trusted(name=meta.tablename, fields=fields)
+
+    def get_field_type(self, field: ormar.BaseField) -> typing.Optional[FieldType]:
+        # ormar creates a class per field, so classes are not memoized
+        field_type = ORMAR_TYPE_MAPPING.get(field.__class__.__name__)
+        if field_type is None:
+            return self.lookup_field_type(field.__class__)
+        return field_type
 
     def get_tablename(self, model: typing.Type[ormar.Model]) -> str:
         meta: typing.Optional[ormar.ModelMeta] = getattr(model, "Meta", None)
@@ -75,12 +94,12 @@ class NumberOrmar(FieldBridge[NumberField]):
         field_t = (
             ormar.fields.Integer
             if mapping.type == FieldType.INTEGER
-            else FieldType.FLOAT
+            else ormar.fields.Float
         )
         return field_t(
             nullable=mapping.nullable,
             default=mapping.default,
-            pk=mapping.primary_key,
+            primary_key=mapping.primary_key,
             minimum=mapping.ge,  # type: ignore
             maximum=mapping.le,  # type: ignore
             autoincrement=mapping.autoincrement,
@@ -89,14 +108,14 @@ class NumberOrmar(FieldBridge[NumberField]):
 
     def field_to_mapping(self, name: str, field: NumberField) -> FieldMapping:
         info = field.__dict__
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.INTEGER if info["__type__"] == int else FieldType.FLOAT,
             nullable=info["nullable"] and not info.get("primary_key"),
             default=info.get("ormar_default", None),
             primary_key=info.get("primary_key", False),
-            ge=info.get("ge"),
-            le=info.get("le"),
+            ge=info.get("minimum"),
+            le=info.get("maximum"),
             unique=info["unique"],
             index=info.get("index", False),
         )
@@ -111,12 +130,12 @@ class StringOrmar(FieldBridge[ormar.fields.String]):
             primary_key=mapping.primary_key,
             max_length=mapping.max_length,
             index=mapping.index,
-            choices=mapping.choices,
+            choices=list(mapping.choices or ()),
         )
 
     def field_to_mapping(self, name: str, field: ormar.fields.String) -> FieldMapping:
         info = field.__dict__
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.STRING,
             nullable=info["nullable"],
@@ -125,7 +144,8 @@ class StringOrmar(FieldBridge[ormar.fields.String]):
             primary_key=info.get("primary_key", False),
             unique=info["unique"],
             index=info.get("index", False),
-            choices=info.get("choices") or None,
+            # ormar adds None to choices of nullable fields
+            choices=set(info["choices"]) - {None} if info.get("choices") else None,
         )
 
 
@@ -146,7 +166,7 @@ class BooleanOrmar(FieldBridge[ormar.fields.model_fields.BaseField]):
         field: ormar.fields.model_fields.BaseField,
     ) -> FieldMapping:
         info = field.__dict__
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.BOOLEAN,
             nullable=info["nullable"],
@@ -170,7 +190,7 @@ class FKOrmar(FieldBridge[ormar.fields.ForeignKeyField]):
         fk_constraint = info["constraints"][0]
         tablename = fk_constraint.reference.split(".", 1)[0]
 
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.FOREIGN_KEY,
             index=info.get("index", False),
@@ -190,7 +210,7 @@ class M2MOrmar(FieldBridge[ormar.fields.ManyToManyField]):
     ) -> FieldMapping:
         info = field.__dict__
         to_model = info["to"]
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.MANY2MANY,
             tablename=self.model_bridge.get_tablename(to_model),
@@ -1,38 +1,109 @@
 import typing
 
 import sqlalchemy
+import sqlalchemy.orm
 from sqlalchemy.orm import declarative_base
 
-from orm_bridge.errors import FieldBridgeError, NoFieldBridge
+from orm_bridge.errors import FieldBridgeError
 from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
 
 from orm_bridge.bridge.abc import Bridge, FieldBridge, ErrorMode
 
-SQLALCHEMY_TYPE_MAPPING = {
-    "integer": FieldType.INTEGER,
-    "small_integer": FieldType.INTEGER,
-    "big_integer": FieldType.INTEGER,
-    "float": FieldType.FLOAT,
-    "string": FieldType.STRING,
-    "boolean": FieldType.BOOLEAN,
+SQLALCHEMY_TYPE_MAPPING: dict[type, FieldType] = {
+    sqlalchemy.Integer: FieldType.INTEGER,
+    sqlalchemy.Float: FieldType.FLOAT,
+    sqlalchemy.String: FieldType.STRING,
+    sqlalchemy.Boolean: FieldType.BOOLEAN,
 }
-Base = declarative_base()
+_base: typing.Optional[typing.Any] = None
+
+
+def get_base() -> typing.Any:
+    """Shared declarative base kept for models declared against the module"""
+
+    global _base
+    if _base is None:
+        _base = declarative_base()
+    return _base
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "Base":
+        return get_base()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SQLAlchemyBridge(Bridge[sqlalchemy.Table]):
-    fields = {}
+    """Builds each model in a registry of its own, all sharing `metadata`.
 
-    def get_model(self, mapping: ModelMapping) -> typing.Type[sqlalchemy.Table]:
-        fields: dict = {}
+    Models are reused while their mapping is unchanged. A changed mapping disposes
+    of the registry of the old model before building the new one, `dispose`
+    does so for all models
+    """
 
-        for field in mapping.fields:
-            if field.type not in self.fields:
-                raise NoFieldBridge(field.name, field.type)
-            field_mapping = self.fields[field.type](self)
-            fields[field.name] = field_mapping.mapping_to_field(field)
+    fields = {}
+    field_types = SQLALCHEMY_TYPE_MAPPING
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        metadata: typing.Optional[sqlalchemy.MetaData] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.metadata = metadata if metadata is not None else sqlalchemy.MetaData()
+        # shared by registries of all models, so names of models resolve across them;
+        # sqlalchemy never frees its bookkeeping of a class registry, one is made per bridge
+        self.class_registry: dict[str, typing.Any] = {}
+        self.models: dict[str, tuple[str, typing.Type[sqlalchemy.Table]]] = {}
+        self.registries: dict[str, sqlalchemy.orm.registry] = {}
 
-        params: dict[str, typing.Any] = {**fields, "__tablename__": mapping.name}
-        return type(mapping.name, (Base,), params)  # type: ignore
+    def get_model(self, mapping: ModelMapping) -> typing.Type[sqlalchemy.Table]:
+        fingerprint = mapping.fingerprint()
+        built = self.models.get(mapping.name)
+        if built is not None and built[0] == fingerprint:
+            return built[1]
+
+        fields: dict = self.bridge_fields(mapping)
+
+        with self.creation_lock:
+            # another thread may have built the same table meanwhile
+            built = self.models.get(mapping.name)
+            if built is not None:
+                if built[0] == fingerprint:
+                    return built[1]
+                self.discard(mapping.name)
+            registry = sqlalchemy.orm.registry(
+                metadata=self.metadata, class_registry=self.class_registry
+            )
+            params: dict[str, typing.Any] = {**fields, "__tablename__": mapping.name}
+            model = type(mapping.name, (registry.generate_base(),), params)
+            self.models[mapping.name] = (fingerprint, model)
+            self.registries[mapping.name] = registry
+        return model  # type: ignore
+
+    def discard(self, tablename: str) -> None:
+        """Unmaps model of table and removes the table from metadata"""
+
+        with self.creation_lock:
+            built = self.models.pop(tablename, None)
+            if built is None:
+                return
+            table = built[1].__table__  # type: ignore
+            self.registries.pop(tablename).dispose()
+            self.metadata.remove(table)
+
+    def dispose(self) -> None:
+        """Unmaps all models built by this bridge"""
+
+        for tablename in list(self.models):
+            self.discard(tablename)
+
+    @classmethod
+    def is_model(cls, obj: typing.Any) -> bool:
+        return isinstance(obj, type) and isinstance(
+            getattr(obj, "__table__", None), sqlalchemy.Table
+        )
 
     def get_mapping(self, model: typing.Type[sqlalchemy.Table]) -> ModelMapping:
         fields: list[FieldMapping] = []
@@ -43,19 +114,22 @@ class SQLAlchemyBridge(Bridge[sqlalchemy.Table]):
             model_columns = model.columns
 
         for column in model_columns:
-            field_type = column.type.__class__.__visit_name__
-            mapped_field_type = SQLALCHEMY_TYPE_MAPPING.get(field_type)
-            if not mapped_field_type:
+            field_type = self.get_field_type(column)
+            if not field_type:
                 if self.field_error == ErrorMode.IGNORE:
                     continue
                 raise FieldBridgeError(
                     column.name,
-                    f"no translation for sqlalchemy field type {field_type}",
+                    "no translation for sqlalchemy field type "
+                    + column.type.__class__.__visit_name__,
                 )
-            field_mapping = self.fields[mapped_field_type](self)
-            fields.append(field_mapping.field_to_mapping(column.name, column))
+            field_bridge = self.get_field_bridge(field_type, column.name)
+            fields.append(field_bridge.field_to_mapping(column.name, column))
+
+        return ModelMapping.trusted(name=model.__tablename__, fields=fields)
 
-        return ModelMapping(name=model.__tablename__, fields=fields)
+    def get_field_type(self, field: sqlalchemy.Column) -> typing.Optional[FieldType]:
+        return self.resolve_field_type(field.type.__class__)
 
     def get_tablename(self, model: typing.Type[sqlalchemy.Table]) -> str:
         return model.__tablename__
@@ -71,10 +145,10 @@ class NumericSQLAlchemy(FieldBridge[sqlalchemy.INTEGER]):
         field_type = (
             sqlalchemy.Integer
             if mapping.type == FieldType.INTEGER
-            else FieldType.FLOAT
+            else sqlalchemy.Float
         )
         return sqlalchemy.Column(
-            field_type,
+            self.model_bridge.types.get(f"sqlalchemy.{field_type.__name__}", (), field_type),
             nullable=mapping.nullable,
             default=mapping.default,
             primary_key=mapping.primary_key,
@@ -87,9 +161,9 @@ class NumericSQLAlchemy(FieldBridge[sqlalchemy.INTEGER]):
         index = info.get("index", False)
         default = info.get("default")
         default = default.arg if default else None
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
-            type=FieldType.INTEGER,
+            type=self.model_bridge.get_field_type(field),
             nullable=info["nullable"],
             default=default,
             primary_key=info.get("primary_key", False),
@@ -102,7 +176,11 @@ class NumericSQLAlchemy(FieldBridge[sqlalchemy.INTEGER]):
 class StringSQLAlchemy(FieldBridge[sqlalchemy.String]):
     def mapping_to_field(self, mapping: FieldMapping) -> sqlalchemy.Column[sqlalchemy.String]:
         return sqlalchemy.Column(
-            sqlalchemy.String(mapping.max_length),
+            self.model_bridge.types.get(
+                "sqlalchemy.String",
+                mapping.max_length,
+                lambda: sqlalchemy.String(mapping.max_length),
+            ),
             nullable=mapping.nullable,
             default=mapping.default,
             primary_key=mapping.primary_key,
@@ -115,15 +193,18 @@ class StringSQLAlchemy(FieldBridge[sqlalchemy.String]):
         index = info.get("index", False)
         default = info.get("default")
         default = default.arg if default else None
-        return FieldMapping(
+        kwargs: dict[str, int] = {}
+        if info["type"].length is not None:
+            kwargs["max_length"] = info["type"].length
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.STRING,
             nullable=info["nullable"],
-            max_length=info["type"].length,
             default=default,
             primary_key=info.get("primary_key", False),
             unique=unique if unique else False,
             index=index if index else False,
+            **kwargs,
         )
 
 
@@ -144,7 +225,7 @@ class BooleanSQLAlchemy(FieldBridge[sqlalchemy.Boolean]):
         index = info.get("index", False)
         default = info.get("default")
         default = default.arg if default else None
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.BOOLEAN,
             nullable=info["nullable"],
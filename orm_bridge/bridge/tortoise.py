@@ -3,21 +3,21 @@ import enum
 
 import tortoise
 
-from orm_bridge.errors import FieldBridgeError, NoFieldBridge
-from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.errors import FieldBridgeError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping, Value
+from orm_bridge.naming import enum_name
 
 from orm_bridge.bridge.abc import Bridge, FieldBridge, ErrorMode
 
-TORTOISE_TYPE_MAPPING = {
-    "IntField": FieldType.INTEGER,
-    "BigIntField": FieldType.INTEGER,  # todo: add field types for these
-    "SmallIntField": FieldType.INTEGER,
-    "FloatField": FieldType.FLOAT,
-    "CharField": FieldType.STRING,
-    "CharEnumFieldInstance": FieldType.STRING,
-    "BooleanField": FieldType.BOOLEAN,
-    "ForeignKeyFieldInstance": FieldType.FOREIGN_KEY,
-    "ManyToManyFieldInstance": FieldType.MANY2MANY,
+TORTOISE_TYPE_MAPPING: dict[type, FieldType] = {
+    tortoise.fields.IntField: FieldType.INTEGER,
+    tortoise.fields.BigIntField: FieldType.INTEGER,  # todo: add field types for these
+    tortoise.fields.SmallIntField: FieldType.INTEGER,
+    tortoise.fields.FloatField: FieldType.FLOAT,
+    tortoise.fields.CharField: FieldType.STRING,
+    tortoise.fields.BooleanField: FieldType.BOOLEAN,
+    tortoise.fields.relational.ForeignKeyFieldInstance: FieldType.FOREIGN_KEY,
+    tortoise.fields.relational.ManyToManyFieldInstance: FieldType.MANY2MANY,
 }
 
 
@@ -26,48 +26,33 @@ def get_tablename(model: typing.Type[tortoise.Model]) -> str:
 
 
 def get_tablename_from_tortoise_name(tortoise_name: str, bridge: Bridge) -> str:
-    tablename: str = ""
-
-    if "tortoise_names" in bridge.environment.options:
-        tablename = bridge.environment.options["tortoise_names"].get(tortoise_name)
-    if not tablename:
-        # Guessing the tablename
-        tablename = tortoise_name.split(".")[-1].lower() + "s"
-    return tablename
+    return bridge.environment.naming.get_tablename(tortoise_name)
 
 
 def get_tortoise_name(tablename: str, bridge: Bridge) -> str:
-    if (
-        "tortoise_names" in bridge.environment.options
-        and tablename in bridge.environment.options["tortoise_names"].values()
-    ):
-        tortoise_names: dict[str, str] = bridge.environment.options["tortoise_names"]
-        return list(tortoise_names.keys())[
-            list(tortoise_names.values()).index(tablename)
-        ]
-
-    # Guessing the tortoise name
-    if tablename.endswith("ies"):
-        tablename = tablename.removesuffix("ies") + "y"
-    elif tablename.endswith("sses"):
-        tablename = tablename.removesuffix("es")
-    else:
-        tablename = tablename.removesuffix("s")
-    return tablename.capitalize()
+    return bridge.environment.naming.get_name(tablename)
+
+
+def choices_enum(choices: typing.Iterable[Value]) -> typing.Type[enum.Enum]:
+    """Enum of choices named after them, members are sorted so the name is stable"""
+
+    values = sorted(choices, key=repr)
+    return enum.Enum(enum_name(values), {str(value): value for value in values})  # type: ignore
+
+
+def get_tortoise_reference(tablename: str, bridge: Bridge) -> str:
+    tortoise_name = get_tortoise_name(tablename, bridge)
+    return tortoise_name if "." in tortoise_name else "models." + tortoise_name
 
 
 class TortoiseBridge(Bridge[tortoise.Model]):
 
     fields = {}
+    field_types = TORTOISE_TYPE_MAPPING
 
     def get_model(self, mapping: ModelMapping) -> typing.Type[tortoise.Model]:
-        fields: dict[str, tortoise.fields.Field] = {}
-
-        for field in mapping.fields:
-            if field.type not in self.fields:
-                raise NoFieldBridge(field.name, field.type)
-            field_mapping = self.fields[field.type](self)
-            fields[field.name] = field_mapping.mapping_to_field(field)
+        self.check_relations(mapping)
+        fields: dict[str, tortoise.fields.Field] = self.bridge_fields(mapping)
 
         params: dict[str, typing.Any] = {**fields}
 
@@ -75,13 +60,29 @@ class TortoiseBridge(Bridge[tortoise.Model]):
             table: str = mapping.name
 
         params["Meta"] = Meta
-        return type(get_tortoise_name(mapping.name, self), (tortoise.Model,), params)
+        # tortoise reads field comments from the class source, a module without
+        # a file makes it give up at once instead of parsing tortoise.models
+        params["__module__"] = "orm_bridge.bridge.generated"
+        name = get_tortoise_name(mapping.name, self).split(".")[-1]
+        with self.creation_lock:
+            model = type(name, (tortoise.Model,), params)
+        model.__module__ = tortoise.Model.__module__
+        return model
+
+    @classmethod
+    def is_model(cls, obj: typing.Any) -> bool:
+        return (
+            isinstance(obj, type)
+            and issubclass(obj, tortoise.Model)
+            and obj is not tortoise.Model
+            and not obj._meta.abstract
+        )
 
     def get_mapping(self, model: typing.Type[tortoise.Model]) -> ModelMapping:
         fields: list[FieldMapping] = []
 
         for name, field in model._meta.fields_map.items():
-            field_type = TORTOISE_TYPE_MAPPING.get(field.__class__.__name__)
+            field_type = self.get_field_type(field)
             if not field_type:
                 if self.field_error == ErrorMode.IGNORE:
                     continue
@@ -89,10 +90,10 @@ class TortoiseBridge(Bridge[tortoise.Model]):
                     name,
                     f"no translation for tortoise type {field.__class__.__name__}",
                 )
-            field_mapping = self.fields[field_type](self)
-            fields.append(field_mapping.field_to_mapping(name, field))
+            field_bridge = self.get_field_bridge(field_type, name)
+            fields.append(field_bridge.field_to_mapping(name, field))
 
-        return ModelMapping(name=get_tablename(model), fields=fields)
+        return ModelMapping.trusted(name=get_tablename(model), fields=fields)
 
     def get_tablename(self, model: typing.Type[tortoise.Model]) -> str:
         return get_tablename(model)
@@ -104,11 +105,24 @@ NumberField = typing.Union[tortoise.fields.IntField, tortoise.fields.FloatField]
 class NumberTortoise(FieldBridge[NumberField]):
     def mapping_to_field(self, mapping: FieldMapping) -> NumberField:
         validators: list[tortoise.validators.Validator] = []
+        types = self.model_bridge.types
 
         if mapping.ge is not None:
-            validators.append(tortoise.validators.MinValueValidator(mapping.ge))
+            validators.append(
+                types.get(
+                    "tortoise.MinValueValidator",
+                    (type(mapping.ge), mapping.ge),
+                    lambda: tortoise.validators.MinValueValidator(mapping.ge),
+                )
+            )
         if mapping.le is not None:
-            validators.append(tortoise.validators.MaxValueValidator(mapping.le))
+            validators.append(
+                types.get(
+                    "tortoise.MaxValueValidator",
+                    (type(mapping.le), mapping.le),
+                    lambda: tortoise.validators.MaxValueValidator(mapping.le),
+                )
+            )
 
         field_t = (
             tortoise.fields.IntField
@@ -140,7 +154,7 @@ class NumberTortoise(FieldBridge[NumberField]):
             elif isinstance(validator, tortoise.validators.MaxValueValidator):
                 kwargs["le"] = int(validator.max_value)
 
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=field_type,
             nullable=field_info["null"],
@@ -178,7 +192,12 @@ class StringTortoise(FieldBridge[tortoise.fields.CharField]):
             index=mapping.index,
         )
         if mapping.choices:
-            choices = enum.Enum("Choices", {c: c for c in mapping.choices})  # type: ignore
+            choices = self.model_bridge.types.get(
+                "tortoise.Choices",
+                # equal values of other types, like 1 and True, need enums of their own
+                frozenset((type(choice), choice) for choice in mapping.choices),
+                lambda: choices_enum(mapping.choices),  # type: ignore
+            )
             return tortoise.fields.CharEnumField(  # type: ignore
                 enum_type=choices, **fields  # type: ignore
             )
@@ -191,7 +210,7 @@ class StringTortoise(FieldBridge[tortoise.fields.CharField]):
         self, name: str, field: tortoise.fields.CharField
     ) -> FieldMapping:
         field_info: dict = field.__dict__
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.STRING,
             nullable=field_info["null"],
@@ -227,7 +246,7 @@ class BooleanTortoise(FieldBridge[tortoise.fields.BooleanField]):
         field: tortoise.fields.BooleanField,
     ) -> FieldMapping:
         field_info: dict = field.__dict__
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.BOOLEAN,
             nullable=field_info["null"],
@@ -243,9 +262,8 @@ class FKTortoise(FieldBridge[tortoise.fields.ForeignKeyRelation]):
     ) -> tortoise.fields.ForeignKeyRelation:
         assert mapping.tablename is not None
 
-        tortoise_name: str = get_tortoise_name(mapping.tablename, self.model_bridge)
         return tortoise.fields.ForeignKeyField(
-            "models." + tortoise_name,
+            get_tortoise_reference(mapping.tablename, self.model_bridge),
             source_field=mapping.name,
             related_name=mapping.related_name if not mapping.skip_reverse else False,
         )
@@ -257,7 +275,7 @@ class FKTortoise(FieldBridge[tortoise.fields.ForeignKeyRelation]):
     ) -> FieldMapping:
         info = field.__dict__
 
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.FOREIGN_KEY,
             tablename=get_tablename_from_tortoise_name(
@@ -274,10 +292,9 @@ class M2MTortoise(FieldBridge[tortoise.fields.ManyToManyRelation]):
         self, mapping: FieldMapping
     ) -> tortoise.fields.ManyToManyRelation:
         assert mapping.tablename
-        tortoise_name: str = get_tortoise_name(mapping.tablename, self.model_bridge)
         return tortoise.fields.ManyToManyField(
-            "models." + tortoise_name,
-            through=("models." + get_tortoise_name(mapping.through, self.model_bridge))
+            get_tortoise_reference(mapping.tablename, self.model_bridge),
+            through=get_tortoise_reference(mapping.through, self.model_bridge)
             if mapping.through
             else None,
         )
@@ -289,7 +306,7 @@ class M2MTortoise(FieldBridge[tortoise.fields.ManyToManyRelation]):
         tablename = get_tablename_from_tortoise_name(
             info["model_name"], self.model_bridge
         )
-        return FieldMapping(
+        return FieldMapping.trusted(
             name=name,
             type=FieldType.MANY2MANY,
             tablename=tablename,
@@ -0,0 +1,123 @@
+import collections
+import threading
+import typing
+
+Key = typing.Hashable
+Model = typing.TypeVar("Model")
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TranslationCache(typing.Generic[Model]):
+    """LRU cache of translated models keyed by structural mapping fingerprints"""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size should be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._models: collections.OrderedDict[Key, typing.Type[Model]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Key) -> typing.Optional[typing.Type[Model]]:
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                self.misses += 1
+                return None
+            self._models.move_to_end(key)
+            self.hits += 1
+            return model
+
+    def put(self, key: Key, model: typing.Type[Model]) -> None:
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._models))
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+class TypeCacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class TypeCache:
+    """Helper types and objects generated while building fields, shared by all models.
+
+    Entries are keyed by kind, like `tortoise.Choices`, and by the parameters
+    defining them, so equal fields of different models get the same enum,
+    validator or column type. Least recently used entries over `maxsize` are dropped,
+    models keep theirs. Hits and misses are counted per kind
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size should be positive")
+        self.maxsize = maxsize
+        self._types: collections.OrderedDict[tuple[str, Key], typing.Any] = (
+            collections.OrderedDict()
+        )
+        self.hits: collections.Counter[str] = collections.Counter()
+        self.misses: collections.Counter[str] = collections.Counter()
+        self._lock = threading.RLock()
+
+    def get(self, kind: str, key: Key, factory: typing.Callable[[], Model]) -> Model:
+        """Cached object of kind for key, made by factory on first use"""
+
+        with self._lock:
+            try:
+                generated = self._types[kind, key]
+            except KeyError:
+                self.misses[kind] += 1
+                generated = self._types[kind, key] = factory()
+                while len(self._types) > self.maxsize:
+                    self._types.popitem(last=False)
+            else:
+                self._types.move_to_end((kind, key))
+                self.hits[kind] += 1
+            return generated
+
+    def clear(self) -> None:
+        with self._lock:
+            self._types.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+    def info(self) -> dict[str, TypeCacheInfo]:
+        with self._lock:
+            sizes = collections.Counter(kind for kind, _ in self._types)
+            return {
+                kind: TypeCacheInfo(self.hits[kind], self.misses[kind], sizes[kind])
+                for kind in sorted(self.hits.keys() | self.misses.keys())
+            }
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+
+GENERATED_TYPES = TypeCache()
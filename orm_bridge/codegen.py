@@ -0,0 +1,671 @@
+import concurrent.futures
+import enum
+import graphlib
+import keyword
+import math
+import os
+import py_compile
+import tempfile
+import typing
+
+from orm_bridge.dialect import Dialect, check_name, has_column, through_mapping
+from orm_bridge.errors import BridgeError, MappingError
+from orm_bridge.graph import RelationGraph
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping, ModelRecord, Value
+from orm_bridge.naming import NamingStrategy, enum_name
+from orm_bridge.translator import TranslationResult
+
+Catalog = typing.Union[typing.Iterable[ModelMapping], TranslationResult]
+
+HEADER = "# generated by orm-bridge, do not edit"
+LINE_LENGTH = 100
+BASE_MODULE = "_base"
+# renders CHECK expressions in SQL common to the dialects
+CHECKS = Dialect()
+
+
+def catalog_mappings(catalog: Catalog) -> list[ModelMapping]:
+    if isinstance(catalog, TranslationResult):
+        return list(catalog.mappings().values())
+    return list(catalog)
+
+
+def literal(value: Value, field: FieldMapping) -> str:
+    """Source of value of field"""
+
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if value is None or type(value) in (bool, int, str):
+        return repr(value)
+    if type(value) is float and math.isfinite(value):
+        return repr(value)
+    raise MappingError(f"Value {value!r} of field `{field.name}` can't be written as code")
+
+
+def split_base(base: dict[str, str]) -> tuple[list[str], list[str]]:
+    """Imports and definitions of sources of base, imports go to the top of a module"""
+
+    imports: list[str] = []
+    definitions: list[str] = []
+    for source in base.values():
+        for line in source.split("\n"):
+            if line.startswith("import "):
+                if line not in imports:
+                    imports.append(line)
+            elif line:
+                definitions.append(line)
+    return imports, definitions
+
+
+def identifier(name: str) -> str:
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise MappingError(f"`{name}` can't be used as a name in generated code")
+    return name
+
+
+class Renderer:
+    """Renders mappings as source of a module declaring models of an ORM.
+
+    Fields are declared with the arguments the bridge of the ORM passes when it
+    builds models at runtime. `mappings` holds every table models may refer to,
+    `modules` the generated modules of tables declared elsewhere
+    """
+
+    orm: str = ""
+    # whether models refer to classes of other modules rather than to names
+    imports_models = False
+
+    def __init__(
+        self,
+        mappings: typing.Mapping[str, ModelMapping],
+        modules: typing.Optional[typing.Mapping[str, str]] = None,
+        naming: typing.Optional[NamingStrategy] = None,
+        package: bool = False,
+        **options: typing.Any,
+    ) -> None:
+        self.mappings = mappings
+        self.modules = modules or {}
+        self.naming = naming or NamingStrategy()
+        self.package = package
+        self.options = options
+        self.imports: list[str] = []
+        self.prelude: list[str] = []
+        self.epilogue: list[str] = []
+        # column the value of the field being rendered begins at
+        self.start = 4
+
+    def class_name(self, tablename: str) -> str:
+        return identifier(tablename)
+
+    def base(self) -> dict[str, str]:
+        """Shared names of generated modules and their source, see `BASE_MODULE`"""
+        return {}
+
+    def render(self, tablenames: typing.Iterable[str]) -> str:
+        """Source of module declaring models of tables, referenced tables first"""
+
+        self.imports, self.prelude, self.epilogue = [], [], []
+        graph = RelationGraph([self.mappings[tablename] for tablename in tablenames])
+        self.declared: set[str] = set()
+        self.local = set(graph.mappings)
+        classes: list[str] = []
+        for tablename in graph.order():
+            classes.extend(["", ""] + self.render_model(graph.mappings[tablename]))
+            self.declared.add(tablename)
+
+        base = self.base()
+        lines = [HEADER] + self.imports
+        if base and self.package:
+            lines.append(f"from .{BASE_MODULE} import {', '.join(base)}")
+        elif base:
+            imports, definitions = split_base(base)
+            lines.extend(line for line in imports if line not in lines)
+            self.prelude[:0] = ["", ""] + definitions
+        for tablename in sorted({table for table in self.foreign if table not in self.local}):
+            lines.append(
+                f"from .{self.modules[tablename]} import {self.class_name(tablename)}"
+            )
+        lines.extend(self.prelude + classes)
+        if self.epilogue:
+            lines.extend(["", ""] + self.epilogue)
+        return "\n".join(lines) + "\n"
+
+    @property
+    def foreign(self) -> set[str]:
+        """Tables of other modules the module imports"""
+
+        if not self.imports_models:
+            return set()
+        return {
+            field.tablename
+            for tablename in self.local
+            for field in self.mappings[tablename].fields
+            if field.tablename is not None
+        }
+
+    def render_model(self, mapping: ModelMapping) -> list[str]:
+        raise NotImplementedError()
+
+    def render_field(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        render = getattr(self, f"render_{field.type.name.lower()}", None)
+        if render is None:
+            raise MappingError(
+                f"No {self.orm} code for field `{field.name}` of type {field.type.value}"
+            )
+        prefix = f"{identifier(field.name)} = "
+        # fields are declared in class bodies
+        self.start = 4 + len(prefix)
+        return prefix + render(mapping, field)
+
+    def target(self, field: FieldMapping) -> ModelMapping:
+        """Mapping of table referenced by field"""
+
+        assert field.tablename is not None
+        target = self.mappings.get(field.tablename)
+        if target is None or (
+            self.imports_models
+            and field.tablename not in self.local
+            and field.tablename not in self.modules
+        ):
+            raise MappingError(
+                f"Table `{field.tablename}` referenced by `{field.name}` is not generated"
+            )
+        return target
+
+    def call(
+        self,
+        function: str,
+        *args: str,
+        indent: int = 4,
+        start: typing.Optional[int] = None,
+        **kwargs: str,
+    ) -> str:
+        """Source of call beginning at column `start`, by default that of the field
+        being rendered. Arguments go on lines of their own when it does not fit,
+        the closing parenthesis is indented by `indent`
+        """
+
+        arguments = list(args) + [f"{name}={value}" for name, value in kwargs.items()]
+        line = f"{function}({', '.join(arguments)})"
+        if (self.start if start is None else start) + len(line) <= LINE_LENGTH:
+            return line
+        inner = " " * (indent + 4)
+        return f"{function}(\n" + "".join(
+            f"{inner}{argument},\n" for argument in arguments
+        ) + " " * indent + ")"
+
+
+class TortoiseRenderer(Renderer):
+    """Relations refer to models by name, so referenced tables may be generated elsewhere"""
+
+    orm = "tortoise"
+
+    def class_name(self, tablename: str) -> str:
+        return identifier(self.naming.get_name(tablename).split(".")[-1])
+
+    def reference(self, tablename: str) -> str:
+        name = self.naming.get_name(tablename)
+        return repr(name if "." in name else "models." + name)
+
+    def render_model(self, mapping: ModelMapping) -> list[str]:
+        if "import tortoise" not in self.imports:
+            self.imports.append("import tortoise")
+        lines = [f"class {self.class_name(mapping.name)}(tortoise.Model):"]
+        lines.extend("    " + self.render_field(mapping, field) for field in mapping.fields)
+        lines.extend(["", "    class Meta:", f"        table = {mapping.name!r}"])
+        return lines
+
+    def render_number(self, field: FieldMapping, field_class: str) -> str:
+        validators = []
+        if field.ge is not None:
+            validators.append(f"tortoise.validators.MinValueValidator({literal(field.ge, field)})")
+        if field.le is not None:
+            validators.append(f"tortoise.validators.MaxValueValidator({literal(field.le, field)})")
+        listed = f"[{', '.join(validators)}]"
+        if len(f"        validators={listed},") > LINE_LENGTH:
+            # the call is long as well, so its arguments are indented by eight
+            listed = "[\n" + "".join(f"{' ' * 12}{item},\n" for item in validators) + " " * 8 + "]"
+        return self.call(
+            f"tortoise.fields.{field_class}",
+            pk=repr(field.primary_key),
+            unique=repr(field.unique),
+            null=repr(field.nullable),
+            default=literal(field.default, field),
+            validators=listed,
+            index=repr(field.index),
+        )
+
+    def render_integer(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.render_number(field, "IntField")
+
+    def render_float(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.render_number(field, "FloatField")
+
+    def render_string(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        arguments = dict(
+            null=repr(field.nullable),
+            pk=repr(field.primary_key),
+            default=literal(field.default, field),
+            unique=repr(field.unique),
+            index=repr(field.index),
+        )
+        if field.choices:
+            return self.call(
+                "tortoise.fields.CharEnumField", enum_type=self.choices_enum(field), **arguments
+            )
+        return self.call("tortoise.fields.CharField", str(field.max_length), **arguments)
+
+    def choices_enum(self, field: FieldMapping) -> str:
+        assert field.choices
+        values = sorted(field.choices, key=repr)
+        name = enum_name(values)
+        if any(line.startswith(f"{name} = ") for line in self.prelude):
+            return name
+        if "import enum" not in self.imports:
+            self.imports.insert(0, "import enum")
+        members = [f"{literal(value, field)}: {literal(value, field)}" for value in values]
+        line = f"{name} = enum.Enum({name!r}, {{{', '.join(members)}}})"
+        if len(line) > LINE_LENGTH:
+            line = f"{name} = enum.Enum(\n    {name!r},\n    {{\n" + "".join(
+                f"        {member},\n" for member in members
+            ) + "    },\n)"
+        self.prelude.extend(["", "", line])
+        return name
+
+    def render_boolean(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.call(
+            "tortoise.fields.BooleanField",
+            null=repr(field.nullable),
+            default=literal(field.default, field),
+            index=repr(field.index),
+        )
+
+    def render_foreign_key(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        related_name = "False" if field.skip_reverse else repr(field.related_name)
+        return self.call(
+            "tortoise.fields.ForeignKeyField",
+            self.reference(field.tablename),  # type: ignore
+            source_field=repr(field.name),
+            related_name=related_name,
+        )
+
+    def render_many2many(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.call(
+            "tortoise.fields.ManyToManyField",
+            self.reference(field.tablename),  # type: ignore
+            through=repr(field.through),
+        )
+
+
+class OrmarRenderer(Renderer):
+    """Models are abstract unless `database_url` option is given, then they
+    share `metadata` and `database` of the base module"""
+
+    orm = "ormar"
+    imports_models = True
+
+    def base(self) -> dict[str, str]:
+        url = self.options.get("database_url")
+        if url is None:
+            return {}
+        return {
+            "database": f"import databases\n\ndatabase = databases.Database({url!r})",
+            "metadata": "import sqlalchemy\n\nmetadata = sqlalchemy.MetaData()",
+        }
+
+    def render_model(self, mapping: ModelMapping) -> list[str]:
+        if "import ormar" not in self.imports:
+            self.imports.append("import ormar")
+        lines = [
+            f"class {self.class_name(mapping.name)}(ormar.Model):",
+            "    class Meta(ormar.ModelMeta):",
+            f"        tablename = {mapping.name!r}",
+        ]
+        if self.options.get("database_url") is None:
+            lines.append("        abstract = True")
+            # abstract models name their primary key for relations to them
+            primary_keys = [field.name for field in mapping.fields if field.primary_key]
+            if len(primary_keys) == 1:
+                lines.append(f"        pkname = {primary_keys[0]!r}")
+        else:
+            lines.extend(["        metadata = metadata", "        database = database"])
+        lines.append("")
+        lines.extend("    " + self.render_field(mapping, field) for field in mapping.fields)
+        return lines
+
+    def model(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        """Class referenced by field, forward reference if it is declared later"""
+
+        self.target(field)
+        assert field.tablename is not None
+        name = self.class_name(field.tablename)
+        if field.tablename not in self.local or field.tablename in self.declared:
+            return name
+        if "import typing" not in self.imports:
+            self.imports.insert(0, "import typing")
+        update = f"{self.class_name(mapping.name)}.update_forward_refs()"
+        # abstract models are never queried and ormar can't resolve their references
+        if self.options.get("database_url") is not None and update not in self.epilogue:
+            self.epilogue.append(update)
+        return f"typing.ForwardRef({name!r})"
+
+    def render_number(self, field: FieldMapping, field_class: str) -> str:
+        return self.call(
+            f"ormar.{field_class}",
+            nullable=repr(field.nullable),
+            default=literal(field.default, field),
+            primary_key=repr(field.primary_key),
+            minimum=literal(field.ge, field),
+            maximum=literal(field.le, field),
+            autoincrement=repr(field.autoincrement),
+            index=repr(field.index),
+        )
+
+    def render_integer(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.render_number(field, "Integer")
+
+    def render_float(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.render_number(field, "Float")
+
+    def render_string(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        choices = sorted(field.choices or (), key=repr)
+        return self.call(
+            "ormar.String",
+            nullable=repr(field.nullable),
+            default=literal(field.default, field),
+            primary_key=repr(field.primary_key),
+            max_length=str(field.max_length),
+            index=repr(field.index),
+            choices=f"[{', '.join(literal(choice, field) for choice in choices)}]",
+        )
+
+    def render_boolean(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.call(
+            "ormar.Boolean",
+            nullable=repr(field.nullable),
+            default=literal(field.default, field),
+            index=repr(field.index),
+        )
+
+    def render_foreign_key(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.call(
+            "ormar.ForeignKey",
+            self.model(mapping, field),
+            nullable=repr(field.nullable),
+            index=repr(field.index),
+            related_name=repr(field.related_name),
+            skip_reverse=repr(field.skip_reverse),
+        )
+
+    def render_many2many(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.call(
+            "ormar.ManyToMany",
+            self.model(mapping, field),
+            related_name=repr(field.related_name),
+            skip_reverse=repr(field.skip_reverse),
+        )
+
+
+class SQLAlchemyRenderer(Renderer):
+    """Models share declarative `Base` of the base module.
+
+    Foreign keys are columns with constraints, many-to-many fields are
+    relationships through tables named by `through_mapping`. Bounds and
+    choices become CHECK constraints of the table, as in its DDL
+    """
+
+    orm = "sqlalchemy"
+    TYPES = {
+        FieldType.INTEGER: "sqlalchemy.Integer",
+        FieldType.FLOAT: "sqlalchemy.Float",
+        FieldType.BOOLEAN: "sqlalchemy.Boolean",
+    }
+
+    def base(self) -> dict[str, str]:
+        return {
+            "Base": "import sqlalchemy.orm\n\nBase = sqlalchemy.orm.declarative_base()",
+        }
+
+    def render_model(self, mapping: ModelMapping) -> list[str]:
+        for module in ("import sqlalchemy", "import sqlalchemy.orm"):
+            if module not in self.imports:
+                self.imports.append(module)
+        lines = [
+            f"class {self.class_name(mapping.name)}(Base):",
+            f"    __tablename__ = {mapping.name!r}",
+        ]
+        checks = self.checks(mapping)
+        if checks:
+            lines.extend(["    __table_args__ = ("] + checks + ["    )"])
+        lines.append("")
+        lines.extend("    " + self.render_field(mapping, field) for field in mapping.fields)
+        return lines
+
+    def checks(self, mapping: ModelMapping) -> list[str]:
+        """Lines of CHECK constraints of ge/le/choices, named as in DDL of the mapping"""
+
+        lines = []
+        for field in mapping.fields:
+            check = CHECKS.check(field) if has_column(field) else None
+            if check is not None:
+                # constraints are items of a tuple in the class body
+                constraint = self.call(
+                    "sqlalchemy.CheckConstraint",
+                    repr(check),
+                    name=repr(check_name(mapping.name, field)),
+                    indent=8,
+                    start=9,
+                )
+                lines.append(f"        {constraint},")
+        return lines
+
+    def column(self, field: FieldMapping, *args: str) -> str:
+        return self.call(
+            "sqlalchemy.Column",
+            *args,
+            nullable=repr(field.nullable),
+            default=literal(field.default, field),
+            primary_key=repr(field.primary_key),
+            unique=repr(field.unique),
+            index=repr(field.index),
+        )
+
+    def render_integer(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.column(field, self.TYPES[field.type])
+
+    render_float = render_boolean = render_integer
+
+    def render_string(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.column(field, f"sqlalchemy.String({field.max_length})")
+
+    def foreign_key(self, field: FieldMapping) -> tuple[str, str]:
+        """Column type and constraint of column referencing primary key of target"""
+
+        target = self.target(field)
+        primary_keys = [key for key in target.fields if key.primary_key]
+        if len(primary_keys) != 1 or primary_keys[0].type not in self.TYPES:
+            raise MappingError(
+                f"`{field.name}` must reference a table with a single numeric primary key"
+            )
+        key = primary_keys[0]
+        return (
+            self.TYPES[key.type],
+            f"sqlalchemy.ForeignKey({f'{target.name}.{key.name}'!r})",
+        )
+
+    def render_foreign_key(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        return self.column(field, *self.foreign_key(field))
+
+    def render_many2many(self, mapping: ModelMapping, field: FieldMapping) -> str:
+        through = through_mapping(mapping, field)
+        name = identifier(through.name)
+        if through.name not in self.mappings:
+            columns = [
+                "    "
+                + self.call(
+                    "sqlalchemy.Column",
+                    repr(column.name),
+                    *self.foreign_key(column),
+                    index=repr(column.index),
+                    # arguments of the table, followed by a comma
+                    start=5,
+                )
+                + ","
+                for column in through.fields
+            ]
+            self.prelude.extend(
+                ["", "", f"{name} = sqlalchemy.Table(", f"    {name!r},", "    Base.metadata,"]
+                + columns
+                + [")"]
+            )
+        return self.call(
+            "sqlalchemy.orm.relationship",
+            repr(self.class_name(self.target(field).name)),
+            secondary=repr(through.name),
+        )
+
+
+RENDERERS: dict[str, typing.Type[Renderer]] = {
+    "tortoise": TortoiseRenderer,
+    "ormar": OrmarRenderer,
+    "sqlalchemy": SQLAlchemyRenderer,
+}
+
+
+def get_renderer(orm: str) -> typing.Type[Renderer]:
+    try:
+        return RENDERERS[orm]
+    except KeyError:
+        raise BridgeError(
+            f"No code generation for `{orm}`, available: {', '.join(RENDERERS)}"
+        ) from None
+
+
+def generate(
+    catalog: Catalog,
+    orm: str,
+    naming: typing.Optional[NamingStrategy] = None,
+    **options: typing.Any,
+) -> str:
+    """Source of a standalone module declaring models of all mappings"""
+
+    mappings = {mapping.name: mapping for mapping in catalog_mappings(catalog)}
+    return get_renderer(orm)(mappings, naming=naming, **options).render(mappings)
+
+
+# umask can only be read by setting it, which isn't safe once threads write modules
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_source(path: str, source: str, compile: bool = True) -> None:
+    """Writes module atomically, along with its bytecode"""
+
+    directory = os.path.dirname(path) or "."
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(source)
+        # mkstemp makes files readable by the owner only
+        os.chmod(temporary, 0o666 & ~_UMASK)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    if compile:
+        py_compile.compile(path, doraise=True)
+
+
+def generate_module(
+    orm: str,
+    records: list[ModelRecord],
+    modules: dict[str, str],
+    module: str,
+    path: str,
+    naming: typing.Optional[NamingStrategy] = None,
+    compile: bool = True,
+    options: typing.Optional[dict[str, typing.Any]] = None,
+) -> str:
+    """Renders and writes one module of a package, runs in worker processes"""
+
+    mappings = {record.name: record.to_mapping() for record in records}
+    renderer = get_renderer(orm)(mappings, modules, naming, package=True, **(options or {}))
+    tablenames = [tablename for tablename, owner in modules.items() if owner == module]
+    write_source(path, renderer.render(tablenames), compile)
+    return path
+
+
+def generate_package(
+    catalogs: typing.Mapping[str, Catalog],
+    orm: str,
+    directory: typing.Union[str, os.PathLike],
+    naming: typing.Optional[NamingStrategy] = None,
+    workers: typing.Optional[int] = None,
+    compile: bool = True,
+    **options: typing.Any,
+) -> list[str]:
+    """Writes a package with a module of models for each catalog by module name.
+
+    Modules are rendered, written and byte-compiled over a process pool.
+    Models refer to tables of other modules of the package, a shared base
+    module is written where the ORM needs one. Returns paths of written modules
+    """
+
+    renderer_cls = get_renderer(orm)
+    directory = os.fspath(directory)
+    mappings: dict[str, ModelMapping] = {}
+    modules: dict[str, str] = {}
+    for module, catalog in catalogs.items():
+        identifier(module)
+        for mapping in catalog_mappings(catalog):
+            if mapping.name in modules:
+                raise MappingError(
+                    f"Table `{mapping.name}` is in modules {modules[mapping.name]} and {module}"
+                )
+            mappings[mapping.name] = mapping
+            modules[mapping.name] = module
+
+    if renderer_cls.imports_models:
+        # modules import classes of each other, so their references must not cycle
+        dependencies: dict[str, set[str]] = {module: set() for module in catalogs}
+        for mapping in mappings.values():
+            for field in mapping.fields:
+                owner = modules.get(field.tablename) if field.tablename else None
+                if owner is not None and owner != modules[mapping.name]:
+                    dependencies[modules[mapping.name]].add(owner)
+        try:
+            tuple(graphlib.TopologicalSorter(dependencies).static_order())
+        except graphlib.CycleError as e:
+            raise MappingError(
+                f"Modules {', '.join(e.args[1])} refer to each other, generate them as one"
+            ) from None
+
+    os.makedirs(directory, exist_ok=True)
+    init = os.path.join(directory, "__init__.py")
+    if not os.path.exists(init):
+        write_source(init, f"{HEADER}\n", compile)
+    base = renderer_cls(mappings, modules, naming, package=True, **options).base()
+    if base:
+        imports, definitions = split_base(base)
+        source = "\n".join([HEADER] + imports + ["", ""] + definitions) + "\n"
+        write_source(os.path.join(directory, f"{BASE_MODULE}.py"), source, compile)
+
+    records = [ModelRecord.from_mapping(mapping) for mapping in mappings.values()]
+    jobs = [
+        (module, os.path.join(directory, f"{module}.py"))
+        for module in catalogs
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs) or 1)
+    if workers == 1:
+        return [
+            generate_module(orm, records, modules, module, path, naming, compile, options)
+            for module, path in jobs
+        ]
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(
+                generate_module, orm, records, modules, module, path, naming, compile, options
+            )
+            for module, path in jobs
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,265 @@
+import array
+import math
+import operator
+import typing
+
+from orm_bridge.environment import Environment
+from orm_bridge.errors import MappingError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+FIELD_TYPES = list(FieldType)
+BOOLEANS = ("nullable", "index", "unique", "primary_key", "autoincrement", "skip_reverse")
+NUMBERS = ("ge", "le")
+# missing integers, missing numbers are nan
+MISSING = -1
+
+OPERATORS: dict[str, typing.Callable[[typing.Any, typing.Any], typing.Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+
+Indexes = typing.Sequence[int]
+
+
+def _column(typecode: str, values: list) -> typing.Sequence:
+    if numpy is not None:
+        return numpy.array(values, dtype=typecode)
+    return array.array(typecode, values)
+
+
+class ColumnarCatalog:
+    """Field attributes of mappings stored by column.
+
+    Columns are NumPy arrays when NumPy is installed, `array.array` otherwise.
+    Codes of `type`, `table` and `tablename` columns index
+    `FIELD_TYPES`, `tables` and `tablenames`
+    """
+
+    def __init__(self, mappings: typing.Iterable[ModelMapping] = ()) -> None:
+        self.mappings: list[ModelMapping] = list(mappings)
+        self.tables = [mapping.name for mapping in self.mappings]
+        self.tablenames: list[str] = []
+        self.names: list[str] = []
+        tablename_codes: dict[str, int] = {}
+        type_codes = {field_type: i for i, field_type in enumerate(FIELD_TYPES)}
+
+        values: dict[str, list] = {
+            name: []
+            for name in ("table", "position", "type", "max_length", "tablename")
+            + BOOLEANS
+            + NUMBERS
+        }
+        for table, mapping in enumerate(self.mappings):
+            for position, field in enumerate(mapping.fields):
+                self.names.append(field.name)
+                values["table"].append(table)
+                values["position"].append(position)
+                values["type"].append(type_codes[field.type])
+                values["max_length"].append(
+                    MISSING if field.max_length is None else field.max_length
+                )
+                tablename = field.tablename
+                if tablename is None:
+                    values["tablename"].append(MISSING)
+                else:
+                    if tablename not in tablename_codes:
+                        tablename_codes[tablename] = len(self.tablenames)
+                        self.tablenames.append(tablename)
+                    values["tablename"].append(tablename_codes[tablename])
+                for name in BOOLEANS:
+                    values[name].append(bool(getattr(field, name)))
+                for name in NUMBERS:
+                    value = getattr(field, name)
+                    values[name].append(math.nan if value is None else float(value))
+
+        self._tablename_codes = tablename_codes
+        self.columns: dict[str, typing.Sequence] = {
+            name: _column("b" if name in BOOLEANS else "d" if name in NUMBERS else "q", column)
+            for name, column in values.items()
+        }
+
+    @classmethod
+    def from_environment(cls, environment: Environment) -> "ColumnarCatalog":
+        return cls(environment.table_mappings.values())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def all(self) -> "Selection":
+        if numpy is not None:
+            return Selection(self, numpy.arange(len(self)))
+        return Selection(self, range(len(self)))
+
+    def filter(self, **conditions: typing.Any) -> "Selection":
+        """Fields matching all conditions, see `Selection.filter`"""
+        return self.all().filter(**conditions)
+
+    def group_by(self, attribute: str) -> dict[typing.Any, "Selection"]:
+        return self.all().group_by(attribute)
+
+    def count_by(self, attribute: str) -> dict[typing.Any, int]:
+        return self.all().count_by(attribute)
+
+    def encode(self, attribute: str, value: typing.Any) -> typing.Any:
+        """Value as stored in the column of attribute"""
+
+        if attribute == "type":
+            return FIELD_TYPES.index(FieldType(value))
+        if attribute == "tablename":
+            if value is None:
+                return MISSING
+            # unknown table matches nothing
+            return self._tablename_codes.get(value, -2)
+        if attribute in NUMBERS:
+            return math.nan if value is None else float(value)
+        if attribute == "max_length":
+            return MISSING if value is None else value
+        return value
+
+    def decode(self, attribute: str, value: typing.Any) -> typing.Any:
+        if attribute == "type":
+            return FIELD_TYPES[value]
+        if attribute == "table":
+            return self.tables[value]
+        if attribute == "tablename":
+            return None if value == MISSING else self.tablenames[value]
+        if attribute in NUMBERS:
+            return None if math.isnan(value) else value
+        if attribute == "max_length":
+            return None if value == MISSING else int(value)
+        if attribute in BOOLEANS:
+            return bool(value)
+        return value
+
+
+class Selection:
+    """Positions of fields in a catalog"""
+
+    def __init__(self, catalog: ColumnarCatalog, indexes: Indexes) -> None:
+        self.catalog = catalog
+        self.indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __iter__(self) -> typing.Iterator[tuple[str, FieldMapping]]:
+        return iter(self.fields())
+
+    def filter(self, **conditions: typing.Any) -> "Selection":
+        """Fields matching all conditions.
+
+        Keys are attributes with optional `__ne`, `__gt`, `__ge`, `__lt`, `__le`
+        or `__in` lookup, e.g. `type=FieldType.FOREIGN_KEY, index=False`
+        or `max_length__gt=1024`. None matches missing values
+        """
+
+        indexes = self.indexes
+        for key, value in conditions.items():
+            attribute, _, lookup = key.partition("__")
+            if attribute not in self.catalog.columns or attribute == "position":
+                raise MappingError(f"Field attribute `{attribute}` is not in catalog")
+            if lookup == "in":
+                codes = [self.catalog.encode(attribute, item) for item in value]
+                indexes = self._match(indexes, attribute, codes, None)
+            elif lookup in OPERATORS or not lookup:
+                indexes = self._match(
+                    indexes, attribute, self.catalog.encode(attribute, value), lookup or "eq"
+                )
+            else:
+                raise MappingError(f"Unknown lookup `{lookup}`")
+        return Selection(self.catalog, indexes)
+
+    def _match(
+        self,
+        indexes: Indexes,
+        attribute: str,
+        code: typing.Any,
+        lookup: typing.Optional[str],
+    ) -> Indexes:
+        column = self.catalog.columns[attribute]
+        missing = isinstance(code, float) and math.isnan(code)
+
+        if numpy is not None:
+            values = column[indexes]
+            if lookup is None:
+                mask = numpy.isin(values, code)
+            elif missing:
+                mask = numpy.isnan(values)
+                if lookup == "ne":
+                    mask = ~mask
+            else:
+                mask = OPERATORS[lookup](values, code)
+            return numpy.asarray(indexes)[mask]
+
+        if lookup is None:
+            codes = set(code)
+            return [i for i in indexes if column[i] in codes]
+        if missing:
+            keep = lookup == "ne"
+            return [i for i in indexes if math.isnan(column[i]) is not keep]
+        compare = OPERATORS[lookup]
+        return [i for i in indexes if compare(column[i], code)]
+
+    def column(self, attribute: str) -> list[typing.Any]:
+        """Decoded values of attribute for selected fields"""
+
+        column = self.catalog.columns[attribute]
+        return [self.catalog.decode(attribute, column[i]) for i in self.indexes]
+
+    def count_by(self, attribute: str) -> dict[typing.Any, int]:
+        column = self.catalog.columns[attribute]
+        if numpy is not None:
+            values, counts = numpy.unique(column[self.indexes], return_counts=True)
+            pairs = zip(values.tolist(), counts.tolist())
+        else:
+            counter: dict[typing.Any, int] = {}
+            for i in self.indexes:
+                counter[column[i]] = counter.get(column[i], 0) + 1
+            pairs = counter.items()  # type: ignore
+        return {self.catalog.decode(attribute, value): count for value, count in pairs}
+
+    def group_by(self, attribute: str) -> dict[typing.Any, "Selection"]:
+        column = self.catalog.columns[attribute]
+        if numpy is not None:
+            indexes = numpy.asarray(self.indexes)
+            values, inverse = numpy.unique(column[indexes], return_inverse=True)
+            order = numpy.argsort(inverse, kind="stable")
+            bounds = numpy.cumsum(numpy.bincount(inverse, minlength=len(values)))[:-1]
+            return {
+                self.catalog.decode(attribute, value): Selection(self.catalog, group)
+                for value, group in zip(values.tolist(), numpy.split(indexes[order], bounds))
+            }
+
+        groups: dict[typing.Any, list[int]] = {}
+        for i in self.indexes:
+            groups.setdefault(column[i], []).append(int(i))
+        return {
+            self.catalog.decode(attribute, value): Selection(self.catalog, indexes)
+            for value, indexes in groups.items()
+        }
+
+    def fields(self) -> list[tuple[str, FieldMapping]]:
+        """Tablenames and original field mappings of selected fields"""
+
+        tables = self.catalog.columns["table"]
+        positions = self.catalog.columns["position"]
+        mappings = self.catalog.mappings
+        return [
+            (mappings[tables[i]].name, mappings[tables[i]].fields[positions[i]])
+            for i in self.indexes
+        ]
+
+    def mappings(self) -> list[ModelMapping]:
+        """Original mappings having selected fields, in catalog order"""
+
+        tables = self.catalog.columns["table"]
+        return [self.catalog.mappings[t] for t in sorted({int(tables[i]) for i in self.indexes})]
@@ -0,0 +1,124 @@
+import enum
+import typing
+
+from orm_bridge.cache import TranslationCache
+from orm_bridge.dialect import has_column
+from orm_bridge.errors import MappingError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+Row = typing.Union[tuple, dict]
+Converter = typing.Callable[[Row], Row]
+# target field name -> source field name
+Correspondence = typing.Mapping[str, str]
+
+COERCIONS: dict[FieldType, type] = {
+    FieldType.INTEGER: int,
+    FieldType.FLOAT: float,
+    FieldType.STRING: str,
+    FieldType.BOOLEAN: bool,
+    FieldType.FOREIGN_KEY: int,
+}
+
+CONVERTERS: TranslationCache = TranslationCache(maxsize=1024)
+
+
+def columns(mapping: ModelMapping) -> list[FieldMapping]:
+    return [field for field in mapping.fields if has_column(field)]
+
+
+def generate_converter(
+    source: ModelMapping,
+    target: ModelMapping,
+    correspondence: typing.Optional[Correspondence] = None,
+    dicts: bool = False,
+) -> tuple[str, dict[str, typing.Any]]:
+    """Source code of converter function and constants it refers to.
+
+    Rows are tuples of column values in mapping order, or dicts with `dicts`
+    """
+
+    correspondence = correspondence or {}
+    positions = {field.name: i for i, field in enumerate(columns(source))}
+    source_fields = {field.name: field for field in source.fields}
+    namespace: dict[str, typing.Any] = {"Enum": enum.Enum}
+    lines = ["def convert(row):"]
+    names: list[str] = []
+
+    for i, field in enumerate(columns(target)):
+        name = f"v{i}"
+        names.append(name)
+        origin = correspondence.get(field.name, field.name)
+        if origin in positions:
+            key = repr(origin) if dicts else positions[origin]
+            lines.append(f"    {name} = row[{key}]")
+        elif field.name in correspondence:
+            raise MappingError(f"Field `{origin}` is not a column of `{source.name}`")
+        else:
+            lines.append(f"    {name} = None")
+
+        if field.default is not None:
+            namespace[f"default{i}"] = field.default
+            lines.append(f"    if {name} is None:")
+            lines.append(f"        {name} = default{i}")
+
+        previous = source_fields.get(origin)
+        if field.choices:
+            namespace[f"choices{i}"] = frozenset(field.choices)
+            lines.append(f"    if isinstance({name}, Enum):")
+            lines.append(f"        {name} = {name}.value")
+        coercion = COERCIONS.get(field.type)
+        if coercion is not None and (previous is None or previous.type != field.type):
+            namespace[f"coerce{i}"] = coercion
+            lines.append(f"    if {name} is not None:")
+            lines.append(f"        {name} = coerce{i}({name})")
+        if field.choices:
+            lines.append(f"    if {name} is not None and {name} not in choices{i}:")
+            message = f"{field.name}: "
+            lines.append(
+                f"        raise ValueError({message!r} + repr({name}) + ' is not a choice')"
+            )
+        if not field.nullable and not (field.primary_key and field.autoincrement):
+            lines.append(f"    if {name} is None:")
+            lines.append(f"        raise ValueError({field.name + ' is not nullable'!r})")
+
+    if dicts:
+        items = ", ".join(
+            f"{field.name!r}: {name}" for field, name in zip(columns(target), names)
+        )
+        lines.append(f"    return {{{items}}}")
+    else:
+        lines.append(f"    return ({', '.join(names)}{',' if len(names) == 1 else ''})")
+    return "\n".join(lines) + "\n", namespace
+
+
+def compile_converter(
+    source: ModelMapping,
+    target: ModelMapping,
+    correspondence: typing.Optional[Correspondence] = None,
+    dicts: bool = False,
+    cache: typing.Optional[TranslationCache] = CONVERTERS,
+) -> Converter:
+    """Straight-line function converting rows of source table to rows of target.
+
+    Target fields take values of source fields of the same name unless
+    `correspondence` names another one. Missing values get target defaults,
+    enums become their values, values of another field type are coerced, and
+    invalid choices or missing non-null values raise ValueError.
+    Converters are cached by fingerprints of both mappings
+    """
+
+    key = (
+        source.fingerprint(),
+        target.fingerprint(),
+        tuple(sorted((correspondence or {}).items())),
+        dicts,
+    )
+    converter = cache.get(key) if cache is not None else None
+    if converter is None:
+        code, namespace = generate_converter(source, target, correspondence, dicts)
+        exec(compile(code, f"<converter {source.name} to {target.name}>", "exec"), namespace)
+        converter = namespace["convert"]
+        converter.__source__ = code  # type: ignore
+        if cache is not None:
+            cache.put(key, converter)  # type: ignore
+    return converter  # type: ignore
@@ -0,0 +1,109 @@
+import typing
+
+from orm_bridge.cache import TranslationCache
+from orm_bridge.dialect import Catalog, Dialect, get_dialect, has_column, through_mapping
+from orm_bridge.graph import RelationGraph
+from orm_bridge.mapping import FieldType, ModelMapping
+
+
+class DDLCompiler:
+    """Compiles mappings to CREATE TABLE and CREATE INDEX statements of a dialect.
+
+    Statements of a mapping are cached by its fingerprint and types of its foreign keys
+    """
+
+    def __init__(
+        self,
+        dialect: typing.Union[str, Dialect] = "sqlite",
+        cache: typing.Optional[TranslationCache] = None,
+    ) -> None:
+        self.dialect = get_dialect(dialect)
+        self.cache = cache if cache is not None else TranslationCache(maxsize=4096)
+
+    def compile(
+        self,
+        mapping: ModelMapping,
+        deferred: typing.Collection[str] = (),
+        catalog: typing.Optional[Catalog] = None,
+    ) -> list[str]:
+        """Statements creating table of mapping, see `Dialect.create_table`"""
+
+        deferred = frozenset(deferred)
+        references = tuple(
+            self.dialect.reference_type(field, catalog)
+            for field in mapping.fields
+            if field.type == FieldType.FOREIGN_KEY
+        )
+        key = (mapping.fingerprint(), self.dialect.name, deferred, references)
+        statements = self.cache.get(key)
+        if statements is None:
+            statements = self.dialect.create_table(mapping, deferred=deferred, catalog=catalog)
+            self.cache.put(key, statements)  # type: ignore
+        return list(statements)  # type: ignore
+
+    def compile_catalog(self, mappings: typing.Iterable[ModelMapping]) -> list[str]:
+        """Statements creating all tables, referenced tables first.
+
+        Through tables of many-to-many fields follow all tables.
+        Where dialect needs it, foreign keys closing a cycle are added at the end
+        """
+
+        graph = RelationGraph(mappings)
+        created: set[str] = set()
+        statements: list[str] = []
+        constraints: list[str] = []
+        throughs: list[ModelMapping] = []
+
+        for tablename in graph.order():
+            mapping = graph.mappings[tablename]
+            deferred = set()
+            for field in mapping.fields:
+                if (
+                    self.dialect.ordered_references
+                    and field.type == FieldType.FOREIGN_KEY
+                    and field.tablename in graph.mappings
+                    and field.tablename not in created
+                    and field.tablename != tablename
+                ):
+                    deferred.add(field.name)
+                    constraints.append(self.dialect.add_foreign_key(tablename, field))
+                elif not has_column(field) and field.tablename is not None:
+                    through = through_mapping(mapping, field)
+                    if through.name not in graph.mappings:
+                        throughs.append(through)
+            statements.extend(self.compile(mapping, deferred, graph.mappings))
+            created.add(tablename)
+
+        for through in throughs:
+            statements.extend(self.compile(through, catalog=graph.mappings))
+        return statements + constraints
+
+
+def apply(
+    connection: typing.Any,
+    mappings: typing.Iterable[ModelMapping],
+    dialect: typing.Union[str, Dialect] = "sqlite",
+    compiler: typing.Optional[DDLCompiler] = None,
+) -> list[str]:
+    """Creates tables of mappings through DB-API connection in one transaction.
+
+    Nothing is created if any statement fails
+    """
+
+    compiler = compiler or DDLCompiler(dialect)
+    statements = compiler.compile_catalog(mappings)
+    cursor = connection.cursor()
+    try:
+        # sqlite3 does not open transactions for DDL by itself
+        if getattr(connection, "in_transaction", None) is False:
+            cursor.execute("BEGIN")
+        for statement in statements:
+            cursor.execute(statement)
+    except BaseException:
+        connection.rollback()
+        raise
+    else:
+        connection.commit()
+    finally:
+        cursor.close()
+    return statements
@@ -0,0 +1,323 @@
+import typing
+
+from orm_bridge.environment import through_name
+from orm_bridge.errors import MappingError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping, Value
+
+Catalog = typing.Mapping[str, ModelMapping]
+
+
+class Dialect:
+    """Renders SQL for mappings"""
+
+    name: str
+    types: dict[FieldType, str]
+    # whether referenced tables must exist before a foreign key is created
+    ordered_references = True
+
+    def quote(self, name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def literal(self, value: Value) -> str:
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return self.boolean(value)
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, str):
+            return "'" + value.replace("'", "''") + "'"
+        raise MappingError(f"Value {value!r} can't be rendered as SQL literal")
+
+    def boolean(self, value: bool) -> str:
+        return "TRUE" if value else "FALSE"
+
+    def column_type(self, field: FieldMapping, catalog: typing.Optional[Catalog] = None) -> str:
+        if field.type == FieldType.STRING:
+            return f"VARCHAR({field.max_length})"
+        if field.type == FieldType.FOREIGN_KEY:
+            return self.reference_type(field, catalog)
+        if field.type not in self.types:
+            raise MappingError(f"Field `{field.name}` of type {field.type.value} has no column")
+        return self.types[field.type]
+
+    def reference_type(
+        self,
+        field: FieldMapping,
+        catalog: typing.Optional[Catalog] = None,
+    ) -> str:
+        """Column type of foreign key, the type of primary key of the table it references.
+
+        Tables missing from catalog, with composite or foreign primary keys get the default
+        """
+
+        target = catalog.get(field.tablename) if catalog and field.tablename else None
+        keys = [key for key in target.fields if key.primary_key] if target else []
+        if len(keys) != 1 or keys[0].type == FieldType.FOREIGN_KEY:
+            return self.types[FieldType.FOREIGN_KEY]
+        return self.column_type(keys[0])
+
+    def check(self, field: FieldMapping) -> typing.Optional[str]:
+        """Check expression for ge/le/choices constraints of field"""
+
+        column = self.quote(field.name)
+        conditions: list[str] = []
+        if field.ge is not None:
+            conditions.append(f"{column} >= {self.literal(field.ge)}")
+        if field.le is not None:
+            conditions.append(f"{column} <= {self.literal(field.le)}")
+        if field.choices:
+            choices = ", ".join(map(self.literal, sorted(field.choices, key=repr)))
+            conditions.append(f"{column} IN ({choices})")
+        return " AND ".join(conditions) or None
+
+    def identity(self, field: FieldMapping) -> typing.Optional[str]:
+        """Clause generating values of autoincrement column, if it isn't part of pk"""
+        return None
+
+    def primary_key(self, field: FieldMapping) -> str:
+        return "PRIMARY KEY"
+
+    def column(
+        self,
+        table: str,
+        field: FieldMapping,
+        inline_pk: bool = True,
+        reference: bool = True,
+        catalog: typing.Optional[Catalog] = None,
+    ) -> str:
+        """Column definition, pk is left to table constraint unless inline.
+
+        Without `reference` foreign key constraint is left to `add_foreign_key`.
+        Foreign keys take the type of primary key of referenced table in `catalog`
+        """
+
+        parts = [self.quote(field.name), self.column_type(field, catalog)]
+        identity = self.identity(field)
+        if identity:
+            parts.append(identity)
+        if field.primary_key and inline_pk:
+            parts.append(self.primary_key(field))
+        if not field.nullable and not field.primary_key:
+            parts.append("NOT NULL")
+        if field.unique and not field.primary_key:
+            parts.append(f"CONSTRAINT {self.quote(unique_name(table, field))} UNIQUE")
+        if field.default is not None:
+            parts.append("DEFAULT " + self.literal(field.default))
+        check = self.check(field)
+        if check:
+            parts.append(f"CONSTRAINT {self.quote(check_name(table, field))} CHECK ({check})")
+        if field.type == FieldType.FOREIGN_KEY and field.tablename and reference:
+            parts.append(
+                f"CONSTRAINT {self.quote(foreign_key_name(table, field))} "
+                f"REFERENCES {self.quote(field.tablename)}"
+            )
+        return " ".join(parts)
+
+    def create_table(
+        self,
+        mapping: ModelMapping,
+        tablename: typing.Optional[str] = None,
+        deferred: typing.Collection[str] = (),
+        catalog: typing.Optional[Catalog] = None,
+    ) -> list[str]:
+        """CREATE TABLE and CREATE INDEX statements of mapping.
+
+        Table may be created under another name, constraints are still named after mapping.
+        Foreign keys of `deferred` fields are left out
+        """
+
+        columns = [field for field in mapping.fields if has_column(field)]
+        primary_keys = [field.name for field in columns if field.primary_key]
+        inline_pk = len(primary_keys) == 1
+        definitions = [
+            self.column(mapping.name, field, inline_pk, field.name not in deferred, catalog)
+            for field in columns
+        ]
+        if len(primary_keys) > 1:
+            definitions.append(
+                "PRIMARY KEY (" + ", ".join(map(self.quote, primary_keys)) + ")"
+            )
+        statements = [
+            f"CREATE TABLE {self.quote(tablename or mapping.name)} ("
+            + ", ".join(definitions)
+            + ")"
+        ]
+        statements.extend(
+            self.create_index(mapping.name, field)
+            for field in columns
+            if field.index and not field.primary_key
+        )
+        return statements
+
+    def add_foreign_key(self, table: str, field: FieldMapping) -> str:
+        assert field.tablename is not None
+        return (
+            f"ALTER TABLE {self.quote(table)} "
+            f"ADD CONSTRAINT {self.quote(foreign_key_name(table, field))} "
+            f"FOREIGN KEY ({self.quote(field.name)}) REFERENCES {self.quote(field.tablename)}"
+        )
+
+    def drop_table(self, tablename: str) -> str:
+        return f"DROP TABLE {self.quote(tablename)}"
+
+    def rename_table(self, old: ModelMapping, new: ModelMapping) -> list[str]:
+        """Renames table along with its indexes and constraints named after it"""
+
+        statements = [f"ALTER TABLE {self.quote(old.name)} RENAME TO {self.quote(new.name)}"]
+        if any(field.primary_key for field in new.fields):
+            statements.append(
+                self.rename_constraint(new.name, old.name + "_pkey", new.name + "_pkey")
+            )
+        for field in new.fields:
+            if not has_column(field):
+                continue
+            if field.index and not field.primary_key:
+                statements.append(
+                    f"ALTER INDEX {self.quote(index_name(old.name, field))} "
+                    f"RENAME TO {self.quote(index_name(new.name, field))}"
+                )
+            statements.extend(
+                self.rename_constraint(new.name, name(old.name, field), name(new.name, field))
+                for name in self.constraints(field)
+            )
+        return statements
+
+    def rename_column(self, table: str, old: FieldMapping, new: FieldMapping) -> list[str]:
+        """Renames column along with constraints named after it"""
+
+        statements = [
+            f"ALTER TABLE {self.quote(table)} "
+            f"RENAME COLUMN {self.quote(old.name)} TO {self.quote(new.name)}"
+        ]
+        statements.extend(
+            self.rename_constraint(table, name(table, old), name(table, new))
+            for name in self.constraints(new)
+        )
+        return statements
+
+    def rename_constraint(self, table: str, old: str, new: str) -> str:
+        return (
+            f"ALTER TABLE {self.quote(table)} "
+            f"RENAME CONSTRAINT {self.quote(old)} TO {self.quote(new)}"
+        )
+
+    def constraints(self, field: FieldMapping) -> list[typing.Callable[[str, FieldMapping], str]]:
+        """Functions naming constraints of column, except primary key"""
+
+        names: list[typing.Callable[[str, FieldMapping], str]] = []
+        if field.unique and not field.primary_key:
+            names.append(unique_name)
+        if self.check(field):
+            names.append(check_name)
+        if field.type == FieldType.FOREIGN_KEY and field.tablename:
+            names.append(foreign_key_name)
+        return names
+
+    def create_index(self, table: str, field: FieldMapping) -> str:
+        return (
+            f"CREATE INDEX {self.quote(index_name(table, field))} "
+            f"ON {self.quote(table)} ({self.quote(field.name)})"
+        )
+
+    def drop_index(self, table: str, field: FieldMapping) -> str:
+        return f"DROP INDEX {self.quote(index_name(table, field))}"
+
+
+class SQLiteDialect(Dialect):
+    name = "sqlite"
+    # references are only checked when rows are written
+    ordered_references = False
+    types = {
+        FieldType.INTEGER: "INTEGER",
+        FieldType.FLOAT: "REAL",
+        FieldType.BOOLEAN: "BOOLEAN",
+        FieldType.DATETIME: "DATETIME",
+        FieldType.FOREIGN_KEY: "INTEGER",
+    }
+
+    def boolean(self, value: bool) -> str:
+        return "1" if value else "0"
+
+    def rename_table(self, old: ModelMapping, new: ModelMapping) -> list[str]:
+        # sqlite can't rename indexes, constraints keep their names until table is rebuilt
+        statements = [f"ALTER TABLE {self.quote(old.name)} RENAME TO {self.quote(new.name)}"]
+        for field in new.fields:
+            if has_column(field) and field.index and not field.primary_key:
+                statements.append(f"DROP INDEX {self.quote(index_name(old.name, field))}")
+                statements.append(self.create_index(new.name, field))
+        return statements
+
+    def primary_key(self, field: FieldMapping) -> str:
+        if field.autoincrement and field.type == FieldType.INTEGER:
+            return "PRIMARY KEY AUTOINCREMENT"
+        return "PRIMARY KEY"
+
+
+class PostgreSQLDialect(Dialect):
+    name = "postgresql"
+    types = {
+        FieldType.INTEGER: "INTEGER",
+        FieldType.FLOAT: "DOUBLE PRECISION",
+        FieldType.BOOLEAN: "BOOLEAN",
+        FieldType.DATETIME: "TIMESTAMP",
+        FieldType.FOREIGN_KEY: "INTEGER",
+    }
+
+    def identity(self, field: FieldMapping) -> typing.Optional[str]:
+        if field.autoincrement and field.type == FieldType.INTEGER:
+            return "GENERATED BY DEFAULT AS IDENTITY"
+        return None
+
+
+DIALECTS: dict[str, Dialect] = {
+    SQLiteDialect.name: SQLiteDialect(),
+    PostgreSQLDialect.name: PostgreSQLDialect(),
+}
+
+
+def get_dialect(dialect: typing.Union[str, Dialect]) -> Dialect:
+    if isinstance(dialect, Dialect):
+        return dialect
+    if dialect not in DIALECTS:
+        raise MappingError(f"Unknown SQL dialect `{dialect}`")
+    return DIALECTS[dialect]
+
+
+def has_column(field: FieldMapping) -> bool:
+    return field.type != FieldType.MANY2MANY
+
+
+def index_name(table: str, field: FieldMapping) -> str:
+    return f"ix_{table}_{field.name}"
+
+
+def unique_name(table: str, field: FieldMapping) -> str:
+    return f"uq_{table}_{field.name}"
+
+
+def check_name(table: str, field: FieldMapping) -> str:
+    return f"ck_{table}_{field.name}"
+
+
+def foreign_key_name(table: str, field: FieldMapping) -> str:
+    return f"fk_{table}_{field.name}"
+
+
+def through_mapping(mapping: ModelMapping, field: FieldMapping) -> ModelMapping:
+    """Mapping of the table joining both ends of many-to-many field"""
+
+    assert field.tablename is not None
+    source = f"{mapping.name}_id"
+    target = f"{field.tablename}_id"
+    if source == target:
+        target = f"related_{target}"
+    return ModelMapping.trusted(
+        through_name(mapping.name, field),
+        [
+            FieldMapping.trusted(
+                name=name, type=FieldType.FOREIGN_KEY, tablename=tablename, index=True
+            )
+            for name, tablename in ((source, mapping.name), (target, field.tablename))
+        ],
+    )
@@ -0,0 +1,408 @@
+import typing
+
+from orm_bridge.dialect import (
+    Catalog,
+    Dialect,
+    check_name,
+    foreign_key_name,
+    get_dialect,
+    has_column,
+    through_mapping,
+    unique_name,
+)
+from orm_bridge.graph import RelationGraph
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+# Attributes only meaningful for ORM models, they have no schema
+ORM_ATTRIBUTES = frozenset({"related_name", "skip_reverse"})
+# Attributes sqlite can change without rebuilding the table
+SQLITE_ATTRIBUTES = frozenset({"index", "max_length"}) | ORM_ATTRIBUTES
+
+
+class FieldChange(typing.NamedTuple):
+    old: FieldMapping
+    new: FieldMapping
+    attributes: frozenset[str]
+
+
+class TableDiff:
+    """Changes of fields of a table.
+
+    Foreign keys take the type of primary key of referenced table in `catalog` of new schema
+    """
+
+    def __init__(
+        self,
+        old: ModelMapping,
+        new: ModelMapping,
+        catalog: typing.Optional[Catalog] = None,
+    ) -> None:
+        self.old = old
+        self.new = new
+        self.catalog: Catalog = catalog if catalog is not None else {new.name: new}
+        self.added: list[FieldMapping] = []
+        self.removed: list[FieldMapping] = []
+        self.renamed: list[tuple[FieldMapping, FieldMapping]] = []
+        self.changed: list[FieldChange] = []
+
+        old_fields = {field.name: field for field in old.fields}
+        new_fields = {field.name: field for field in new.fields}
+        for name, field in new_fields.items():
+            previous = old_fields.get(name)
+            if previous is None:
+                self.added.append(field)
+            elif previous.fingerprint() != field.fingerprint():
+                attributes = frozenset(
+                    attribute
+                    for attribute in field.__fields__
+                    if getattr(previous, attribute) != getattr(field, attribute)
+                )
+                self.changed.append(FieldChange(previous, field, attributes))
+        self.removed = [field for name, field in old_fields.items() if name not in new_fields]
+
+        for previous, field in match_renames(self.removed, self.added):
+            self.removed.remove(previous)
+            self.added.remove(field)
+            self.renamed.append((previous, field))
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.renamed or self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TableDiff {self.new.name} added={[f.name for f in self.added]} "
+            f"removed={[f.name for f in self.removed]} "
+            f"renamed={[(o.name, n.name) for o, n in self.renamed]} "
+            f"changed={[c.new.name for c in self.changed]}>"
+        )
+
+    def requires_rebuild(self, dialect: Dialect) -> bool:
+        """Whether table has to be copied into a new one to apply changes"""
+
+        if dialect.name != "sqlite":
+            return False
+        for change in self.changed:
+            if has_column(change.new) and change.attributes - SQLITE_ATTRIBUTES:
+                return True
+        for field in self.added:
+            # sqlite can't add constrained columns or non-null columns without default
+            if has_column(field) and (
+                field.primary_key
+                or field.unique
+                or (not field.nullable and field.default is None)
+            ):
+                return True
+        for field in self.removed:
+            if has_column(field) and (
+                field.primary_key or field.unique or field.type == FieldType.FOREIGN_KEY
+            ):
+                return True
+        # constraints are named after column, sqlite can only rename them by a rebuild
+        return any(
+            has_column(field) and dialect.constraints(field) for _, field in self.renamed
+        )
+
+    def plan(self, dialect: typing.Union[str, Dialect] = "sqlite") -> list[str]:
+        """Statements migrating table, a sqlite rebuild turns foreign keys off meanwhile.
+
+        `PRAGMA foreign_keys` has no effect in a transaction, so sqlite plans of
+        tables referenced by others should run outside of one
+        """
+
+        dialect = get_dialect(dialect)
+        if self.requires_rebuild(dialect):
+            return self.rebuild(dialect)
+
+        table = self.new.name
+        alter = f"ALTER TABLE {dialect.quote(table)} "
+        statements: list[str] = []
+
+        for previous, field in self.renamed:
+            if has_column(field):
+                if previous.index:
+                    statements.append(dialect.drop_index(table, previous))
+                statements.extend(dialect.rename_column(table, previous, field))
+                if field.index:
+                    statements.append(dialect.create_index(table, field))
+            else:
+                statements.extend(self.rename_through(dialect, previous, field))
+
+        for field in self.removed:
+            if has_column(field):
+                if field.index:
+                    statements.append(dialect.drop_index(table, field))
+                statements.append(alter + f"DROP COLUMN {dialect.quote(field.name)}")
+            else:
+                statements.append(dialect.drop_table(through_mapping(self.old, field).name))
+
+        for field in self.added:
+            if has_column(field):
+                statements.append(
+                    alter + "ADD COLUMN " + dialect.column(table, field, catalog=self.catalog)
+                )
+                if field.index and not field.primary_key:
+                    statements.append(dialect.create_index(table, field))
+            else:
+                statements.extend(self.create_through(dialect, field))
+
+        for change in self.changed:
+            if has_column(change.old) and has_column(change.new):
+                statements.extend(self.alter(dialect, change))
+            else:
+                statements.extend(self.replace_relation(dialect, change, in_place=True))
+
+        if any("primary_key" in change.attributes for change in self.changed):
+            statements.extend(self.alter_primary_key(dialect))
+        return statements
+
+    def alter(self, dialect: Dialect, change: FieldChange) -> list[str]:
+        """Statements changing a column in place"""
+
+        old, new, attributes = change
+        table = self.new.name
+        alter = f"ALTER TABLE {dialect.quote(table)} "
+        column = alter + f"ALTER COLUMN {dialect.quote(new.name)} "
+        statements: list[str] = []
+
+        if dialect.name != "sqlite":
+            if attributes & {"type", "max_length"}:
+                column_type = dialect.column_type(new, self.catalog)
+                statements.append(
+                    column + f"TYPE {column_type} "
+                    f"USING CAST({dialect.quote(new.name)} AS {column_type})"
+                )
+            if "autoincrement" in attributes:
+                identity = dialect.identity(new)
+                statements.append(column + ("ADD " + identity if identity else "DROP IDENTITY"))
+            if "nullable" in attributes and not new.primary_key:
+                statements.append(column + ("DROP NOT NULL" if new.nullable else "SET NOT NULL"))
+            if "default" in attributes:
+                if new.default is None:
+                    statements.append(column + "DROP DEFAULT")
+                else:
+                    statements.append(column + "SET DEFAULT " + dialect.literal(new.default))
+            if "unique" in attributes:
+                name = dialect.quote(unique_name(table, new))
+                if new.unique:
+                    statements.append(
+                        alter + f"ADD CONSTRAINT {name} UNIQUE ({dialect.quote(new.name)})"
+                    )
+                else:
+                    statements.append(alter + f"DROP CONSTRAINT {name}")
+            if attributes & {"ge", "le", "choices"}:
+                name = dialect.quote(check_name(table, new))
+                if dialect.check(old):
+                    statements.append(alter + f"DROP CONSTRAINT {name}")
+                check = dialect.check(new)
+                if check:
+                    statements.append(alter + f"ADD CONSTRAINT {name} CHECK ({check})")
+            if attributes & {"type", "tablename"}:
+                name = dialect.quote(foreign_key_name(table, new))
+                if old.type == FieldType.FOREIGN_KEY and old.tablename:
+                    statements.append(alter + f"DROP CONSTRAINT {name}")
+                if new.type == FieldType.FOREIGN_KEY and new.tablename:
+                    statements.append(dialect.add_foreign_key(table, new))
+
+        if "index" in attributes and not new.primary_key:
+            if new.index:
+                statements.append(dialect.create_index(table, new))
+            else:
+                statements.append(dialect.drop_index(table, old))
+        return statements
+
+    def alter_primary_key(self, dialect: Dialect) -> list[str]:
+        alter = f"ALTER TABLE {dialect.quote(self.new.name)} "
+        statements: list[str] = []
+        if any(field.primary_key for field in self.old.fields):
+            # default name of primary key constraint in postgresql
+            statements.append(
+                alter + f"DROP CONSTRAINT {dialect.quote(self.old.name + '_pkey')}"
+            )
+        primary_keys = [field.name for field in self.new.fields if field.primary_key]
+        if primary_keys:
+            statements.append(
+                alter + "ADD PRIMARY KEY (" + ", ".join(map(dialect.quote, primary_keys)) + ")"
+            )
+        return statements
+
+    def create_through(self, dialect: Dialect, field: FieldMapping) -> list[str]:
+        return dialect.create_table(
+            through_mapping(self.new, field), catalog={**self.catalog, self.new.name: self.new}
+        )
+
+    def rename_through(
+        self,
+        dialect: Dialect,
+        previous: FieldMapping,
+        field: FieldMapping,
+    ) -> list[str]:
+        if field.through is not None:
+            return []
+        return [
+            f"ALTER TABLE {dialect.quote(through_mapping(self.old, previous).name)} "
+            f"RENAME TO {dialect.quote(through_mapping(self.new, field).name)}"
+        ]
+
+    def replace_relation(
+        self,
+        dialect: Dialect,
+        change: FieldChange,
+        in_place: bool,
+    ) -> list[str]:
+        """Statements for change involving many-to-many field.
+
+        Columns are only altered in place, rebuilt tables already have them
+        """
+
+        old, new, attributes = change
+        if not has_column(old) and not has_column(new):
+            if not attributes & {"tablename", "through"}:
+                return []
+        alter = f"ALTER TABLE {dialect.quote(self.new.name)} "
+        statements: list[str] = []
+        if not has_column(old):
+            statements.append(dialect.drop_table(through_mapping(self.old, old).name))
+        elif in_place:
+            statements.append(alter + f"DROP COLUMN {dialect.quote(old.name)}")
+        if not has_column(new):
+            statements.extend(self.create_through(dialect, new))
+        elif in_place:
+            statements.append(
+                alter + "ADD COLUMN " + dialect.column(self.new.name, new, catalog=self.catalog)
+            )
+        return statements
+
+    def rebuild(self, dialect: Dialect) -> list[str]:
+        """Copies table into a new one, the way sqlite applies arbitrary changes"""
+
+        table = self.new.name
+        temporary = f"_new_{table}"
+        sources = {field.name: field.name for field in self.old.fields if has_column(field)}
+        for previous, field in self.renamed:
+            sources.pop(previous.name, None)
+            sources[field.name] = previous.name
+        columns = [
+            field.name
+            for field in self.new.fields
+            if has_column(field) and field.name in sources
+        ]
+
+        create_table, *indexes = dialect.create_table(
+            self.new, tablename=temporary, catalog=self.catalog
+        )
+        # dropping the old table would otherwise delete or fail on rows referencing it
+        statements = ["PRAGMA foreign_keys=OFF", create_table]
+        if columns:
+            statements.append(
+                f"INSERT INTO {dialect.quote(temporary)} "
+                f"({', '.join(map(dialect.quote, columns))}) "
+                f"SELECT {', '.join(dialect.quote(sources[c]) for c in columns)} "
+                f"FROM {dialect.quote(table)}"
+            )
+        statements += [
+            dialect.drop_table(table),
+            f"ALTER TABLE {dialect.quote(temporary)} RENAME TO {dialect.quote(table)}",
+            *indexes,
+        ]
+
+        for previous, field in self.renamed:
+            if not has_column(field):
+                statements.extend(self.rename_through(dialect, previous, field))
+        for field in self.removed:
+            if not has_column(field):
+                statements.append(dialect.drop_table(through_mapping(self.old, field).name))
+        for field in self.added:
+            if not has_column(field):
+                statements.extend(self.create_through(dialect, field))
+        for change in self.changed:
+            if not has_column(change.old) or not has_column(change.new):
+                statements.extend(self.replace_relation(dialect, change, in_place=False))
+        statements.append("PRAGMA foreign_keys=ON")
+        return statements
+
+
+class SchemaDiff:
+    """Changes between two catalogs of mappings"""
+
+    def __init__(self, old: Catalog, new: Catalog) -> None:
+        self.old = old
+        self.new = new
+        self.added: list[ModelMapping] = []
+        self.removed: list[ModelMapping] = []
+        self.renamed: list[tuple[ModelMapping, ModelMapping]] = []
+        self.changed: list[TableDiff] = []
+
+        for name, mapping in new.items():
+            previous = old.get(name)
+            if previous is None:
+                self.added.append(mapping)
+            elif previous is not mapping and previous.fingerprint() != mapping.fingerprint():
+                self.changed.append(TableDiff(previous, mapping, new))
+        self.removed = [mapping for name, mapping in old.items() if name not in new]
+
+        for previous, mapping in match_renames(self.removed, self.added):
+            self.removed.remove(previous)
+            self.added.remove(mapping)
+            self.renamed.append((previous, mapping))
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.renamed or self.changed)
+
+    def plan(self, dialect: typing.Union[str, Dialect] = "sqlite") -> list[str]:
+        """Minimal statements migrating old schema to the new one"""
+
+        dialect = get_dialect(dialect)
+        statements: list[str] = []
+
+        for previous, mapping in self.renamed:
+            statements.extend(dialect.rename_table(previous, mapping))
+
+        graph = RelationGraph(self.added)
+        for name in graph.order():
+            mapping = graph.mappings[name]
+            statements.extend(dialect.create_table(mapping, catalog=self.new))
+        for mapping in self.added:
+            for field in mapping.fields:
+                if not has_column(field):
+                    statements.extend(
+                        dialect.create_table(through_mapping(mapping, field), catalog=self.new)
+                    )
+
+        for table in self.changed:
+            statements.extend(table.plan(dialect))
+
+        graph = RelationGraph(self.removed)
+        for name in reversed(graph.order()):
+            mapping = graph.mappings[name]
+            for field in mapping.fields:
+                if not has_column(field):
+                    statements.append(dialect.drop_table(through_mapping(mapping, field).name))
+            statements.append(dialect.drop_table(name))
+        return statements
+
+
+Renamable = typing.TypeVar("Renamable", FieldMapping, ModelMapping)
+
+
+def match_renames(
+    removed: list[Renamable],
+    added: list[Renamable],
+) -> list[tuple[Renamable, Renamable]]:
+    """Pairs removed and added items which are identical apart from name"""
+
+    if not removed or not added:
+        return []
+    shapes: dict[str, list[Renamable]] = {}
+    for item in removed:
+        shapes.setdefault(item.fingerprint(exclude=("name",)), []).append(item)
+    renames: list[tuple[Renamable, Renamable]] = []
+    for item in added:
+        candidates = shapes.get(item.fingerprint(exclude=("name",)))
+        if candidates:
+            renames.append((candidates.pop(0), item))
+    return renames
+
+
+def diff(old: Catalog, new: Catalog) -> SchemaDiff:
+    """Compares catalogs of mappings by tablename"""
+    return SchemaDiff(old, new)
@@ -1,5 +1,6 @@
 import typing
-from orm_bridge.mapping import ModelMapping
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.naming import NamingStrategy
 
 Model = typing.TypeVar("Model")
 
@@ -7,13 +8,133 @@ TableModels = dict[str, typing.Type[Model]]
 TableMappings = dict[str, ModelMapping]
 
 
+class FieldRef(typing.NamedTuple):
+    """Field of a table"""
+
+    tablename: str
+    field: FieldMapping
+
+
+class Through(typing.NamedTuple):
+    """Tables joined by many-to-many field of `source` table"""
+
+    source: str
+    target: str
+    field: FieldMapping
+
+
+def through_name(tablename: str, field: FieldMapping) -> str:
+    """Name of the table joining many-to-many relation, unless it is explicit"""
+    return field.through or f"{tablename}_{field.name}"
+
+
 class Environment(typing.Generic[Model]):
     def __init__(
         self,
         table_mappings: typing.Optional[TableMappings] = None,
         table_models: typing.Optional[TableModels] = None,
+        naming: typing.Optional[NamingStrategy] = None,
         **options,
     ):
         self.table_models: TableModels = table_models or {}
-        self.table_mappings: TableMappings = table_mappings or {}
+        self.table_mappings: TableMappings = {}
         self.options = options
+        self._naming = naming
+        self._naming_given = naming is not None
+        # `tortoise_names` option object the strategy was built from
+        self._naming_names: typing.Optional[dict[str, str]] = None
+
+        # relation indexes, maintained by register_mapping
+        self.references: dict[str, list[FieldRef]] = {}
+        self.throughs: dict[str, Through] = {}
+        self.related_names: dict[tuple[str, str], FieldRef] = {}
+        for mapping in (table_mappings or {}).values():
+            self.register_mapping(mapping)
+
+    @property
+    def naming(self) -> NamingStrategy:
+        """Naming strategy, built from `tortoise_names` option unless given.
+
+        Built strategy is rebuilt once the option is replaced, changes made to
+        the option in place need `set_tortoise_names`
+        """
+
+        if self._naming_given:
+            return self._naming  # type: ignore
+        names = self.options.get("tortoise_names")
+        if self._naming is None or names is not self._naming_names:
+            self._naming = NamingStrategy(names)
+            self._naming_names = names
+        return self._naming
+
+    def set_tortoise_names(self, names: typing.Optional[dict[str, str]]) -> None:
+        """Replaces `tortoise_names` option, naming strategy built from it is rebuilt"""
+
+        if names is None:
+            self.options.pop("tortoise_names", None)
+        else:
+            self.options["tortoise_names"] = names
+        if not self._naming_given:
+            self._naming = None
+
+    def register_mapping(self, mapping: ModelMapping) -> None:
+        """Adds mapping by tablename and indexes its relations, replacing previous one"""
+
+        previous = self.table_mappings.get(mapping.name)
+        if previous is mapping:
+            return
+        if previous is not None:
+            self.unregister_mapping(mapping.name)
+        self.table_mappings[mapping.name] = mapping
+
+        for field in mapping.fields:
+            if field.tablename is None:
+                continue
+            if field.type == FieldType.FOREIGN_KEY:
+                self.references.setdefault(field.tablename, []).append(
+                    FieldRef(mapping.name, field)
+                )
+            elif field.type == FieldType.MANY2MANY:
+                self.throughs[through_name(mapping.name, field)] = Through(
+                    mapping.name, field.tablename, field
+                )
+            else:
+                continue
+            if field.related_name:
+                self.related_names[field.tablename, field.related_name] = FieldRef(
+                    mapping.name, field
+                )
+
+    def unregister_mapping(self, tablename: str) -> None:
+        mapping = self.table_mappings.pop(tablename, None)
+        if mapping is None:
+            return
+        for field in mapping.fields:
+            if field.tablename is None:
+                continue
+            if field.type == FieldType.FOREIGN_KEY:
+                references = self.references.get(field.tablename, [])
+                references[:] = [ref for ref in references if ref.tablename != tablename]
+                if not references:
+                    self.references.pop(field.tablename, None)
+            elif field.type == FieldType.MANY2MANY:
+                self.throughs.pop(through_name(tablename, field), None)
+            key = (field.tablename, field.related_name or "")
+            if key in self.related_names and self.related_names[key].tablename == tablename:
+                del self.related_names[key]
+
+    def register_model(self, mapping: ModelMapping, model: typing.Type[Model]) -> None:
+        self.register_mapping(mapping)
+        self.table_models[mapping.name] = model
+
+    def referencing(self, tablename: str) -> tuple[FieldRef, ...]:
+        """Foreign key fields referencing table"""
+        return tuple(self.references.get(tablename, ()))
+
+    def get_through(self, tablename: str) -> typing.Optional[Through]:
+        """Endpoints of many-to-many relation joined by table"""
+        return self.throughs.get(tablename)
+
+    def get_related(self, tablename: str, related_name: str) -> typing.Optional[FieldRef]:
+        """Relation field whose reverse side on table is called related_name"""
+        return self.related_names.get((tablename, related_name))
@@ -31,3 +31,29 @@ class FieldBridgeError(BridgeError):
 
     def __str__(self) -> str:
         return f"Can't bridge field `{self.field_name}` " + (self.details or "")
+
+
+class TranslationCollision(BridgeError):
+    def __init__(self, key: str, models: list[typing.Any]) -> None:
+        self.key = key
+        self.models = models
+
+    def __str__(self) -> str:
+        return f"`{self.key}` is ambiguous between translated models " + ", ".join(
+            map(repr, self.models)
+        )
+
+
+class NamingConflict(BridgeError):
+    def __init__(self, tablename: str, names: list[str]) -> None:
+        self.tablename = tablename
+        self.names = names
+
+    def __str__(self) -> str:
+        return f"Table `{self.tablename}` is claimed by several models: " + ", ".join(
+            self.names
+        )
+
+
+class SnapshotError(BridgeError):
+    pass
@@ -0,0 +1,151 @@
+import concurrent.futures
+import importlib
+import os
+import typing
+
+from orm_bridge.bridge import Bridge
+from orm_bridge.environment import Environment
+from orm_bridge.errors import MappingError
+from orm_bridge.mapping import ModelMapping, ModelRecord
+from orm_bridge.persist import MappingCache
+
+
+class ExtractionFailure(typing.NamedTuple):
+    """Error of importing a module or getting mapping of one of its models"""
+
+    path: str
+    error: str
+
+
+class Extracted(typing.NamedTuple):
+    """Mapping of a model as sent back from a worker, with modules defining its bases"""
+
+    path: str
+    record: ModelRecord
+    bases: tuple[str, ...] = ()
+
+
+class Extraction:
+    """Mappings extracted from modules by tablename, along with failures"""
+
+    def __init__(self) -> None:
+        self.mappings: dict[str, ModelMapping] = {}
+        self.models: dict[str, str] = {}
+        self.failures: list[ExtractionFailure] = []
+
+    def add(self, extracted: Extracted) -> None:
+        mapping = extracted.record.to_mapping()
+        if mapping.name in self.models:
+            self.failures.append(
+                ExtractionFailure(
+                    extracted.path,
+                    f"Table `{mapping.name}` is already mapped by {self.models[mapping.name]}",
+                )
+            )
+            return
+        self.mappings[mapping.name] = mapping
+        self.models[mapping.name] = extracted.path
+
+    def check(self) -> None:
+        """Raises if any model failed"""
+
+        if self.failures:
+            raise MappingError(
+                f"{len(self.failures)} models failed: "
+                + "; ".join(f"{path}: {error}" for path, error in self.failures)
+            )
+
+
+def extract_module(
+    bridge_cls: typing.Type[Bridge],
+    path: str,
+    options: typing.Optional[dict[str, typing.Any]] = None,
+) -> list[typing.Union[Extracted, ExtractionFailure]]:
+    """Imports `module` or `module:Model` path and gets mappings of its models.
+
+    Runs in worker processes, errors are sent back as text
+    """
+
+    module_name, _, model_name = path.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+        if model_name:
+            models = [getattr(module, model_name)]
+        else:
+            models = bridge_cls.discover_models(module)
+    except Exception as e:
+        return [ExtractionFailure(path, f"{type(e).__name__}: {e}")]
+
+    bridge = bridge_cls(Environment(**(options or {})))
+    results: list[typing.Union[Extracted, ExtractionFailure]] = []
+    for model in models:
+        model_path = f"{module_name}:{model.__qualname__}"
+        bases = {base.__module__ for base in model.__mro__} - {module_name, "builtins"}
+        try:
+            record = ModelRecord.from_mapping(bridge.get_mapping(model))
+        except Exception as e:
+            results.append(ExtractionFailure(model_path, f"{type(e).__name__}: {e}"))
+        else:
+            results.append(Extracted(model_path, record, tuple(sorted(bases))))
+    return results
+
+
+def extract_mappings(
+    bridge_cls: typing.Type[Bridge],
+    paths: typing.Iterable[str],
+    environment: typing.Optional[Environment] = None,
+    workers: typing.Optional[int] = None,
+    cache: typing.Optional[MappingCache] = None,
+) -> Extraction:
+    """Extracts mappings of models in modules over a process pool.
+
+    Modules are imported by the workers, mappings are merged into
+    `environment.table_mappings` in order of paths and models within a module,
+    so the result does not depend on the number of workers.
+    A table mapped twice is a failure of the later model.
+    Paths found in `cache` are neither imported nor introspected, modules
+    extracted without failures are saved to it
+    """
+
+    paths = list(paths)
+    options = environment.options if environment is not None else {}
+    cached: dict[str, list[Extracted]] = {}
+    if cache is not None:
+        for path in paths:
+            entry = cache.load(bridge_cls, path, options)
+            if entry is not None:
+                cached[path] = entry
+    missing = [path for path in paths if path not in cached]
+    workers = min(workers or os.cpu_count() or 1, len(missing) or 1)
+
+    if workers == 1:
+        extracted = [extract_module(bridge_cls, path, options) for path in missing]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            extracted = list(
+                pool.map(
+                    extract_module,
+                    [bridge_cls] * len(missing),
+                    missing,
+                    [options] * len(missing),
+                )
+            )
+
+    fresh = dict(zip(missing, extracted))
+    if cache is not None:
+        for path, module_results in fresh.items():
+            if all(isinstance(result, Extracted) for result in module_results):
+                cache.store(bridge_cls, path, module_results, options)  # type: ignore
+    results = [cached[path] if path in cached else fresh[path] for path in paths]
+
+    extraction = Extraction()
+    for module_results in results:
+        for result in module_results:
+            if isinstance(result, Extracted):
+                extraction.add(result)
+            else:
+                extraction.failures.append(result)
+    if environment is not None:
+        for mapping in extraction.mappings.values():
+            environment.register_mapping(mapping)
+    return extraction
@@ -0,0 +1,102 @@
+import heapq
+import typing
+
+from orm_bridge.errors import MappingError
+from orm_bridge.mapping import FieldType, ModelMapping
+
+
+class RelationGraph:
+    """Graph of tables linked by foreign key and many-to-many fields"""
+
+    def __init__(self, mappings: typing.Iterable[ModelMapping] = ()) -> None:
+        self.mappings: dict[str, ModelMapping] = {}
+        for mapping in mappings:
+            self.add(mapping)
+
+    def add(self, mapping: ModelMapping) -> None:
+        if mapping.name in self.mappings:
+            raise MappingError(f"Table `{mapping.name}` is mapped more than once")
+        self.mappings[mapping.name] = mapping
+
+    @staticmethod
+    def references(mapping: ModelMapping) -> list[str]:
+        """Tables referenced by foreign key and many-to-many fields of mapping"""
+        return [
+            field.tablename
+            for field in mapping.fields
+            if field.type in (FieldType.FOREIGN_KEY, FieldType.MANY2MANY)
+            and field.tablename is not None
+        ]
+
+    def dependencies(self) -> dict[str, list[str]]:
+        """Tables each table depends on, limited to tables of the graph.
+
+        Through tables of many-to-many relations depend on both endpoints
+        """
+        dependencies: dict[str, list[str]] = {name: [] for name in self.mappings}
+        for name, mapping in self.mappings.items():
+            for tablename in self.references(mapping):
+                if tablename in self.mappings and tablename != name:
+                    dependencies[name].append(tablename)
+            for field in mapping.fields:
+                if field.type != FieldType.MANY2MANY or field.through not in self.mappings:
+                    continue
+                through = dependencies[field.through]  # type: ignore
+                through.extend(
+                    t for t in (name, field.tablename) if t in self.mappings
+                )
+        return dependencies
+
+    def order(self) -> list[str]:
+        """Tables ordered so dependencies come first.
+
+        Ties keep insertion order, tables in cycles are appended in insertion order
+        """
+        position = {name: i for i, name in enumerate(self.mappings)}
+        dependents: dict[str, list[str]] = {name: [] for name in self.mappings}
+        pending: dict[str, int] = {}
+        for name, dependencies in self.dependencies().items():
+            unique = set(dependencies)
+            pending[name] = len(unique)
+            for dependency in unique:
+                dependents[dependency].append(name)
+
+        ready = [position[name] for name, count in pending.items() if not count]
+        heapq.heapify(ready)
+        names = list(self.mappings)
+        ordered: list[str] = []
+        while ready:
+            name = names[heapq.heappop(ready)]
+            ordered.append(name)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    heapq.heappush(ready, position[dependent])
+
+        if len(ordered) < len(names):
+            done = set(ordered)
+            ordered.extend(name for name in names if name not in done)
+        return ordered
+
+    def components(self) -> list[list[str]]:
+        """Independent groups of related tables, each in dependency order"""
+        parent = {name: name for name in self.mappings}
+
+        def find(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        for name, dependencies in self.dependencies().items():
+            for dependency in dependencies:
+                parent[find(dependency)] = find(name)
+
+        first: dict[str, int] = {}
+        for i, name in enumerate(self.mappings):
+            first.setdefault(find(name), i)
+
+        components: dict[str, list[str]] = {}
+        for name in self.order():
+            components.setdefault(find(name), []).append(name)
+        return [components[root] for root in sorted(components, key=first.__getitem__)]
@@ -0,0 +1,147 @@
+import collections
+import json
+import threading
+import time
+import typing
+
+from orm_bridge.mapping import FieldType
+
+INTROSPECTION = "introspection"
+FIELD_BRIDGING = "field_bridging"
+CLASS_CREATION = "class_creation"
+TRANSLATION = "translation"
+
+
+class Measurement(typing.NamedTuple):
+    """Duration of a phase for a model or a field"""
+
+    phase: str
+    duration: float
+    model: typing.Optional[str] = None
+    field_type: typing.Optional[FieldType] = None
+    bridge: typing.Optional[str] = None
+    fields: typing.Optional[int] = None
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        data = self._asdict()
+        if self.field_type is not None:
+            data["field_type"] = self.field_type.value
+        return {key: value for key, value in data.items() if value is not None}
+
+
+Sink = typing.Callable[[Measurement], None]
+
+
+class Instrumentation:
+    """Sends measurements of bridges and translators to sinks.
+
+    Bridges and translators without instrumentation are not measured at all
+    """
+
+    def __init__(self, *sinks: Sink) -> None:
+        self.sinks = list(sinks)
+        self._local = threading.local()
+
+    def emit(self, measurement: Measurement) -> None:
+        for sink in self.sinks:
+            sink(measurement)
+
+    def field_time(self) -> float:
+        """Time spent bridging fields by the current thread so far"""
+        return getattr(self._local, "field_time", 0.0)
+
+    def add_field_time(self, duration: float) -> None:
+        self._local.field_time = self.field_time() + duration
+
+
+class Stats(typing.NamedTuple):
+    count: int
+    total: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Collector:
+    """In-memory sink aggregating measurements"""
+
+    def __init__(self) -> None:
+        self.measurements: list[Measurement] = []
+        self.phases: dict[str, Stats] = {}
+        self.field_types: dict[FieldType, Stats] = {}
+        self.field_bridges: dict[str, Stats] = {}
+        self.models: dict[str, Stats] = {}
+        self.fields_histogram: collections.Counter[int] = collections.Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, measurement: Measurement) -> None:
+        with self._lock:
+            self.measurements.append(measurement)
+            self._add(self.phases, measurement.phase, measurement.duration)
+            if measurement.field_type is not None:
+                self._add(self.field_types, measurement.field_type, measurement.duration)
+            if measurement.bridge is not None:
+                self._add(self.field_bridges, measurement.bridge, measurement.duration)
+            if measurement.model is not None and measurement.phase != TRANSLATION:
+                self._add(self.models, measurement.model, measurement.duration)
+            if measurement.fields is not None and measurement.phase == INTROSPECTION:
+                self.fields_histogram[measurement.fields] += 1
+
+    @staticmethod
+    def _add(stats: dict, key: typing.Any, duration: float) -> None:
+        count, total = stats.get(key, (0, 0.0))
+        stats[key] = Stats(count + 1, total + duration)
+
+    def slowest_models(self, top: int = 10) -> list[tuple[str, Stats]]:
+        return sorted(self.models.items(), key=lambda item: -item[1].total)[:top]
+
+    def slowest_field_bridges(self, top: int = 10) -> list[tuple[str, Stats]]:
+        return sorted(self.field_bridges.items(), key=lambda item: -item[1].mean)[:top]
+
+    def report(self, top: int = 10) -> str:
+        lines = ["phase                  count      total ms"]
+        for phase, stats in self.phases.items():
+            lines.append(f"{phase:<20} {stats.count:>7} {stats.total * 1e3:>13.3f}")
+        lines.append("")
+        lines.append("slowest models         count      total ms")
+        for model, stats in self.slowest_models(top):
+            lines.append(f"{model:<20} {stats.count:>7} {stats.total * 1e3:>13.3f}")
+        lines.append("")
+        lines.append("slowest field bridges  count       mean us")
+        for bridge, stats in self.slowest_field_bridges(top):
+            lines.append(f"{bridge:<20} {stats.count:>7} {stats.mean * 1e6:>13.3f}")
+        lines.append("")
+        lines.append("fields per model       models")
+        for fields, models in sorted(self.fields_histogram.items()):
+            lines.append(f"{fields:<20} {models:>7}")
+        return "\n".join(lines)
+
+
+class JSONSink:
+    """Writes measurements to a file as JSON lines"""
+
+    def __init__(self, file: typing.TextIO) -> None:
+        self.file = file
+        self._lock = threading.Lock()
+
+    def __call__(self, measurement: Measurement) -> None:
+        line = json.dumps(measurement.to_dict())
+        with self._lock:
+            self.file.write(line + "\n")
+
+
+def timed(
+    instrumentation: Instrumentation,
+    call: typing.Callable,
+    make: typing.Callable[[float, typing.Any, tuple], Measurement],
+) -> typing.Callable:
+    """Wraps call to emit measurement built from duration, result and arguments"""
+
+    def wrapper(*args: typing.Any) -> typing.Any:
+        start = time.perf_counter()
+        result = call(*args)
+        instrumentation.emit(make(time.perf_counter() - start, result, args))
+        return result
+
+    return wrapper
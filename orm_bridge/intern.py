@@ -0,0 +1,139 @@
+import threading
+import typing
+import weakref
+
+from orm_bridge.mapping import FieldMapping, ModelMapping, Value
+
+
+class InternedField(FieldMapping):
+    """Immutable field mapping shared by structurally identical fields"""
+
+    __slots__ = ("__weakref__",)
+
+    class Config:
+        allow_mutation = False
+
+
+class InternedModel(ModelMapping):
+    """Immutable model mapping made of interned fields, its list of fields must not change"""
+
+    __slots__ = ("__weakref__",)
+
+    class Config:
+        allow_mutation = False
+
+
+class InternInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    fields: int
+    models: int
+    choices: int
+
+
+class Interner:
+    """Table of shared mappings and choices, weak so unused ones are dropped.
+
+    Values are compared along with their types, so `1`, `1.0` and `True`
+    stay apart. Fields with unhashable values are not interned
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._choices: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._fields: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._models: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def _get(self, table: weakref.WeakValueDictionary, key: typing.Hashable) -> typing.Any:
+        value = table.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def intern_choices(self, choices: typing.AbstractSet[Value]) -> frozenset:
+        """Shared frozen set equal to choices"""
+
+        key = frozenset(_typed(choice) for choice in choices)
+        with self._lock:
+            interned = self._get(self._choices, key)
+            if interned is None:
+                interned = self._choices[key] = frozenset(choices)
+        return interned
+
+    def intern_field(self, field: FieldMapping) -> FieldMapping:
+        """Shared field equal to field, field itself if it has unhashable values"""
+
+        if isinstance(field, InternedField):
+            return field
+        values = dict(field.__dict__)
+        if values["choices"] is not None:
+            values["choices"] = self.intern_choices(values["choices"])
+        key = tuple(_typed(value) for value in values.values())
+        try:
+            hash(key)
+        except TypeError:
+            return field
+        with self._lock:
+            interned = self._get(self._fields, key)
+            if interned is None:
+                interned = InternedField.trusted(**values)
+                # only values set on field are set on the shared one
+                object.__setattr__(interned, "__fields_set__", set(field.__fields_set__))
+                self._fields[key] = interned
+        return interned
+
+    def intern_mapping(self, mapping: ModelMapping) -> ModelMapping:
+        """Shared model equal to mapping, made of shared fields"""
+
+        if isinstance(mapping, InternedModel):
+            return mapping
+        fields = [self.intern_field(field) for field in mapping.fields]
+        # interned fields live as long as the model, so their ids are stable keys
+        key = (mapping.name, tuple(map(id, fields)))
+        with self._lock:
+            interned = self._get(self._models, key)
+            if interned is None:
+                interned = self._models[key] = InternedModel.trusted(mapping.name, fields)
+        return interned
+
+    def intern_catalog(self, mappings: typing.Iterable[ModelMapping]) -> list[ModelMapping]:
+        return [self.intern_mapping(mapping) for mapping in mappings]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._choices.clear()
+            self._fields.clear()
+            self._models.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> InternInfo:
+        return InternInfo(
+            self.hits, self.misses, len(self._fields), len(self._models), len(self._choices)
+        )
+
+
+INTERNER = Interner()
+
+
+def intern_field(field: FieldMapping) -> FieldMapping:
+    return INTERNER.intern_field(field)
+
+
+def intern_mapping(mapping: ModelMapping) -> ModelMapping:
+    return INTERNER.intern_mapping(mapping)
+
+
+def intern_catalog(mappings: typing.Iterable[ModelMapping]) -> list[ModelMapping]:
+    """Mappings sharing identical fields and choices, see `Interner`"""
+    return INTERNER.intern_catalog(mappings)
+
+
+def _typed(value: Value) -> typing.Any:
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(map(_typed, value))
+    return type(value), value
@@ -0,0 +1,85 @@
+import threading
+import typing
+
+from orm_bridge.environment import Environment
+from orm_bridge.graph import RelationGraph
+from orm_bridge.mapping import ModelMapping
+
+Model = typing.TypeVar("Model")
+
+
+class LazyModel(typing.Generic[Model]):
+    """Stands in for a model until it is first used.
+
+    Attribute access or instantiation builds the model once, after the models
+    it references in the environment. Related proxies share a reentrant lock,
+    so a relation cycle is built by a single thread
+    """
+
+    __slots__ = ("mapping", "environment", "_factory", "_lock", "_model", "_building")
+
+    def __init__(
+        self,
+        mapping: ModelMapping,
+        factory: typing.Callable[[ModelMapping], typing.Type[Model]],
+        environment: Environment,
+        lock: typing.Optional[threading.RLock] = None,
+    ) -> None:
+        self.mapping = mapping
+        self.environment = environment
+        self._factory = factory
+        self._lock = lock or threading.RLock()
+        self._model: typing.Optional[typing.Type[Model]] = None
+        self._building = False
+
+    @property
+    def materialized(self) -> bool:
+        return self._model is not None
+
+    def materialize(self) -> typing.Type[Model]:
+        model = self._model
+        if model is not None:
+            return model
+
+        with self._lock:
+            if self._model is not None:
+                return self._model
+            if self._building:
+                raise RecursionError(f"Model of `{self.mapping.name}` is being built")
+            self._building = True
+            try:
+                for tablename in RelationGraph.references(self.mapping):
+                    dependency = self.environment.table_models.get(tablename)
+                    if not isinstance(dependency, LazyModel):
+                        continue
+                    # a cycle is closed by the proxy this thread is already building
+                    if dependency._lock is self._lock and dependency._building:
+                        continue
+                    dependency.materialize()
+                self._model = self._factory(self.mapping)
+            finally:
+                self._building = False
+
+        # proxy is no longer needed for lookups through the environment
+        table_models = self.environment.table_models
+        if table_models.get(self.mapping.name) is self:
+            table_models[self.mapping.name] = self._model
+        return self._model
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.materialize(), name)
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> Model:
+        return self.materialize()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = repr(self._model) if self._model is not None else "pending"
+        return f"<LazyModel {self.mapping.name} {state}>"
+
+
+def materialize(model: typing.Any) -> typing.Any:
+    """Model behind a proxy, other values are returned as is"""
+
+    if isinstance(model, LazyModel):
+        return model.materialize()
+    return model
@@ -1,4 +1,5 @@
 import enum
+import hashlib
 import typing
 
 import pydantic
@@ -36,7 +37,156 @@ class FieldMapping(pydantic.BaseModel):
     skip_reverse: bool = False
     through: typing.Optional[str] = None
 
+    # fingerprint of trusted mappings, computed on first use
+    __slots__ = ("_fingerprint",)
+
+    @classmethod
+    def trusted(cls, **values: Value) -> "FieldMapping":
+        """Builds mapping from already valid values skipping validation.
+
+        Values must have exact types: `choices` should be a set, `type` a FieldType.
+        Its fingerprint is kept once computed, so `choices` must not be changed in place
+        """
+        mapping = cls.__new__(cls)
+        object.__setattr__(mapping, "__dict__", {**_FIELD_DEFAULTS, **values})
+        object.__setattr__(mapping, "__fields_set__", set(values))
+        object.__setattr__(mapping, "_fingerprint", None)
+        return mapping
+
+    def __setattr__(self, name: str, value: Value) -> None:
+        super().__setattr__(name, value)
+        _forget_fingerprint(self)
+
+    def fingerprint(self, exclude: typing.Collection[str] = ()) -> str:
+        """Stable structural hash of the field definition"""
+
+        if not exclude:
+            fingerprint = getattr(self, "_fingerprint", None)
+            if fingerprint is not None:
+                return fingerprint
+        fingerprint = _digest(
+            repr(
+                tuple(
+                    _canonical(getattr(self, name))
+                    for name in self.__fields__
+                    if name not in exclude
+                )
+            )
+        )
+        if not exclude:
+            _remember_fingerprint(self, fingerprint)
+        return fingerprint
+
 
 class ModelMapping(pydantic.BaseModel):
     name: str
     fields: list[FieldMapping]
+
+    # fingerprint of trusted mappings with the field fingerprints it was made of,
+    # fields may be changed in place so it is checked against them on each use
+    __slots__ = ("_fingerprint",)
+
+    @classmethod
+    def trusted(cls, name: str, fields: list[FieldMapping]) -> "ModelMapping":
+        """Builds mapping from trusted field mappings skipping validation"""
+        mapping = cls.__new__(cls)
+        object.__setattr__(mapping, "__dict__", {"name": name, "fields": fields})
+        object.__setattr__(mapping, "__fields_set__", {"name", "fields"})
+        object.__setattr__(mapping, "_fingerprint", None)
+        return mapping
+
+    def __setattr__(self, name: str, value: Value) -> None:
+        super().__setattr__(name, value)
+        _forget_fingerprint(self)
+
+    def fingerprint(self, exclude: typing.Collection[str] = ()) -> str:
+        """Stable structural hash of the model definition, equal for identical mappings"""
+
+        fields = tuple(field.fingerprint() for field in self.fields)
+        if not exclude:
+            remembered = getattr(self, "_fingerprint", None)
+            if remembered is not None and remembered[0] == fields:
+                return remembered[1]
+        fingerprint = _digest(repr((None if "name" in exclude else self.name, fields)))
+        if not exclude:
+            _remember_fingerprint(self, (fields, fingerprint))
+        return fingerprint
+
+
+_FIELD_DEFAULTS: dict[str, Value] = {
+    name: field.default for name, field in FieldMapping.__fields__.items()
+}
+
+
+class FieldRecord(typing.NamedTuple):
+    """Compact immutable form of FieldMapping for large catalogs"""
+
+    type: FieldType
+    name: str
+    nullable: bool = False
+    choices: typing.Optional[frozenset[Value]] = None
+    default: typing.Optional[Value] = None
+    primary_key: bool = False
+    max_length: int = 255
+    ge: typing.Optional[Number] = None
+    le: typing.Optional[Number] = None
+    autoincrement: bool = False
+    unique: bool = False
+    index: bool = False
+    tablename: typing.Optional[str] = None
+    related_name: typing.Optional[str] = None
+    skip_reverse: bool = False
+    through: typing.Optional[str] = None
+
+    @classmethod
+    def from_mapping(cls, mapping: FieldMapping) -> "FieldRecord":
+        values = mapping.__dict__
+        choices = values["choices"]
+        return cls(
+            **{**values, "choices": frozenset(choices) if choices is not None else None}
+        )
+
+    def to_mapping(self) -> FieldMapping:
+        values = self._asdict()
+        if self.choices is not None:
+            values["choices"] = set(self.choices)
+        return FieldMapping.trusted(**values)
+
+
+class ModelRecord(typing.NamedTuple):
+    """Compact immutable form of ModelMapping"""
+
+    name: str
+    fields: tuple[FieldRecord, ...]
+
+    @classmethod
+    def from_mapping(cls, mapping: ModelMapping) -> "ModelRecord":
+        return cls(mapping.name, tuple(map(FieldRecord.from_mapping, mapping.fields)))
+
+    def to_mapping(self) -> ModelMapping:
+        return ModelMapping.trusted(
+            self.name, [field.to_mapping() for field in self.fields]
+        )
+
+
+def _canonical(value: Value) -> Value:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(map(repr, value)))
+    return value
+
+
+def _remember_fingerprint(mapping: pydantic.BaseModel, fingerprint: Value) -> None:
+    # only trusted mappings have the slot set, validated ones are hashed on every call
+    if hasattr(mapping, "_fingerprint"):
+        object.__setattr__(mapping, "_fingerprint", fingerprint)
+
+
+def _forget_fingerprint(mapping: pydantic.BaseModel) -> None:
+    if hasattr(mapping, "_fingerprint"):
+        object.__setattr__(mapping, "_fingerprint", None)
+
+
+def _digest(data: str) -> str:
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
@@ -0,0 +1,70 @@
+import hashlib
+import typing
+
+from orm_bridge.errors import NamingConflict
+
+
+class NamingStrategy:
+    """Resolves ORM model names from tablenames and back.
+
+    Explicit names are kept in a bidirectional index, other names are guessed
+    by pluralization rules
+    """
+
+    def __init__(self, names: typing.Optional[dict[str, str]] = None) -> None:
+        self.names: dict[str, str] = {}
+        self.tablenames: dict[str, str] = {}
+        # guessed names, memoized for the lifetime of the strategy
+        self._plurals: dict[str, str] = {}
+        self._singulars: dict[str, str] = {}
+        for name, tablename in (names or {}).items():
+            self.register(name, tablename)
+
+    def register(self, name: str, tablename: str) -> None:
+        """Binds ORM model name to tablename, raises if table is already bound"""
+
+        owner = self.tablenames.get(tablename)
+        if owner is not None and owner != name:
+            raise NamingConflict(tablename, [owner, name])
+        previous = self.names.get(name)
+        if previous is not None and previous != tablename:
+            del self.tablenames[previous]
+        self.names[name] = tablename
+        self.tablenames[tablename] = name
+
+    def get_tablename(self, name: str) -> str:
+        tablename = self.names.get(name)
+        if tablename is None:
+            return self.pluralize(name)
+        return tablename
+
+    def get_name(self, tablename: str) -> str:
+        name = self.tablenames.get(tablename)
+        if name is None:
+            return self.singularize(tablename)
+        return name
+
+    def pluralize(self, name: str) -> str:
+        tablename = self._plurals.get(name)
+        if tablename is None:
+            tablename = self._plurals[name] = name.split(".")[-1].lower() + "s"
+        return tablename
+
+    def singularize(self, tablename: str) -> str:
+        name = self._singulars.get(tablename)
+        if name is None:
+            if tablename.endswith("ies"):
+                name = tablename.removesuffix("ies") + "y"
+            elif tablename.endswith("sses"):
+                name = tablename.removesuffix("es")
+            else:
+                name = tablename.removesuffix("s")
+            name = self._singulars[tablename] = name.capitalize()
+        return name
+
+
+def enum_name(choices: typing.Iterable[typing.Any]) -> str:
+    """Stable name of enum generated for choices"""
+
+    values = sorted(choices, key=repr)
+    return "Choices_" + hashlib.blake2b(repr(values).encode(), digest_size=4).hexdigest()
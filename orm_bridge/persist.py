@@ -0,0 +1,261 @@
+import glob
+import hashlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import tempfile
+import types
+import typing
+
+from orm_bridge import snapshot
+from orm_bridge.errors import SnapshotError
+from orm_bridge.mapping import ModelMapping, ModelRecord
+
+if typing.TYPE_CHECKING:
+    from orm_bridge.bridge import Bridge
+    from orm_bridge.extract import Extracted
+
+# bumped when cached entries stop matching what extraction produces
+CACHE_VERSION = 2
+
+
+def package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        module = sys.modules.get(name.replace("-", "_"))
+        return str(getattr(module, "__version__", "unknown"))
+
+
+def orm_versions(bridge_cls: typing.Type["Bridge"]) -> list[tuple[str, str]]:
+    """Versions of packages defining field types the bridge translates"""
+
+    packages = {field_type.__module__.split(".")[0] for field_type in bridge_cls.field_types}
+    return sorted(
+        (package, str(getattr(sys.modules.get(package), "__version__", "unknown")))
+        for package in packages
+    )
+
+
+def source_digest(path: str) -> typing.Optional[str]:
+    """Hash of source of module in `module` or `module:Model` path, None if it has no file.
+
+    Only the module itself is hashed, cache entries check modules of model bases apart
+    """
+
+    module_name = path.partition(":")[0]
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.has_location or spec.origin is None:
+        return None
+    try:
+        with open(spec.origin, "rb") as file:
+            return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def stable_value(value: typing.Any) -> typing.Any:
+    """JSON form of option values whose repr differs between processes.
+
+    Functions and classes are named by their qualified name, lambdas, local
+    definitions and other objects are rejected
+    """
+
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType, type)):
+        if "<" not in value.__qualname__:
+            return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"Option value {value!r} has no stable form")
+
+
+class MappingCache:
+    """Directory of mappings extracted from modules, kept across processes.
+
+    An entry holds mappings of one module path in snapshot format and a JSON
+    manifest with model paths and fingerprints. It is keyed by hash of module
+    source, bridge, environment options and versions of orm-bridge and the ORM,
+    so any change misses the cache. Sources of modules defining bases of the models
+    are checked against the manifest on load. Files are written to temporary names and
+    moved into place, the manifest last, so concurrent workers never read a
+    partial entry. Entries failing to load or fingerprint check are removed
+    """
+
+    def __init__(self, directory: typing.Union[str, os.PathLike]) -> None:
+        self.directory = os.fspath(directory)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(
+        self,
+        bridge_cls: typing.Type["Bridge"],
+        path: str,
+        options: typing.Optional[dict[str, typing.Any]] = None,
+    ) -> typing.Optional[str]:
+        """Key of entry of path, None if it can't be keyed.
+
+        Modules without source to hash and options without a stable form aren't cached
+        """
+
+        digest = source_digest(path)
+        if digest is None:
+            return None
+        try:
+            encoded_options = json.dumps(options or {}, sort_keys=True, default=stable_value)
+        except TypeError:
+            return None
+        bridge_module = sys.modules[bridge_cls.__module__]
+        with open(inspect.getfile(bridge_module), "rb") as file:
+            bridge_digest = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+        parts = [
+            CACHE_VERSION,
+            snapshot.VERSION,
+            package_version("orm-bridge"),
+            f"{bridge_cls.__module__}.{bridge_cls.__qualname__}",
+            bridge_digest,
+            orm_versions(bridge_cls),
+            path,
+            digest,
+            encoded_options,
+        ]
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+    def _prefix(self, bridge_cls: typing.Type["Bridge"], path: str) -> str:
+        name = f"{bridge_cls.__name__}-{path.replace(':', '-')}"
+        return os.path.join(self.directory, name)
+
+    def _files(self, prefix: str, key: str) -> tuple[str, str]:
+        # module names have no `@`, so entries of `a.b` never match those of `a.b.c`
+        return f"{prefix}@{key}.json", f"{prefix}@{key}.snapshot"
+
+    def load(
+        self,
+        bridge_cls: typing.Type["Bridge"],
+        path: str,
+        options: typing.Optional[dict[str, typing.Any]] = None,
+    ) -> typing.Optional[list["Extracted"]]:
+        """Cached mappings of models of path, None on a miss"""
+
+        from orm_bridge.extract import Extracted
+
+        key = self.key(bridge_cls, path, options)
+        if key is None:
+            self.misses += 1
+            return None
+        manifest_file, snapshot_file = self._files(self._prefix(bridge_cls, path), key)
+        try:
+            with open(manifest_file) as file:
+                manifest = json.load(file)
+            with open(snapshot_file, "rb") as file:
+                mappings = snapshot.Snapshot(file.read())
+            for module_name, digest in manifest["bases"].items():
+                if source_digest(module_name) != digest:
+                    raise SnapshotError(f"Module `{module_name}` of model bases has changed")
+            extracted = []
+            for model_path, tablename, fingerprint, bases in manifest["models"]:
+                mapping = mappings[tablename]
+                if mapping.fingerprint() != fingerprint:
+                    raise SnapshotError(f"Fingerprint of `{tablename}` does not match")
+                extracted.append(
+                    Extracted(model_path, ModelRecord.from_mapping(mapping), tuple(bases))
+                )
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError, SnapshotError):
+            self._remove(manifest_file, snapshot_file)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return extracted
+
+    def store(
+        self,
+        bridge_cls: typing.Type["Bridge"],
+        path: str,
+        extracted: typing.Sequence["Extracted"],
+        options: typing.Optional[dict[str, typing.Any]] = None,
+    ) -> bool:
+        """Saves mappings of models of path replacing older entries of it.
+
+        Returns whether they were saved: mappings with values snapshot can't
+        hold, or mapping the same table twice, are not. Fingerprints are only
+        taken of mappings snapshot accepted, their values have a stable repr
+        """
+
+        key = self.key(bridge_cls, path, options)
+        if key is None:
+            return False
+        mappings: list[ModelMapping] = [item.record.to_mapping() for item in extracted]
+        if len({mapping.name for mapping in mappings}) != len(mappings):
+            return False
+        try:
+            data = snapshot.dumps(mappings)
+        except SnapshotError:
+            return False
+        bases = sorted({base for item in extracted for base in item.bases})
+        manifest = {
+            "path": path,
+            "models": [
+                [item.path, mapping.name, mapping.fingerprint(), list(item.bases)]
+                for item, mapping in zip(extracted, mappings)
+            ],
+            "bases": {base: source_digest(base) for base in bases},
+        }
+
+        prefix = self._prefix(bridge_cls, path)
+        manifest_file, snapshot_file = self._files(prefix, key)
+        self._write(snapshot_file, data)
+        self._write(manifest_file, json.dumps(manifest).encode())
+        for stale in glob.glob(glob.escape(prefix) + "@*.json"):
+            if stale != manifest_file:
+                self._remove(stale, stale[: -len(".json")] + ".snapshot")
+        return True
+
+    def _write(self, path: str, data: bytes) -> None:
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            self._remove(temporary)
+            raise
+
+    @staticmethod
+    def _remove(*paths: str) -> None:
+        # manifest goes first, an entry without it is never read
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def invalidate(
+        self,
+        bridge_cls: typing.Optional[typing.Type["Bridge"]] = None,
+        path: typing.Optional[str] = None,
+    ) -> int:
+        """Removes entries of path extracted by bridge, of all paths or of all bridges.
+
+        Returns number of removed entries
+        """
+
+        if bridge_cls is None:
+            pattern = os.path.join(glob.escape(self.directory), "*@*.json")
+        elif path is None:
+            pattern = os.path.join(glob.escape(self.directory), f"{bridge_cls.__name__}-*@*.json")
+        else:
+            pattern = glob.escape(self._prefix(bridge_cls, path)) + "@*.json"
+        removed = 0
+        for manifest_file in glob.glob(pattern):
+            self._remove(manifest_file, manifest_file[: -len(".json")] + ".snapshot")
+            removed += 1
+        return removed
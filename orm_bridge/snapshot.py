@@ -0,0 +1,249 @@
+import collections.abc
+import json
+import mmap
+import os
+import struct
+import typing
+
+from orm_bridge.errors import SnapshotError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping, Value
+
+MAGIC = b"OBSN"
+VERSION = 1
+NONE = 0xFFFFFFFF
+
+# magic, version, string count, model count, string index offset, model index offset
+HEADER = struct.Struct("<4sH2xIIII")
+# offset and length of string in string data
+STRING = struct.Struct("<II")
+# name, offset of first field record, field count
+MODEL = struct.Struct("<III")
+# name, type, flags, max_length, default, ge, le, choices, tablename, related_name, through
+FIELD = struct.Struct("<IIH2xIIIIIIII")
+
+FLAGS = ("nullable", "primary_key", "autoincrement", "unique", "index", "skip_reverse")
+SCALARS = (bool, int, float, str)
+
+
+class _Strings:
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+
+    def add(self, value: typing.Optional[str]) -> int:
+        if value is None:
+            return NONE
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.ids)
+        return string_id
+
+    def add_value(self, value: Value, field: FieldMapping) -> int:
+        if value is None:
+            return NONE
+        _check_value(value, field)
+        return self.add(json.dumps(value))
+
+
+def _check_value(value: Value, field: FieldMapping) -> None:
+    if type(value) not in SCALARS:
+        raise SnapshotError(
+            f"Value {value!r} of field `{field.name}` can't be stored in snapshot"
+        )
+
+
+def dumps(mappings: typing.Iterable[ModelMapping]) -> bytes:
+    """Encodes mappings into snapshot"""
+
+    strings = _Strings()
+    models: list[tuple[int, int, int]] = []
+    records = bytearray()
+
+    for mapping in mappings:
+        models.append((strings.add(mapping.name), len(records), len(mapping.fields)))
+        for field in mapping.fields:
+            flags = 0
+            for bit, name in enumerate(FLAGS):
+                if getattr(field, name):
+                    flags |= 1 << bit
+            choices = NONE
+            if field.choices is not None:
+                # choices are stored as a single JSON list, values are only checked
+                for choice in field.choices:
+                    _check_value(choice, field)
+                choices = strings.add(json.dumps(sorted(field.choices, key=repr)))
+            records += FIELD.pack(
+                strings.add(field.name),
+                strings.add(field.type.value),
+                flags,
+                field.max_length,
+                strings.add_value(field.default, field),
+                strings.add_value(field.ge, field),
+                strings.add_value(field.le, field),
+                choices,
+                strings.add(field.tablename),
+                strings.add(field.related_name),
+                strings.add(field.through),
+            )
+
+    encoded = [string.encode() for string in strings.ids]
+    string_index = bytearray()
+    position = 0
+    for data in encoded:
+        string_index += STRING.pack(position, len(data))
+        position += len(data)
+    string_data = b"".join(encoded)
+
+    string_index_offset = HEADER.size
+    records_offset = string_index_offset + len(string_index) + len(string_data)
+    model_index_offset = records_offset + len(records)
+    model_index = b"".join(
+        MODEL.pack(name, records_offset + offset, count) for name, offset, count in models
+    )
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(encoded),
+        len(models),
+        string_index_offset,
+        model_index_offset,
+    )
+    return b"".join((header, string_index, string_data, records, model_index))
+
+
+def dump(mappings: typing.Iterable[ModelMapping], path: typing.Union[str, os.PathLike]) -> None:
+    with open(path, "wb") as file:
+        file.write(dumps(mappings))
+
+
+class Snapshot(collections.abc.Mapping):
+    """Read-only catalog of mappings by tablename, models are decoded on lookup"""
+
+    def __init__(self, buffer: typing.Union[bytes, mmap.mmap]) -> None:
+        self.buffer = buffer
+        if len(buffer) < HEADER.size:
+            raise SnapshotError("Snapshot is truncated")
+        magic, version, string_count, model_count, strings, index = HEADER.unpack_from(
+            buffer
+        )
+        if magic != MAGIC:
+            raise SnapshotError("Not an orm-bridge snapshot")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+        if (
+            index + model_count * MODEL.size > len(buffer)
+            or strings + string_count * STRING.size > len(buffer)
+        ):
+            raise SnapshotError("Snapshot is truncated")
+
+        self._string_index = strings
+        self._string_data = strings + string_count * STRING.size
+        self._string_count = string_count
+        self._strings: list[typing.Optional[str]] = [None] * string_count
+        self._values: dict[int, Value] = {}
+        self._models: dict[str, tuple[int, int]] = {}
+        for i in range(model_count):
+            name, offset, count = MODEL.unpack_from(buffer, index + i * MODEL.size)
+            self._models[self._string(name)] = (offset, count)
+        self._decoded: dict[str, ModelMapping] = {}
+
+    @classmethod
+    def open(cls, path: typing.Union[str, os.PathLike]) -> "Snapshot":
+        """Memory-maps snapshot file"""
+
+        with open(path, "rb") as file:
+            # empty files can't be mapped
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise SnapshotError("Snapshot is truncated")
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def _string(self, string_id: int) -> str:
+        if string_id >= self._string_count:
+            raise SnapshotError(f"Snapshot has no string {string_id}")
+        string = self._strings[string_id]
+        if string is None:
+            offset, length = STRING.unpack_from(
+                self.buffer, self._string_index + string_id * STRING.size
+            )
+            start = self._string_data + offset
+            if start + length > len(self.buffer):
+                raise SnapshotError("Snapshot is truncated")
+            try:
+                string = bytes(self.buffer[start:start + length]).decode()
+            except UnicodeDecodeError as error:
+                raise SnapshotError(f"Snapshot string {string_id} is corrupted: {error}")
+            self._strings[string_id] = string
+        return string
+
+    def _optional(self, string_id: int) -> typing.Optional[str]:
+        return None if string_id == NONE else self._string(string_id)
+
+    def _value(self, string_id: int) -> Value:
+        if string_id == NONE:
+            return None
+        if string_id not in self._values:
+            try:
+                self._values[string_id] = json.loads(self._string(string_id))
+            except ValueError as error:
+                raise SnapshotError(f"Snapshot value {string_id} is corrupted: {error}")
+        return self._values[string_id]
+
+    def _field(self, offset: int) -> FieldMapping:
+        (
+            name,
+            field_type,
+            flags,
+            max_length,
+            default,
+            ge,
+            le,
+            choices,
+            tablename,
+            related_name,
+            through,
+        ) = FIELD.unpack_from(self.buffer, offset)
+        try:
+            type_ = FieldType(self._string(field_type))
+            choice_set = None if choices == NONE else set(self._value(choices))
+        except (ValueError, TypeError) as error:
+            raise SnapshotError(f"Snapshot field record is corrupted: {error}")
+        return FieldMapping.trusted(
+            type=type_,
+            name=self._string(name),
+            choices=choice_set,
+            default=self._value(default),
+            max_length=max_length,
+            ge=self._value(ge),
+            le=self._value(le),
+            tablename=self._optional(tablename),
+            related_name=self._optional(related_name),
+            through=self._optional(through),
+            **{flag: bool(flags & 1 << bit) for bit, flag in enumerate(FLAGS)},
+        )
+
+    def __getitem__(self, tablename: str) -> ModelMapping:
+        mapping = self._decoded.get(tablename)
+        if mapping is None:
+            offset, count = self._models[tablename]
+            if offset + count * FIELD.size > len(self.buffer):
+                raise SnapshotError(f"Fields of `{tablename}` are truncated")
+            mapping = self._decoded[tablename] = ModelMapping.trusted(
+                tablename,
+                [self._field(offset + i * FIELD.size) for i in range(count)],
+            )
+        return mapping
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._models)
+
+    def __len__(self) -> int:
+        return len(self._models)
@@ -0,0 +1,245 @@
+import concurrent.futures
+import json
+import os
+import sqlite3
+import threading
+import typing
+
+from orm_bridge.convert import Converter, Correspondence, compile_converter
+from orm_bridge.dialect import get_dialect, has_column, through_mapping
+from orm_bridge.errors import BridgeError
+from orm_bridge.graph import RelationGraph
+from orm_bridge.mapping import ModelMapping
+from orm_bridge.translator import TranslationResult
+
+Database = typing.Union[str, os.PathLike, typing.Callable[[], typing.Any]]
+
+
+class Checkpoint:
+    """Progress of a transfer saved as JSON after each batch.
+
+    Tables with a single primary key resume after the last copied key,
+    other tables are copied in one transaction, marked started before it
+    and done after it
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        self.tables: dict[str, dict[str, typing.Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            with open(self.path) as file:
+                self.tables = json.load(file)["tables"]
+
+    def get(self, tablename: str) -> dict[str, typing.Any]:
+        with self._lock:
+            return dict(self.tables.get(tablename, {}))
+
+    def update(self, tablename: str, **state: typing.Any) -> None:
+        with self._lock:
+            self.tables.setdefault(tablename, {}).update(state)
+            temporary = self.path + ".tmp"
+            with open(temporary, "w") as file:
+                json.dump({"tables": self.tables}, file)
+            os.replace(temporary, self.path)
+
+
+class Transfer:
+    """Copies rows of mapped tables from one database to another.
+
+    Databases are sqlite paths or functions opening DB-API connections
+    with `qmark` parameters. Rows are read by `batch_size` and written with
+    `executemany`; independent tables are copied by `workers` threads,
+    referenced tables first. Rows of tables having another mapping in `targets`
+    go through compiled converters, see `compile_converter`
+    """
+
+    def __init__(
+        self,
+        source: Database,
+        target: Database,
+        mappings: typing.Union[typing.Iterable[ModelMapping], TranslationResult],
+        batch_size: int = 1000,
+        workers: int = 1,
+        checkpoint: typing.Optional[Checkpoint] = None,
+        converters: typing.Optional[dict[str, Converter]] = None,
+        targets: typing.Optional[typing.Mapping[str, ModelMapping]] = None,
+        correspondences: typing.Optional[typing.Mapping[str, Correspondence]] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise BridgeError("Batch size must be positive")
+        self.source = source
+        self.target = target
+        self.batch_size = batch_size
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.converters = converters or {}
+        self.targets = targets or {}
+        self.correspondences = correspondences or {}
+        self.dialect = get_dialect("sqlite")
+
+        if isinstance(mappings, TranslationResult):
+            mappings = mappings.mappings().values()
+        mappings = list(mappings)
+        tablenames = {mapping.name for mapping in mappings}
+        for mapping in list(mappings):
+            for field in mapping.fields:
+                if not has_column(field) and field.tablename is not None:
+                    through = through_mapping(mapping, field)
+                    if through.name not in tablenames:
+                        tablenames.add(through.name)
+                        mappings.append(through)
+        self.graph = RelationGraph(mappings)
+
+    @staticmethod
+    def connect(database: Database) -> typing.Any:
+        if callable(database):
+            return database()
+        return sqlite3.connect(database)
+
+    def columns(self, mapping: ModelMapping) -> list[str]:
+        return [field.name for field in mapping.fields if has_column(field)]
+
+    def key(self, mapping: ModelMapping) -> typing.Optional[str]:
+        """Column rows are ordered and resumed by"""
+
+        primary_keys = [field.name for field in mapping.fields if field.primary_key]
+        return primary_keys[0] if len(primary_keys) == 1 else None
+
+    def converter(
+        self,
+        source: ModelMapping,
+        target: ModelMapping,
+    ) -> typing.Optional[Converter]:
+        """Converter given for table, compiled one if target table differs"""
+
+        if source.name in self.converters:
+            return self.converters[source.name]
+        correspondence = self.correspondences.get(source.name)
+        if correspondence is None and target is source:
+            return None
+        return compile_converter(source, target, correspondence)
+
+    def check_empty(self, connection: typing.Any, tablename: str) -> None:
+        """Raises if table has rows, a copy of a table without key can't be resumed"""
+
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT 1 FROM {self.dialect.quote(tablename)} LIMIT 1")
+        if cursor.fetchone() is not None:
+            raise BridgeError(
+                f"Table `{tablename}` may have been partly copied, "
+                "delete its rows in the target to copy it again"
+            )
+
+    def copy_table(self, tablename: str) -> int:
+        """Copies rows of table not copied yet, returns number of copied rows"""
+
+        mapping = self.graph.mappings[tablename]
+        state = self.checkpoint.get(tablename) if self.checkpoint else {}
+        if state.get("done"):
+            return 0
+
+        quote = self.dialect.quote
+        columns = self.columns(mapping)
+        key = self.key(mapping)
+        target_mapping = self.targets.get(tablename, mapping)
+        target_columns = self.columns(target_mapping)
+        convert = self.converter(mapping, target_mapping)
+        select = f"SELECT {', '.join(map(quote, columns))} FROM {quote(tablename)}"
+        parameters: tuple = ()
+        if key is not None:
+            if "last" in state:
+                select += f" WHERE {quote(key)} > ?"
+                parameters = (state["last"],)
+            select += f" ORDER BY {quote(key)}"
+        insert = (
+            f"INSERT INTO {quote(target_mapping.name)} "
+            f"({', '.join(map(quote, target_columns))}) "
+            f"VALUES ({', '.join('?' for _ in target_columns)})"
+        )
+        target_key = self.key(target_mapping)
+        if key is not None and target_key is not None:
+            # a batch committed before its checkpoint was saved is replayed on resume,
+            # rows it already wrote are skipped
+            insert += f" ON CONFLICT ({quote(target_key)}) DO NOTHING"
+        position = columns.index(key) if key is not None else None
+
+        source = self.connect(self.source)
+        target = self.connect(self.target)
+        copied = state.get("rows", 0)
+        try:
+            if position is None and self.checkpoint:
+                if state.get("started"):
+                    self.check_empty(target, target_mapping.name)
+                self.checkpoint.update(tablename, started=True)
+            cursor = source.cursor()
+            writer = target.cursor()
+            cursor.execute(select, parameters)
+            while True:
+                rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                last = rows[-1][position] if position is not None else None
+                if convert is not None:
+                    rows = list(map(convert, rows))
+                writer.executemany(insert, rows)
+                copied += writer.rowcount if writer.rowcount >= 0 else len(rows)
+                if position is not None:
+                    target.commit()
+                    if self.checkpoint:
+                        self.checkpoint.update(tablename, last=last, rows=copied)
+            target.commit()
+        except BaseException:
+            target.rollback()
+            raise
+        finally:
+            source.close()
+            target.close()
+
+        if self.checkpoint:
+            self.checkpoint.update(tablename, rows=copied, done=True)
+        return copied - state.get("rows", 0)
+
+    def run(self) -> dict[str, int]:
+        """Copies all tables, returns rows copied by table in dependency order"""
+
+        order = self.graph.order()
+        if self.workers <= 1:
+            return {tablename: self.copy_table(tablename) for tablename in order}
+
+        # a table waits for tables before it, which leaves out references closing a cycle
+        position = {tablename: i for i, tablename in enumerate(order)}
+        waits = {
+            name: {table for table in tables if position[table] < position[name]}
+            for name, tables in self.graph.dependencies().items()
+        }
+        copied: dict[str, int] = {}
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as pool:
+            running: dict[concurrent.futures.Future, str] = {}
+            pending = list(order)
+
+            def schedule() -> None:
+                for tablename in list(pending):
+                    if waits[tablename] <= copied.keys():
+                        pending.remove(tablename)
+                        running[pool.submit(self.copy_table, tablename)] = tablename
+
+            schedule()
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    copied[running.pop(future)] = future.result()
+                schedule()
+        return {tablename: copied[tablename] for tablename in order}
+
+
+def transfer(
+    source: Database,
+    target: Database,
+    mappings: typing.Union[typing.Iterable[ModelMapping], TranslationResult],
+    **options: typing.Any,
+) -> dict[str, int]:
+    """Copies rows of mapped tables, see `Transfer`"""
+    return Transfer(source, target, mappings, **options).run()
@@ -1,38 +1,167 @@
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import time
+import types
 import typing
 
 from orm_bridge.bridge import Bridge
-from orm_bridge.errors import BridgeError
+from orm_bridge.cache import TranslationCache
+from orm_bridge.errors import BridgeError, TranslationCollision
 from orm_bridge.environment import Environment
+from orm_bridge.graph import RelationGraph
+from orm_bridge.instrument import TRANSLATION, Instrumentation, Measurement
+from orm_bridge.lazy import LazyModel
+from orm_bridge.mapping import ModelMapping
 
 FromModel = typing.TypeVar("FromModel")
 ToModel = typing.TypeVar("ToModel")
 
 
 class TranslationResult(typing.Generic[FromModel, ToModel]):
+    """Translated models indexed by source model, tablename and model name"""
+
     def __init__(
-        self, translations: list[tuple[typing.Type[FromModel], typing.Type[ToModel]]]
+        self,
+        translations: typing.Optional[
+            list[tuple[typing.Type[FromModel], typing.Type[ToModel]]]
+        ] = None,
     ) -> None:
-        self.translations = translations
+        self.translations: list[tuple[typing.Type[FromModel], typing.Type[ToModel]]] = []
+        self._models: dict[typing.Type[FromModel], typing.Type[ToModel]] = {}
+        self._mappings: dict[typing.Type[FromModel], ModelMapping] = {}
+        self._tablenames: dict[str, typing.Type[FromModel]] = {}
+        self._names: dict[str, list[typing.Type[FromModel]]] = {}
+        for model, translation in translations or []:
+            self.add(model, translation)
+
+    def add(
+        self,
+        model: typing.Type[FromModel],
+        translation: typing.Type[ToModel],
+        mapping: typing.Optional[ModelMapping] = None,
+    ) -> None:
+        """Registers translation, raises on conflicting source model or tablename.
+
+        Source models sharing a tablename must share its translation,
+        the first of them is found by tablename
+        """
+
+        if model in self._models:
+            if self._models[model] is not translation:
+                raise TranslationCollision(model.__name__, [model])
+            return
+        if mapping is not None:
+            owner = self._tablenames.setdefault(mapping.name, model)
+            if self._models.get(owner, translation) is not translation:
+                raise TranslationCollision(mapping.name, [owner, model])
+            self._mappings[model] = mapping
+
+        self._models[model] = translation
+        self._names.setdefault(model.__name__, []).append(model)
+        self.translations.append((model, translation))
 
     def __getitem__(self, model: typing.Type[FromModel]) -> typing.Type[ToModel]:  # type: ignore
-        for old_model, translation in self.translations:
-            if old_model.__name__ == model.__name__:
-                return translation
-        raise BridgeError(f"Model `{model}` is not found in translated models")
+        try:
+            return self._models[model]
+        except KeyError:
+            raise BridgeError(f"Model `{model}` is not found in translated models")
 
     def __contains__(self, model: typing.Type[FromModel]) -> bool:
-        for old_model, _ in self.translations:
-            if old_model.__name__ == model.__name__:
-                return True
-        return False
+        return model in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __iter__(self) -> typing.Iterator[typing.Type[FromModel]]:
+        return iter(self._models)
+
+    def get(
+        self,
+        model: typing.Type[FromModel],
+        default: typing.Optional[typing.Type[ToModel]] = None,
+    ) -> typing.Optional[typing.Type[ToModel]]:
+        return self._models.get(model, default)
+
+    def by_tablename(self, tablename: str) -> typing.Type[ToModel]:
+        if tablename not in self._tablenames:
+            raise BridgeError(f"Table `{tablename}` is not found in translated models")
+        return self._models[self._tablenames[tablename]]
+
+    def by_name(self, name: str) -> typing.Type[ToModel]:
+        """Looks translation up by source model class name"""
+
+        models = self._names.get(name)
+        if not models:
+            raise BridgeError(f"Model `{name}` is not found in translated models")
+        if len(models) > 1:
+            raise TranslationCollision(name, models)
+        return self._models[models[0]]
+
+    def get_mapping(self, model: typing.Type[FromModel]) -> ModelMapping:
+        if model not in self._mappings:
+            raise BridgeError(f"Mapping of model `{model}` is not known")
+        return self._mappings[model]
+
+    @property
+    def collisions(self) -> dict[str, list[typing.Type[FromModel]]]:
+        """Class names shared by several source models"""
+        return {name: models for name, models in self._names.items() if len(models) > 1}
+
+    def items(
+        self,
+    ) -> typing.ItemsView[typing.Type[FromModel], typing.Type[ToModel]]:
+        return self._models.items()
+
+    def mapping(
+        self,
+    ) -> typing.Mapping[typing.Type[FromModel], typing.Type[ToModel]]:
+        """Read-only view of source model to translated model"""
+        return types.MappingProxyType(self._models)
+
+    def mappings(self) -> dict[str, ModelMapping]:
+        """Known mappings by tablename"""
+        return {
+            tablename: self._mappings[model]
+            for tablename, model in self._tablenames.items()
+        }
 
 
 class Translator:
     """Translates model from one ORM to another"""
 
-    def __init__(self, from_orm: Bridge[FromModel], to_orm: Bridge[ToModel]) -> None:
+    def __init__(
+        self,
+        from_orm: Bridge[FromModel],
+        to_orm: Bridge[ToModel],
+        cache: typing.Optional[TranslationCache[ToModel]] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
+    ) -> None:
         self.from_orm = from_orm
         self.to_orm = to_orm
+        self.cache = cache
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            from_orm.instrument(instrumentation)
+            to_orm.instrument(instrumentation)
+
+    def get_model(self, mapping: ModelMapping) -> typing.Type[ToModel]:
+        """Builds target model from mapping, reusing cached model for identical mappings.
+
+        Cached models are only reused by the same target bridge in the same environment,
+        where they were bound to its registry, metadata and names
+        """
+
+        if self.cache is None:
+            return self.to_orm.get_model(mapping)
+
+        key = (self.to_orm, self.to_orm.environment, mapping.fingerprint())
+        new_model = self.cache.get(key)
+        if new_model is None:
+            new_model = self.to_orm.get_model(mapping)
+            self.cache.put(key, new_model)
+        return new_model
 
     def translate(
         self,
@@ -41,32 +170,236 @@ class Translator:
     ) -> typing.Type[ToModel]:
         """Translates single model"""
 
+        start = time.perf_counter()
         mapping = self.from_orm.get_mapping(model)
-        new_model = self.to_orm.get_model(mapping)
+        new_model = self.get_model(mapping)
+        self.to_orm.environment.register_mapping(mapping)
+        if self.instrumentation is not None:
+            self.instrumentation.emit(
+                Measurement(TRANSLATION, time.perf_counter() - start, model=mapping.name)
+            )
         if name is not None:
             self.to_orm.environment.table_models[name] = new_model
-            self.from_orm.environment.table_models[name] = model
+            # a shared environment keeps models of the target ORM
+            if self.from_orm.environment is not self.to_orm.environment:
+                self.from_orm.environment.table_models[name] = model
         return new_model
 
     def translate_many(
         self,
         *models: typing.Type[FromModel],
         environment: typing.Optional[Environment] = None,
+        workers: typing.Optional[int] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        lazy: bool = False,
     ) -> TranslationResult[FromModel, ToModel]:
-        """Translates multiple models in environment"""
+        """Translates multiple models in environment.
+
+        Models are built in relation order; with `workers` or a thread `executor`
+        mappings are extracted and independent groups of related models are built
+        on the pool, only class creation is serialized per target bridge.
+        Pure Python bridges share the GIL, so the pool pays off once bridges wait
+        on I/O or native code.
+        Source models sharing a tablename share its translation, like models
+        already in environment.
+        With `lazy` models are only built on first use, see `LazyModel`.
+        Result keeps the order of arguments
+        """
+
+        start = time.perf_counter()
+        self._check_executor(executor)
+        env = self._use_environment(environment)
+        if executor is None and (workers or 1) > 1:
+            with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+                sources, graph, translations = self._build(env, models, pool, lazy)
+        else:
+            sources, graph, translations = self._build(env, models, executor, lazy)
 
+        self._register(env, graph, translations)
+        result: TranslationResult[FromModel, ToModel] = TranslationResult()
+        for model, mapping in sources.items():
+            result.add(model, translations[mapping.name], mapping)
+        if self.instrumentation is not None:
+            self.instrumentation.emit(
+                Measurement(TRANSLATION, time.perf_counter() - start)
+            )
+        return result
+
+    async def atranslate_many(
+        self,
+        *models: typing.Type[FromModel],
+        environment: typing.Optional[Environment] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        batch_size: int = 16,
+        prefetch: int = 2,
+    ) -> typing.AsyncIterator[tuple[typing.Type[FromModel], typing.Type[ToModel]]]:
+        """Translates multiple models in environment without blocking the event loop.
+
+        Models are built in relation order by `batch_size` in the executor and
+        yielded as `(model, translation)` once their batch is done. At most
+        `prefetch` finished batches wait for the consumer before building pauses.
+        Closing or cancelling the generator stops building after the current batch
+        """
+
+        self._check_executor(executor)
+        if batch_size < 1 or prefetch < 1:
+            raise BridgeError("Batch size and prefetch must be positive")
+
+        loop = asyncio.get_running_loop()
+        env = self._use_environment(environment)
+        sources = await loop.run_in_executor(
+            executor, functools.partial(self._get_mappings, models)
+        )
+        graph = self._graph(sources)
+        owners: dict[str, list[typing.Type[FromModel]]] = {}
+        for model, mapping in sources.items():
+            owners.setdefault(mapping.name, []).append(model)
+
+        order = graph.order()
+        batches = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+        queue: asyncio.Queue = asyncio.Queue(prefetch)
+
+        async def produce() -> None:
+            try:
+                for batch in batches:
+                    translations = await loop.run_in_executor(
+                        executor, self._materialize, env, graph, batch
+                    )
+                    await queue.put(translations)
+            except Exception as exception:
+                await queue.put(exception)
+            else:
+                await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                translations = await queue.get()
+                if translations is None:
+                    break
+                if isinstance(translations, Exception):
+                    raise translations
+                self._register(env, graph, translations)
+                for tablename, translation in translations.items():
+                    for model in owners[tablename]:
+                        yield model, translation
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    @staticmethod
+    def _check_executor(executor: typing.Optional[concurrent.futures.Executor]) -> None:
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            raise BridgeError("Translated models can't be built in another process")
+
+    def _use_environment(self, environment: typing.Optional[Environment]) -> Environment:
         env = environment or Environment()
         self.from_orm.environment = env
         self.to_orm.environment = env
+        return env
 
-        result: TranslationResult[FromModel, ToModel] = TranslationResult([])
+    def _build(
+        self,
+        env: Environment,
+        models: typing.Iterable[typing.Type[FromModel]],
+        executor: typing.Optional[concurrent.futures.Executor],
+        lazy: bool,
+    ) -> tuple[dict[typing.Type[FromModel], ModelMapping], RelationGraph, dict[str, typing.Any]]:
+        """Mappings of models, their graph and translations, built on executor if any"""
 
-        for model in models:
-            mapping = self.from_orm.get_mapping(model)
-            if mapping.name in env.table_models:
-                new_model = env.table_models[mapping.name]
-            else:
-                new_model = self.to_orm.get_model(mapping)
-            result.translations.append((model, new_model))
+        sources = self._get_mappings(models, executor)
+        graph = self._graph(sources)
+        translations: dict[str, typing.Any] = {}
 
-        return result
+        def materialize(tablenames: list[str]) -> None:
+            translations.update(self._materialize(env, graph, tablenames))
+
+        if lazy:
+            self._defer(env, graph, translations)
+        elif executor is not None:
+            self._materialize_on(executor, materialize, graph)
+        else:
+            materialize(graph.order())
+        return sources, graph, translations
+
+    def _get_mappings(
+        self,
+        models: typing.Iterable[typing.Type[FromModel]],
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> dict[typing.Type[FromModel], ModelMapping]:
+        unique = list(dict.fromkeys(models))
+        if executor is None:
+            return {model: self.from_orm.get_mapping(model) for model in unique}
+        return dict(zip(unique, executor.map(self.from_orm.get_mapping, unique)))
+
+    @staticmethod
+    def _graph(sources: dict[typing.Any, ModelMapping]) -> RelationGraph:
+        """Relation graph of tables, the first mapping of a shared tablename is built"""
+
+        graph = RelationGraph()
+        for mapping in sources.values():
+            if mapping.name not in graph.mappings:
+                graph.add(mapping)
+        return graph
+
+    def _materialize(
+        self,
+        env: Environment,
+        graph: RelationGraph,
+        tablenames: list[str],
+    ) -> dict[str, typing.Type[ToModel]]:
+        """Models of tables, reusing models of the target ORM already in environment"""
+
+        translations: dict[str, typing.Type[ToModel]] = {}
+        for tablename in tablenames:
+            model = env.table_models.get(tablename)
+            if not self._is_target(model):
+                model = self.get_model(graph.mappings[tablename])
+            translations[tablename] = model
+        return translations
+
+    def _is_target(self, model: typing.Any) -> bool:
+        """Whether model of environment belongs to the target ORM, pending ones do"""
+        return isinstance(model, LazyModel) or self.to_orm.is_model(model)
+
+    @staticmethod
+    def _register(
+        env: Environment,
+        graph: RelationGraph,
+        translations: dict[str, typing.Any],
+    ) -> None:
+        """Adds translated models to environment and its relation indexes"""
+
+        for tablename, translation in translations.items():
+            env.register_mapping(graph.mappings[tablename])
+            env.table_models[tablename] = translation
+
+    def _defer(
+        self,
+        env: Environment,
+        graph: RelationGraph,
+        translations: dict[str, typing.Any],
+    ) -> None:
+        for component in graph.components():
+            lock = threading.RLock()
+            for tablename in component:
+                if not self._is_target(env.table_models.get(tablename)):
+                    env.table_models[tablename] = LazyModel(
+                        graph.mappings[tablename], self.get_model, env, lock
+                    )
+                translations[tablename] = env.table_models[tablename]
+
+    @staticmethod
+    def _materialize_on(
+        executor: concurrent.futures.Executor,
+        materialize: typing.Callable[[list[str]], None],
+        graph: RelationGraph,
+    ) -> None:
+        futures = [
+            executor.submit(materialize, component) for component in graph.components()
+        ]
+        for future in futures:
+            future.result()
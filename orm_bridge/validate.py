@@ -0,0 +1,228 @@
+import enum
+import typing
+
+from orm_bridge.dialect import has_column
+from orm_bridge.errors import BridgeError, MappingError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+NUMERIC = (FieldType.INTEGER, FieldType.FLOAT, FieldType.FOREIGN_KEY)
+
+Record = typing.Union[tuple, typing.Mapping[str, typing.Any]]
+
+
+class Column:
+    """Values of a field in a batch, derived arrays are computed once"""
+
+    def __init__(self, values: typing.Any, rows: int) -> None:
+        if values is None:
+            values = numpy.full(rows, None, dtype=object)
+        elif not isinstance(values, numpy.ndarray):
+            array = numpy.asarray(values)
+            # None and strings are kept as objects, so comparisons stay exact
+            values = array if array.dtype.kind not in "UO" else numpy.asarray(values, object)
+        self.values = values
+        self._null: typing.Any = None
+        self._numbers: typing.Any = None
+
+    @property
+    def null(self) -> typing.Any:
+        """Mask of missing values, None or nan in float arrays"""
+
+        if self._null is None:
+            kind = self.values.dtype.kind
+            if kind == "f":
+                self._null = numpy.isnan(self.values)
+            elif kind == "O":
+                self._null = numpy.equal(self.values, None)
+            else:
+                self._null = numpy.zeros(len(self.values), dtype=bool)
+        return self._null
+
+    @property
+    def numbers(self) -> tuple[typing.Any, typing.Any]:
+        """Values as floats, nan where missing or not a number, and mask of non-numbers"""
+
+        if self._numbers is None:
+            values = self.values
+            if values.dtype.kind in "iuf":
+                self._numbers = values.astype(float), numpy.zeros(len(values), dtype=bool)
+            elif values.dtype.kind != "O":
+                self._numbers = numpy.full(len(values), numpy.nan), ~self.null
+            else:
+                is_number = numpy.frompyfunc(
+                    lambda value: isinstance(value, (int, float))
+                    and not isinstance(value, bool),
+                    1,
+                    1,
+                )
+                numeric = is_number(values).astype(bool)
+                floats = numpy.where(numeric, values, numpy.nan).astype(float)
+                self._numbers = floats, ~numeric & ~self.null
+        return self._numbers
+
+    @property
+    def lengths(self) -> typing.Any:
+        """Lengths of values as strings, zero where missing"""
+
+        if self.values.dtype.kind == "U":
+            return numpy.char.str_len(self.values)
+        values = numpy.where(self.null, "", self.values)
+        try:
+            return numpy.fromiter(map(len, values), int, len(values))
+        except TypeError:
+            # values other than strings are measured by their text
+            return numpy.char.str_len(values.astype(str))
+
+
+Check = typing.Callable[[Column], typing.Any]
+
+
+class ValidationReport:
+    """Error masks of a validated batch by field and check"""
+
+    def __init__(self, rows: int, masks: dict[str, dict[str, typing.Any]]) -> None:
+        self.rows = rows
+        self.masks = masks
+
+    def __bool__(self) -> bool:
+        """Whether every row is valid"""
+        return not self.invalid.any()
+
+    @property
+    def invalid(self) -> typing.Any:
+        """Mask of rows failing any check"""
+
+        invalid = numpy.zeros(self.rows, dtype=bool)
+        for checks in self.masks.values():
+            for mask in checks.values():
+                invalid |= mask
+        return invalid
+
+    def invalid_rows(self) -> list[int]:
+        return numpy.flatnonzero(self.invalid).tolist()
+
+    def errors(self, row: int) -> list[tuple[str, str]]:
+        """Fields and checks failed by row"""
+
+        return [
+            (field, check)
+            for field, checks in self.masks.items()
+            for check, mask in checks.items()
+            if mask[row]
+        ]
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Number of failed rows by field and check, passed checks are left out"""
+
+        summary: dict[str, dict[str, int]] = {}
+        for field, checks in self.masks.items():
+            for check, mask in checks.items():
+                count = int(mask.sum())
+                if count:
+                    summary.setdefault(field, {})[check] = count
+        return summary
+
+
+class BatchValidator:
+    """Checks batches of rows against field constraints of a mapping with NumPy.
+
+    Checks of each column are compiled once: nullability, numeric type,
+    ge/le, max_length and choices. Missing values only fail the null check
+    """
+
+    def __init__(self, mapping: ModelMapping) -> None:
+        if numpy is None:
+            raise BridgeError("Batch validation requires NumPy, install orm-bridge[numpy]")
+        self.mapping = mapping
+        self.fields = [field for field in mapping.fields if has_column(field)]
+        self.checks: dict[str, list[tuple[str, Check]]] = {
+            field.name: compile_checks(field) for field in self.fields
+        }
+
+    def validate(self, columns: typing.Mapping[str, typing.Any]) -> ValidationReport:
+        """Validates batch given as arrays or sequences of values by field name.
+
+        Columns left out are missing in every row
+        """
+
+        given = [columns[field.name] for field in self.fields if field.name in columns]
+        rows = max(map(len, given), default=0)
+        if any(len(values) != rows for values in given):
+            raise BridgeError("Columns of a batch must have the same length")
+
+        masks: dict[str, dict[str, typing.Any]] = {}
+        for field in self.fields:
+            column = Column(columns.get(field.name), rows)
+            masks[field.name] = {
+                name: check(column) for name, check in self.checks[field.name]
+            }
+        return ValidationReport(rows, masks)
+
+    def validate_records(self, records: typing.Sequence[Record]) -> ValidationReport:
+        """Validates rows given as tuples of column values in mapping order, or dicts"""
+
+        if not records:
+            return self.validate({})
+        if isinstance(records[0], tuple):
+            for row, record in enumerate(records):
+                if len(record) != len(self.fields):
+                    raise MappingError(
+                        f"Record {row} has {len(record)} values, "
+                        f"table `{self.mapping.name}` has {len(self.fields)} columns"
+                    )
+            values = list(zip(*records))
+            return self.validate({field.name: values[i] for i, field in enumerate(self.fields)})
+        return self.validate(
+            {
+                field.name: [record.get(field.name) for record in records]  # type: ignore
+                for field in self.fields
+            }
+        )
+
+
+def compile_checks(field: FieldMapping) -> list[tuple[str, Check]]:
+    """Checks of field, each returns mask of rows failing it"""
+
+    checks: list[tuple[str, Check]] = []
+    if not field.nullable and not (field.primary_key and field.autoincrement):
+        checks.append(("null", lambda column: column.null))
+
+    if field.type in NUMERIC:
+        checks.append(("type", lambda column: column.numbers[1]))
+        if field.ge is not None:
+            ge = field.ge
+            checks.append(("ge", lambda column: column.numbers[0] < ge))
+        if field.le is not None:
+            le = field.le
+            checks.append(("le", lambda column: column.numbers[0] > le))
+
+    if field.type == FieldType.STRING and field.max_length is not None:
+        max_length = field.max_length
+        checks.append(("max_length", lambda column: column.lengths > max_length))
+
+    if field.choices:
+        choices = [
+            choice.value if isinstance(choice, enum.Enum) else choice
+            for choice in field.choices
+        ]
+        checks.append(
+            ("choices", lambda column: ~column.null & ~numpy.isin(column.values, choices))
+        )
+    return checks
+
+
+def validate(
+    mapping: ModelMapping,
+    batch: typing.Union[typing.Mapping[str, typing.Any], typing.Sequence[Record]],
+) -> ValidationReport:
+    """Validates columns or records of mapping, see `BatchValidator`"""
+
+    validator = BatchValidator(mapping)
+    if isinstance(batch, typing.Mapping):
+        return validator.validate(batch)
+    return validator.validate_records(batch)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String, Boolean, SmallInteger
+from sqlalchemy import Column, Integer, String, Boolean, SmallInteger, BigInteger, Unicode
 
 Base = declarative_base()
 
@@ -11,3 +11,10 @@ class User(Base):
     username = Column(String(40))
     is_active = Column(Boolean, default=True)
     age = Column(SmallInteger, nullable=True)
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id = Column(BigInteger, primary_key=True)
+    text = Column(Unicode(1023))
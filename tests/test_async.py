@@ -0,0 +1,44 @@
+import asyncio
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event, Registration, Promocode
+from tests.test_lazy import CountingTortoiseBridge
+
+
+def test_atranslate_many() -> None:
+    async def collect(batch_size: int) -> list:
+        translator = Translator(OrmarBridge(), CountingTortoiseBridge())
+        return [
+            pair
+            async for pair in translator.atranslate_many(
+                Promocode, Registration, User, Event, batch_size=batch_size
+            )
+        ]
+
+    pairs = asyncio.run(collect(batch_size=3))
+    assert [model for model, _ in pairs] == [User, Event, Promocode, Registration]
+    assert [translation.__name__ for _, translation in pairs] == [
+        "User",
+        "Event",
+        "Promocode",
+        "Registration",
+    ]
+
+
+def test_atranslate_many_close() -> None:
+    bridge = CountingTortoiseBridge()
+
+    async def first() -> tuple:
+        translator = Translator(OrmarBridge(), bridge)
+        stream = translator.atranslate_many(
+            User, Event, Registration, Promocode, batch_size=1, prefetch=1
+        )
+        pair = await stream.__anext__()
+        await stream.aclose()
+        return pair
+
+    model, translation = asyncio.run(first())
+    assert model is User and translation.__name__ == "User"
+    assert len(bridge.built) < 4
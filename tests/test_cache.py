@@ -0,0 +1,161 @@
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.sqlalchemy import SQLAlchemyBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.cache import TranslationCache, TypeCache, TypeCacheInfo
+from orm_bridge.environment import Environment
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event
+
+
+def test_mapping_fingerprint() -> None:
+    def mapping(max_length: int) -> ModelMapping:
+        return ModelMapping(
+            name="users",
+            fields=[
+                FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+                FieldMapping(
+                    name="role",
+                    type=FieldType.STRING,
+                    max_length=max_length,
+                    choices={"customer", "seller"},
+                ),
+            ],
+        )
+
+    assert mapping(31).fingerprint() == mapping(31).fingerprint()
+    assert mapping(31).fingerprint() != mapping(63).fingerprint()
+
+
+def test_translation_cache() -> None:
+    cache: TranslationCache = TranslationCache(maxsize=1)
+    translator = Translator(OrmarBridge(), TortoiseBridge(), cache=cache)
+
+    user = translator.translate(User)
+    assert translator.translate(User) is user
+    assert cache.info() == (1, 1, 1, 1)
+
+    event = translator.translate(Event)
+    assert event is not user
+    assert len(cache) == 1
+    assert translator.translate(User) is not user
+    assert cache.info().misses == 3
+
+
+def test_translation_cache_is_per_bridge_and_environment() -> None:
+    cache: TranslationCache = TranslationCache()
+    translator = Translator(OrmarBridge(), SQLAlchemyBridge(), cache=cache)
+    user = translator.translate(User)
+    assert translator.translate(User) is user
+
+    other = Translator(OrmarBridge(), SQLAlchemyBridge(), cache=cache).translate(User)
+    assert other is not user
+    assert other.metadata is not user.metadata
+
+    translator = Translator(OrmarBridge(), TortoiseBridge(), cache=cache)
+    user = translator.translate(User)
+    translator.to_orm.environment = Environment(tortoise_names={"Account": "users"})
+    assert translator.translate(User).__name__ == "Account"
+
+
+def test_trusted_fingerprint_is_memoized() -> None:
+    field = FieldMapping.trusted(name="id", type=FieldType.INTEGER, primary_key=True)
+    mapping = ModelMapping.trusted("users", [field])
+    fingerprint = mapping.fingerprint()
+    assert mapping._fingerprint[1] == fingerprint and field._fingerprint is not None
+    assert fingerprint == ModelMapping(name="users", fields=[field.copy()]).fingerprint()
+
+    mapping.name = "accounts"
+    assert mapping.fingerprint() != fingerprint
+    assert mapping.fingerprint(exclude=("name",)) == mapping.copy().fingerprint(exclude=("name",))
+
+
+def test_fingerprint_follows_fields_changed_in_place() -> None:
+    mapping = SQLAlchemyBridge().get_mapping(
+        SQLAlchemyBridge().get_model(
+            ModelMapping(
+                name="notes",
+                fields=[
+                    FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+                    FieldMapping(name="text", type=FieldType.STRING, max_length=10),
+                ],
+            )
+        )
+    )
+    fingerprint = mapping.fingerprint()
+    bridge = SQLAlchemyBridge()
+    model = bridge.get_model(mapping)
+
+    mapping.fields[1].max_length = 500
+    assert mapping.fingerprint() != fingerprint
+    changed = bridge.get_model(mapping)
+    assert changed is not model
+    assert changed.__table__.c.text.type.length == 500
+
+    mapping.fields.append(FieldMapping.trusted(name="draft", type=FieldType.BOOLEAN))
+    assert "draft" in bridge.get_model(mapping).__table__.c
+
+
+def test_generated_types_are_shared() -> None:
+    def mapping(name: str) -> ModelMapping:
+        return ModelMapping(
+            name=name,
+            fields=[
+                FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+                FieldMapping(name="age", type=FieldType.INTEGER, ge=0, le=150),
+                FieldMapping(
+                    name="role", type=FieldType.STRING, max_length=8, choices={"a", "b"}
+                ),
+                FieldMapping(name="title", type=FieldType.STRING, max_length=63),
+            ],
+        )
+
+    types = TypeCache()
+    tortoise = TortoiseBridge(types=types)
+    first, second = tortoise.get_model(mapping("cached_a")), tortoise.get_model(mapping("cached_b"))
+    role = first._meta.fields_map["role"].enum_type
+    assert role is second._meta.fields_map["role"].enum_type
+    assert role.__name__ == TortoiseBridge(types=TypeCache()).get_model(
+        mapping("cached_c")
+    )._meta.fields_map["role"].enum_type.__name__
+    assert first._meta.fields_map["age"].validators == second._meta.fields_map["age"].validators
+    assert types.info()["tortoise.Choices"] == TypeCacheInfo(hits=1, misses=1, currsize=1)
+    assert tortoise.get_mapping(second).fields[1].ge == 0
+
+    alchemy = SQLAlchemyBridge(types=types)
+    first, second = alchemy.get_model(mapping("cached_a")), alchemy.get_model(mapping("cached_b"))
+    assert first.__table__.c.title.type is second.__table__.c.title.type
+    assert first.__table__.c.role.type is not first.__table__.c.title.type
+    assert types.info()["sqlalchemy.String"] == TypeCacheInfo(hits=2, misses=2, currsize=2)
+
+    types.clear()
+    assert len(types) == 0 and types.info() == {}
+
+
+def test_type_cache_is_bounded() -> None:
+    types = TypeCache(maxsize=2)
+    first = types.get("kind", 1, object)
+    types.get("kind", 2, object)
+    assert types.get("kind", 1, object) is first
+    types.get("kind", 3, object)
+    assert len(types) == 2
+    assert types.get("kind", 1, object) is first
+    assert types.info()["kind"] == TypeCacheInfo(hits=2, misses=3, currsize=2)
+
+
+def test_choices_of_other_types_are_kept_apart() -> None:
+    def mapping(name: str, choice: object) -> ModelMapping:
+        return ModelMapping(
+            name=name,
+            fields=[
+                FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+                FieldMapping(name="flag", type=FieldType.STRING, choices={choice}),
+            ],
+        )
+
+    bridge = TortoiseBridge(types=TypeCache())
+    ints = bridge.get_model(mapping("choices_int", 1))._meta.fields_map["flag"].enum_type
+    bools = bridge.get_model(mapping("choices_bool", True))._meta.fields_map["flag"].enum_type
+    assert ints is not bools
+    assert [member.value for member in bools] == [True]
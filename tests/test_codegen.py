@@ -0,0 +1,146 @@
+import glob
+import importlib
+import os
+
+import pytest
+import sqlalchemy
+import sqlalchemy.orm
+
+from orm_bridge.__main__ import main
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.sqlalchemy import SQLAlchemyBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.codegen import generate, generate_package, write_source
+from orm_bridge.errors import BridgeError, MappingError
+from orm_bridge.extract import extract_mappings
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+MAPPINGS = list(extract_mappings(OrmarBridge, ["tests.ormar_models"], workers=1).mappings.values())
+COMMENTS = ModelMapping(
+    name="comments",
+    fields=[
+        FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+        FieldMapping(
+            name="parent",
+            type=FieldType.FOREIGN_KEY,
+            tablename="comments",
+            related_name="children",
+            nullable=True,
+        ),
+        FieldMapping(name="score", type=FieldType.FLOAT, ge=0, le=5, nullable=True),
+    ],
+)
+
+
+def load(tmp_path, monkeypatch, name: str, source: str):
+    (tmp_path / f"{name}.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return importlib.import_module(name)
+
+
+def test_generate_ormar(tmp_path, monkeypatch) -> None:
+    module = load(tmp_path, monkeypatch, "generated_ormar", generate(MAPPINGS, "ormar"))
+    bridge = OrmarBridge()
+    for mapping in MAPPINGS:
+        assert bridge.get_mapping(getattr(module, mapping.name)) == mapping
+
+
+def test_generate_tortoise(tmp_path, monkeypatch) -> None:
+    source = generate(MAPPINGS + [COMMENTS], "tortoise")
+    module = load(tmp_path, monkeypatch, "generated_tortoise", source)
+    bridge = TortoiseBridge()
+
+    users = bridge.get_mapping(module.User)
+    assert users.fields[3].choices == {"customer", "seller"}
+    assert users.fields[1].default == "Anonymous"
+    parent = bridge.get_mapping(module.Comment).fields[1]
+    assert (parent.tablename, parent.related_name) == ("comments", "children")
+    assert source.count("enum.Enum(") == 1
+
+
+def test_generate_sqlalchemy(tmp_path, monkeypatch) -> None:
+    source = generate(MAPPINGS + [COMMENTS], "sqlalchemy")
+    module = load(tmp_path, monkeypatch, "generated_sqlalchemy", source)
+    sqlalchemy.orm.configure_mappers()
+
+    assert set(module.Base.metadata.tables) == {
+        "users", "events", "registrations", "promocodes", "promocodes_events", "comments"
+    }
+    assert SQLAlchemyBridge().get_mapping(module.users).fields[1].max_length == 31
+
+    engine = sqlalchemy.create_engine("sqlite://")
+    module.Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        with pytest.raises(sqlalchemy.exc.IntegrityError):
+            connection.execute(module.comments.__table__.insert(), {"id": 1, "score": 6})
+        with pytest.raises(sqlalchemy.exc.IntegrityError):
+            connection.execute(
+                module.users.__table__.insert(),
+                {"id": 1, "name": "a", "is_active": True, "role": "admin"},
+            )
+
+
+def test_generate_invalid() -> None:
+    with pytest.raises(BridgeError):
+        generate(MAPPINGS, "peewee")
+    with pytest.raises(MappingError):
+        generate([COMMENTS.copy(update={"name": "class"})], "sqlalchemy")
+    with pytest.raises(MappingError):
+        # registrations refer to users and events which are not generated
+        generate(MAPPINGS[2:3], "ormar")
+
+
+def test_generate_package(tmp_path, monkeypatch) -> None:
+    by_name = {mapping.name: mapping for mapping in MAPPINGS}
+    catalogs = {
+        "accounts": [by_name["users"]],
+        "events": [by_name[name] for name in ("events", "registrations", "promocodes")],
+    }
+    written = generate_package(
+        catalogs, "ormar", tmp_path / "models_pkg", workers=2, database_url="sqlite://"
+    )
+
+    assert [os.path.basename(path) for path in written] == ["accounts.py", "events.py"]
+    assert len(glob.glob(str(tmp_path / "models_pkg" / "__pycache__" / "*.pyc"))) == 4
+    monkeypatch.syspath_prepend(str(tmp_path))
+    events = importlib.import_module("models_pkg.events")
+    assert events.registrations.Meta.metadata is events.promocodes.Meta.metadata
+
+
+def test_generate_package_cycle(tmp_path) -> None:
+    first = ModelMapping(
+        name="first",
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+            FieldMapping(name="second", type=FieldType.FOREIGN_KEY, tablename="second"),
+        ],
+    )
+    second = first.copy(update={"name": "second", "fields": first.fields[:1]})
+    second.fields.append(
+        FieldMapping(name="first", type=FieldType.FOREIGN_KEY, tablename="first")
+    )
+
+    with pytest.raises(MappingError):
+        generate_package({"one": [first], "two": [second]}, "ormar", tmp_path)
+    # tortoise refers to models by name, so modules may refer to each other
+    generate_package({"one": [first], "two": [second]}, "tortoise", tmp_path, workers=1)
+
+
+def test_write_source(tmp_path) -> None:
+    path = tmp_path / "labels.py"
+    write_source(str(path), 'LABEL = "café ✓"\n')
+    assert path.read_bytes() == 'LABEL = "café ✓"\n'.encode("utf-8")
+    umask = os.umask(0)
+    os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+    assert glob.glob(str(tmp_path / "__pycache__" / "labels.*.pyc"))
+
+
+def test_main(tmp_path, capsys) -> None:
+    output = tmp_path / "cli"
+    argv = ["generate", "--source", "ormar", "--target", "tortoise", "--output", str(output)]
+
+    assert main(argv + ["--workers", "1", "tests.ormar_models"]) == 0
+    assert capsys.readouterr().out.split() == [str(output / "tests_ormar_models.py")]
+    assert main(argv + ["tests.missing_models"]) == 1
+    assert "tests.missing_models" in capsys.readouterr().err
@@ -0,0 +1,72 @@
+import pytest
+
+from orm_bridge import columnar
+from orm_bridge.columnar import ColumnarCatalog
+from orm_bridge.environment import Environment
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+MAPPINGS = [
+    ModelMapping(
+        name="users",
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+            FieldMapping(name="bio", type=FieldType.STRING, max_length=4096, nullable=True),
+            FieldMapping(name="age", type=FieldType.INTEGER, ge=0, index=True),
+        ],
+    ),
+    ModelMapping(
+        name="posts",
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True, nullable=True),
+            FieldMapping(name="title", type=FieldType.STRING, max_length=255),
+            FieldMapping(name="author", type=FieldType.FOREIGN_KEY, tablename="users"),
+            FieldMapping(
+                name="editor", type=FieldType.FOREIGN_KEY, tablename="users", index=True
+            ),
+        ],
+    ),
+]
+
+
+@pytest.fixture(params=["numpy", "array"])
+def catalog(request, monkeypatch) -> ColumnarCatalog:
+    if request.param == "array":
+        monkeypatch.setattr(columnar, "numpy", None)
+    elif columnar.numpy is None:
+        pytest.skip("numpy is not installed")
+    env = Environment({mapping.name: mapping for mapping in MAPPINGS})
+    return ColumnarCatalog.from_environment(env)
+
+
+def names(selection: columnar.Selection) -> list[tuple[str, str]]:
+    return [(tablename, field.name) for tablename, field in selection]
+
+
+def test_columnar_filter(catalog: ColumnarCatalog) -> None:
+    unindexed_fks = catalog.filter(type=FieldType.FOREIGN_KEY, index=False)
+    assert names(unindexed_fks) == [("posts", "author")]
+    assert unindexed_fks.fields()[0][1] is MAPPINGS[1].fields[2]
+
+    assert names(catalog.filter(type=FieldType.STRING, max_length__gt=1024)) == [
+        ("users", "bio")
+    ]
+    assert names(catalog.filter(primary_key=True, nullable=True)) == [("posts", "id")]
+    assert names(catalog.filter(ge__ge=0)) == [("users", "age")]
+    assert len(catalog.filter(ge=None)) == 6
+    assert len(catalog.filter(tablename="users").filter(index=True)) == 1
+    assert len(catalog.filter(tablename="missing")) == 0
+    assert catalog.filter(type__in=[FieldType.STRING]).mappings() == MAPPINGS
+
+
+def test_columnar_group_by(catalog: ColumnarCatalog) -> None:
+    assert catalog.count_by("type") == {
+        FieldType.INTEGER: 3,
+        FieldType.STRING: 2,
+        FieldType.FOREIGN_KEY: 2,
+    }
+    groups = catalog.filter(index=True).group_by("table")
+    assert {table: names(group) for table, group in groups.items()} == {
+        "users": [("users", "age")],
+        "posts": [("posts", "editor")],
+    }
+    assert catalog.filter(type=FieldType.STRING).column("max_length") == [4096, 255]
@@ -0,0 +1,64 @@
+import enum
+
+import pytest
+
+from orm_bridge.convert import compile_converter
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+
+class Role(enum.Enum):
+    CUSTOMER = "customer"
+    SELLER = "seller"
+
+
+SOURCE = ModelMapping(
+    name="users",
+    fields=[
+        FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+        FieldMapping(name="username", type=FieldType.STRING, max_length=31),
+        FieldMapping(name="role", type=FieldType.STRING, max_length=31, nullable=True),
+        FieldMapping(name="score", type=FieldType.INTEGER, nullable=True),
+        FieldMapping(name="groups", type=FieldType.MANY2MANY, tablename="groups"),
+    ],
+)
+TARGET = ModelMapping(
+    name="members",
+    fields=[
+        FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+        FieldMapping(name="name", type=FieldType.STRING, max_length=31),
+        FieldMapping(
+            name="role",
+            type=FieldType.STRING,
+            max_length=31,
+            choices={"customer", "seller"},
+            default="customer",
+        ),
+        FieldMapping(name="score", type=FieldType.FLOAT, nullable=True),
+        FieldMapping(name="active", type=FieldType.BOOLEAN, default=True),
+    ],
+)
+
+
+def test_compile_converter() -> None:
+    convert = compile_converter(SOURCE, TARGET, {"name": "username"})
+    assert convert((1, "alice", Role.SELLER, 3)) == (1, "alice", "seller", 3.0, True)
+    assert convert((2, "bob", None, None)) == (2, "bob", "customer", None, True)
+    assert compile_converter(SOURCE, TARGET, {"name": "username"}) is convert
+    assert "for" not in convert.__source__
+
+    with pytest.raises(ValueError, match="is not a choice"):
+        convert((3, "eve", "admin", 0))
+    with pytest.raises(ValueError, match="name is not nullable"):
+        convert((4, None, None, 0))
+
+
+def test_compile_converter_dicts() -> None:
+    convert = compile_converter(SOURCE, TARGET, {"name": "username"}, dicts=True)
+    row = {"id": 1, "username": "alice", "role": "customer", "score": 1}
+    assert convert(row) == {
+        "id": 1,
+        "name": "alice",
+        "role": "customer",
+        "score": 1.0,
+        "active": True,
+    }
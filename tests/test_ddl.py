@@ -0,0 +1,82 @@
+import sqlite3
+
+import pytest
+
+from orm_bridge.ddl import DDLCompiler, apply
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+
+def table(name: str, *fields: FieldMapping) -> ModelMapping:
+    return ModelMapping(
+        name=name,
+        fields=[
+            FieldMapping(
+                name="id", type=FieldType.INTEGER, primary_key=True, autoincrement=True
+            ),
+            *fields,
+        ],
+    )
+
+
+def fk(name: str, tablename: str) -> FieldMapping:
+    return FieldMapping(name=name, type=FieldType.FOREIGN_KEY, tablename=tablename)
+
+
+CATALOG = [
+    table("posts", fk("author", "users"), fk("reviewer", "users")),
+    table(
+        "users",
+        FieldMapping(name="email", type=FieldType.STRING, max_length=63, index=True),
+        fk("pinned", "posts"),
+        FieldMapping(name="tags", type=FieldType.MANY2MANY, tablename="tags"),
+    ),
+    table("tags"),
+]
+
+
+def test_compile_catalog() -> None:
+    statements = DDLCompiler("postgresql").compile_catalog(CATALOG)
+    assert [statement.split(" (")[0] for statement in statements] == [
+        'CREATE TABLE "tags"',
+        'CREATE TABLE "posts"',
+        'CREATE TABLE "users"',
+        'CREATE INDEX "ix_users_email" ON "users"',
+        'CREATE TABLE "users_tags"',
+        'CREATE INDEX "ix_users_tags_users_id" ON "users_tags"',
+        'CREATE INDEX "ix_users_tags_tags_id" ON "users_tags"',
+        'ALTER TABLE "posts" ADD CONSTRAINT "fk_posts_author" FOREIGN KEY',
+        'ALTER TABLE "posts" ADD CONSTRAINT "fk_posts_reviewer" FOREIGN KEY',
+    ]
+    assert "REFERENCES" not in statements[1]
+    assert 'REFERENCES "posts"' in statements[2]
+
+
+def test_compile_reference_types() -> None:
+    codes = ModelMapping(
+        name="users",
+        fields=[FieldMapping(name="code", type=FieldType.STRING, max_length=8, primary_key=True)],
+    )
+    compiler = DDLCompiler("postgresql")
+    posts = compiler.compile_catalog([codes, CATALOG[0]])[-1]
+    assert '"author" VARCHAR(8) NOT NULL' in posts
+    assert '"author" INTEGER NOT NULL' in compiler.compile(CATALOG[0])[0]
+
+
+def test_compile_cache() -> None:
+    compiler = DDLCompiler("sqlite")
+    first = compiler.compile_catalog(CATALOG)
+    assert compiler.compile_catalog(CATALOG) == first
+    assert compiler.cache.info().hits == 4
+    assert all("ADD CONSTRAINT" not in statement for statement in first)
+
+
+def test_apply() -> None:
+    connection = sqlite3.connect(":memory:")
+    apply(connection, CATALOG)
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    assert {"posts", "users", "tags", "users_tags", "ix_users_email"} <= tables
+
+    with pytest.raises(sqlite3.OperationalError):
+        apply(connection, [table("comments"), table("tags")])
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    assert "comments" not in tables
@@ -0,0 +1,164 @@
+import sqlite3
+
+from orm_bridge.dialect import get_dialect
+from orm_bridge.diff import diff
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+
+def catalog(*mappings: ModelMapping) -> dict[str, ModelMapping]:
+    return {mapping.name: mapping for mapping in mappings}
+
+
+def users(**email: object) -> ModelMapping:
+    return ModelMapping(
+        name="users",
+        fields=[
+            FieldMapping(
+                name="id", type=FieldType.INTEGER, primary_key=True, autoincrement=True
+            ),
+            FieldMapping(name="email", type=FieldType.STRING, max_length=63, **email),
+        ],
+    )
+
+
+def posts(author: str = "author") -> ModelMapping:
+    return ModelMapping(
+        name="posts",
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+            FieldMapping(name=author, type=FieldType.FOREIGN_KEY, tablename="users"),
+        ],
+    )
+
+
+def test_diff_unchanged() -> None:
+    old = catalog(users(), posts())
+    schema = diff(old, catalog(users(), posts()))
+    assert not schema
+    assert schema.plan("sqlite") == schema.plan("postgresql") == []
+
+
+def test_diff_tables() -> None:
+    old = catalog(users())
+    tags = ModelMapping(name="tags", fields=[FieldMapping(name="id", type=FieldType.INTEGER)])
+    new = catalog(
+        ModelMapping(name="members", fields=users().fields),
+        posts(),
+        tags,
+    )
+    schema = diff(old, new)
+    assert [(o.name, n.name) for o, n in schema.renamed] == [("users", "members")]
+    assert [mapping.name for mapping in schema.added] == ["posts", "tags"]
+    assert not schema.removed and not schema.changed
+
+    plan = schema.plan("sqlite")
+    assert plan[0] == 'ALTER TABLE "users" RENAME TO "members"'
+    assert plan[1].startswith('CREATE TABLE "posts"')
+
+    schema = diff(new, catalog(tags))
+    assert schema.plan("postgresql")[-2:] == ['DROP TABLE "posts"', 'DROP TABLE "members"']
+
+
+def test_diff_fields() -> None:
+    schema = diff(catalog(users(), posts()), catalog(users(), posts("writer")))
+    table = schema.changed[0]
+    assert [(o.name, n.name) for o, n in table.renamed] == [("author", "writer")]
+    assert table.plan("postgresql") == [
+        'ALTER TABLE "posts" RENAME COLUMN "author" TO "writer"',
+        'ALTER TABLE "posts" RENAME CONSTRAINT "fk_posts_author" TO "fk_posts_writer"',
+    ]
+    # sqlite can't rename the constraint in place
+    assert table.requires_rebuild(get_dialect("sqlite"))
+
+
+def test_diff_index_in_place() -> None:
+    schema = diff(catalog(users()), catalog(users(index=True)))
+    for dialect in ("sqlite", "postgresql"):
+        assert schema.plan(dialect) == [
+            'CREATE INDEX "ix_users_email" ON "users" ("email")'
+        ]
+
+
+def test_diff_alter_or_rebuild() -> None:
+    schema = diff(catalog(users()), catalog(users(nullable=True, default="")))
+    assert schema.changed[0].changed[0].attributes == {"nullable", "default"}
+    assert schema.plan("postgresql") == [
+        'ALTER TABLE "users" ALTER COLUMN "email" DROP NOT NULL',
+        'ALTER TABLE "users" ALTER COLUMN "email" SET DEFAULT \'\'',
+    ]
+
+    plan = schema.plan("sqlite")
+    assert plan[0] == "PRAGMA foreign_keys=OFF"
+    assert plan[1].startswith('CREATE TABLE "_new_users"')
+    assert plan[-2:] == ['ALTER TABLE "_new_users" RENAME TO "users"', "PRAGMA foreign_keys=ON"]
+
+
+def test_diff_alter_type() -> None:
+    old = users()
+    new = users()
+    new.fields[1] = FieldMapping(name="email", type=FieldType.INTEGER)
+    assert diff(catalog(old), catalog(new)).plan("postgresql") == [
+        'ALTER TABLE "users" ALTER COLUMN "email" TYPE INTEGER '
+        'USING CAST("email" AS INTEGER)'
+    ]
+
+
+def test_diff_reference_type() -> None:
+    codes = ModelMapping(
+        name="users",
+        fields=[FieldMapping(name="code", type=FieldType.STRING, max_length=8, primary_key=True)],
+    )
+    old = catalog(codes, ModelMapping(name="posts", fields=posts().fields[:1]))
+    plan = diff(old, catalog(codes, posts())).plan("postgresql")
+    assert plan == [
+        'ALTER TABLE "posts" ADD COLUMN "author" VARCHAR(8) NOT NULL '
+        'CONSTRAINT "fk_posts_author" REFERENCES "users"'
+    ]
+    assert '"author" VARCHAR(8)' in diff({}, catalog(codes, posts())).plan("postgresql")[1]
+
+
+def test_diff_sqlite_plan_applies() -> None:
+    connection = sqlite3.connect(":memory:")
+    email = dict(unique=True, nullable=False, default="", index=True)
+    steps = [
+        catalog(users(), posts()),
+        catalog(users(**email), posts("writer")),
+        catalog(ModelMapping(name="members", fields=users(**email).fields)),
+    ]
+    previous: dict[str, ModelMapping] = {}
+    for i, step in enumerate(steps):
+        with connection:
+            for statement in diff(previous, step).plan("sqlite"):
+                connection.execute(statement)
+        previous = step
+        if "users" in step:
+            connection.execute("INSERT INTO users (email) VALUES (?)", (f"{i}@b.c",))
+
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    assert {"members", "ix_members_email"} <= tables
+    assert "users" not in tables and "posts" not in tables
+    assert connection.execute("SELECT email FROM members").fetchall() == [
+        ("0@b.c",),
+        ("1@b.c",),
+    ]
+
+
+def test_diff_sqlite_rebuild_keeps_references() -> None:
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    connection.execute("PRAGMA foreign_keys=ON")
+    for statement in diff({}, catalog(users(), posts())).plan("sqlite"):
+        connection.execute(statement)
+    connection.execute("INSERT INTO users (id, email) VALUES (1, 'a@b.c')")
+    connection.execute("INSERT INTO posts (id, author) VALUES (1, 1)")
+
+    rebuilt = diff(catalog(users(), posts()), catalog(users(nullable=True), posts("writer")))
+    for statement in rebuilt.plan("sqlite"):
+        connection.execute(statement)
+
+    assert connection.execute("SELECT * FROM posts").fetchall() == [(1, 1)]
+    assert connection.execute("PRAGMA foreign_keys").fetchone() == (1,)
+    assert connection.execute("PRAGMA foreign_key_check").fetchall() == []
+    (schema,) = connection.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'posts'"
+    ).fetchone()
+    assert "fk_posts_writer" in schema and "fk_posts_author" not in schema
@@ -0,0 +1,98 @@
+import pytest
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.environment import Environment
+from orm_bridge.errors import FieldBridgeError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event, Registration, Promocode
+
+
+def test_environment_relation_indexes() -> None:
+    env = Environment()
+    result = Translator(OrmarBridge(), TortoiseBridge()).translate_many(
+        User, Event, Registration, Promocode, environment=env
+    )
+
+    assert env.table_models["registrations"] is result[Registration]
+    assert [(ref.tablename, ref.field.name) for ref in env.referencing("users")] == [
+        ("registrations", "user")
+    ]
+    through = env.get_through("promocodes_events")
+    assert through is not None
+    assert (through.source, through.target) == ("promocodes", "events")
+
+    with pytest.raises(AttributeError):
+        env.referencing("users").append(None)  # type: ignore
+    assert len(env.referencing("users")) == 1
+
+
+def test_environment_register_replaces() -> None:
+    def comments(target: str) -> ModelMapping:
+        return ModelMapping(
+            name="comments",
+            fields=[
+                FieldMapping(
+                    name="post",
+                    type=FieldType.FOREIGN_KEY,
+                    tablename=target,
+                    related_name="comments",
+                ),
+                FieldMapping(name="tags", type=FieldType.MANY2MANY, tablename="tags"),
+            ],
+        )
+
+    env = Environment({"comments": comments("posts")})
+    assert env.get_related("posts", "comments") is not None
+    assert env.get_through("comments_tags") is not None
+
+    env.register_mapping(comments("articles"))
+    assert env.referencing("posts") == ()
+    assert env.get_related("posts", "comments") is None
+    assert env.referencing("articles")[0].tablename == "comments"
+
+    env.unregister_mapping("comments")
+    assert not env.references and not env.throughs and not env.related_names
+
+
+def test_environment_keeps_target_models() -> None:
+    env = Environment()
+    tortoise_event = Translator(OrmarBridge(), TortoiseBridge()).translate_many(
+        Event, environment=env
+    )[Event]
+    assert env.table_models["events"] is tortoise_event
+
+    ormar_event = Translator(TortoiseBridge(), OrmarBridge()).translate_many(
+        tortoise_event, environment=env
+    )[tortoise_event]
+    assert OrmarBridge.is_model(ormar_event)
+    assert env.table_models["events"] is ormar_event
+
+    translator = Translator(OrmarBridge(env), TortoiseBridge(env))
+    event = translator.translate(Event, name="event")
+    assert env.table_models["event"] is event
+
+
+def test_bridge_checks_related_names() -> None:
+    def comments(name: str, related_name: str) -> ModelMapping:
+        return ModelMapping(
+            name=name,
+            fields=[
+                FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+                FieldMapping(
+                    name="post",
+                    type=FieldType.FOREIGN_KEY,
+                    tablename="posts",
+                    related_name=related_name,
+                ),
+            ],
+        )
+
+    env = Environment({"comments": comments("comments", "comments")})
+    bridge = TortoiseBridge(env)
+    bridge.get_model(comments("comments", "comments"))
+    bridge.get_model(comments("replies", "replies"))
+    with pytest.raises(FieldBridgeError):
+        bridge.get_model(comments("replies", "comments"))
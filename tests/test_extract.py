@@ -0,0 +1,135 @@
+import glob
+import typing
+
+from orm_bridge import extract, persist
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.sqlalchemy import SQLAlchemyBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.environment import Environment
+from orm_bridge.extract import extract_mappings
+from orm_bridge.persist import MappingCache
+
+from tests import ormar_models
+
+
+def test_discover_models() -> None:
+    assert OrmarBridge.discover_models(ormar_models) == [
+        ormar_models.User,
+        ormar_models.Event,
+        ormar_models.Registration,
+        ormar_models.Promocode,
+    ]
+
+
+def test_extract_mappings() -> None:
+    paths = ["tests.ormar_models", "tests.missing_models", "tests.ormar_models:User"]
+    env = Environment()
+    sequential = extract_mappings(OrmarBridge, paths, environment=env, workers=1)
+    parallel = extract_mappings(OrmarBridge, paths, workers=2)
+
+    assert list(env.table_mappings) == ["users", "events", "registrations", "promocodes"]
+    assert env.table_mappings["users"] == OrmarBridge().get_mapping(ormar_models.User)
+    assert parallel.mappings == sequential.mappings
+    assert parallel.failures == sequential.failures
+    assert [path for path, _ in sequential.failures] == [
+        "tests.missing_models",
+        "tests.ormar_models:User",
+    ]
+
+
+def test_extract_other_bridges() -> None:
+    tortoise = extract_mappings(TortoiseBridge, ["tests.tortoise_models"], workers=1)
+    tortoise.check()
+    assert list(tortoise.mappings) == ["product_categories", "products"]
+
+    sqlalchemy = extract_mappings(SQLAlchemyBridge, ["tests.sqlalchemy_models"], workers=1)
+    assert list(sqlalchemy.mappings) == ["users", "notes"]
+
+
+def test_extract_cached(tmp_path, monkeypatch) -> None:
+    cache = MappingCache(tmp_path)
+    paths = ["tests.ormar_models", "tests.missing_models"]
+    cold = extract_mappings(OrmarBridge, paths, workers=1, cache=cache)
+    assert len(glob.glob(str(tmp_path / "*@*.json"))) == 1
+
+    def fail(*args: typing.Any) -> None:
+        raise AssertionError("cached module was introspected")
+
+    monkeypatch.setattr(extract, "extract_module", fail)
+    warm = extract_mappings(OrmarBridge, paths[:1], workers=1, cache=cache)
+    assert warm.mappings == cold.mappings
+    assert warm.models == cold.models
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_invalidation(tmp_path, monkeypatch) -> None:
+    cache = MappingCache(tmp_path)
+    path = "tests.sqlalchemy_models"
+    extraction = extract_mappings(SQLAlchemyBridge, [path], workers=1, cache=cache)
+    entries = list(extraction.mappings)
+    assert [item.record.name for item in cache.load(SQLAlchemyBridge, path)] == entries
+    assert cache.load(TortoiseBridge, path) is None
+    assert cache.load(SQLAlchemyBridge, path, {"tortoise_names": {}}) is None
+
+    # editing the module misses and replaces its entry
+    monkeypatch.setattr(persist, "source_digest", lambda path: "edited")
+    assert cache.load(SQLAlchemyBridge, path) is None
+    extract_mappings(SQLAlchemyBridge, [path], workers=1, cache=cache)
+    assert len(glob.glob(str(tmp_path / "*"))) == 2
+
+    # broken entries are removed
+    (snapshot_file,) = glob.glob(str(tmp_path / "*.snapshot"))
+    with open(snapshot_file, "r+b") as file:
+        file.truncate(10)
+    assert cache.load(SQLAlchemyBridge, path) is None
+    assert glob.glob(str(tmp_path / "*")) == []
+
+    extract_mappings(SQLAlchemyBridge, [path], workers=1, cache=cache)
+    assert cache.invalidate(OrmarBridge) == 0
+    assert cache.invalidate(SQLAlchemyBridge, path) == 1
+    assert glob.glob(str(tmp_path / "*")) == []
+
+
+def test_cache_checks_base_modules(tmp_path, monkeypatch) -> None:
+    package = tmp_path / "mixin_models"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "mixins.py").write_text(
+        "from sqlalchemy import Column, String\n\n\n"
+        "class Named:\n    name = Column(String(40))\n"
+    )
+    (package / "models.py").write_text(
+        "from sqlalchemy import Column, Integer\n"
+        "from sqlalchemy.orm import declarative_base\n\n"
+        "from mixin_models.mixins import Named\n\n"
+        "Base = declarative_base()\n\n\n"
+        "class Tag(Named, Base):\n"
+        "    __tablename__ = 'mixin_tags'\n\n"
+        "    id = Column(Integer, primary_key=True)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    cache = MappingCache(tmp_path / "cache")
+    path = "mixin_models.models"
+    extraction = extract_mappings(SQLAlchemyBridge, [path], workers=1, cache=cache)
+    assert {field.name for field in extraction.mappings["mixin_tags"].fields} == {"id", "name"}
+    (entry,) = cache.load(SQLAlchemyBridge, path)
+    assert "mixin_models.mixins" in entry.bases
+
+    # the model module is unchanged, but its mixin is not
+    (package / "mixins.py").write_text(
+        "from sqlalchemy import Column, String\n\n\n"
+        "class Named:\n    name = Column(String(80))\n"
+    )
+    assert cache.load(SQLAlchemyBridge, path) is None
+    assert glob.glob(str(tmp_path / "cache" / "*")) == []
+
+
+def test_cache_key_options(tmp_path) -> None:
+    cache = MappingCache(tmp_path)
+    path = "tests.sqlalchemy_models"
+    named = cache.key(SQLAlchemyBridge, path, {"factory": glob.glob, "tags": {"b", "a"}})
+    assert named == cache.key(SQLAlchemyBridge, path, {"tags": {"a", "b"}, "factory": glob.glob})
+    assert named != cache.key(SQLAlchemyBridge, path, {"factory": glob.escape})
+    assert cache.key(SQLAlchemyBridge, path, {"factory": lambda: None}) is None
+    assert cache.key(SQLAlchemyBridge, path, {"value": object()}) is None
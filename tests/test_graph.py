@@ -0,0 +1,68 @@
+import typing
+
+import pytest
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.errors import MappingError
+from orm_bridge.graph import RelationGraph
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event, Registration, Promocode
+
+
+def relation(
+    name: str, tablename: str, through: typing.Optional[str] = None
+) -> FieldMapping:
+    return FieldMapping(
+        name=name,
+        type=FieldType.MANY2MANY if through else FieldType.FOREIGN_KEY,
+        tablename=tablename,
+        through=through,
+    )
+
+
+def test_relation_graph() -> None:
+    graph = RelationGraph(
+        [
+            ModelMapping(name="registrations", fields=[relation("user", "users")]),
+            ModelMapping(
+                name="promocodes",
+                fields=[relation("events", "events", through="promocodes_events")],
+            ),
+            ModelMapping(name="users", fields=[relation("parent", "users")]),
+            ModelMapping(name="promocodes_events", fields=[]),
+            ModelMapping(name="events", fields=[]),
+            ModelMapping(name="a", fields=[relation("b", "b")]),
+            ModelMapping(name="b", fields=[relation("a", "a")]),
+        ]
+    )
+    assert graph.order() == [
+        "users",
+        "registrations",
+        "events",
+        "promocodes",
+        "promocodes_events",
+        "a",
+        "b",
+    ]
+    assert graph.components() == [
+        ["users", "registrations"],
+        ["events", "promocodes", "promocodes_events"],
+        ["a", "b"],
+    ]
+    with pytest.raises(MappingError):
+        graph.add(ModelMapping(name="users", fields=[]))
+
+
+def test_translate_many_workers() -> None:
+    models = (Promocode, Registration, User, Event)
+    sequential = Translator(OrmarBridge(), TortoiseBridge()).translate_many(*models)
+    parallel = Translator(OrmarBridge(), TortoiseBridge()).translate_many(
+        *models, workers=4
+    )
+    assert list(parallel) == list(sequential) == list(models)
+    for model in models:
+        assert parallel.get_mapping(model) == sequential.get_mapping(model)
+        assert parallel[model].__name__ == sequential[model].__name__
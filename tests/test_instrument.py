@@ -0,0 +1,59 @@
+import io
+import json
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.instrument import (
+    CLASS_CREATION,
+    FIELD_BRIDGING,
+    INTROSPECTION,
+    TRANSLATION,
+    Collector,
+    Instrumentation,
+    JSONSink,
+    Measurement,
+)
+from orm_bridge.mapping import FieldType
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event, Registration, Promocode
+
+
+def test_instrumentation() -> None:
+    collector = Collector()
+    output = io.StringIO()
+    measurements: list[Measurement] = []
+    instrumentation = Instrumentation(collector, JSONSink(output), measurements.append)
+
+    translator = Translator(OrmarBridge(), TortoiseBridge(), instrumentation=instrumentation)
+    translator.translate_many(User, Event, Registration, Promocode)
+
+    assert set(collector.phases) == {INTROSPECTION, FIELD_BRIDGING, CLASS_CREATION, TRANSLATION}
+    assert collector.phases[INTROSPECTION].count == 4
+    assert collector.phases[CLASS_CREATION].count == 4
+    assert collector.fields_histogram == {2: 1, 3: 2, 4: 1}
+    assert collector.field_types[FieldType.FOREIGN_KEY].count == 4
+    assert {model for model, _ in collector.slowest_models()} == {
+        "users",
+        "events",
+        "registrations",
+        "promocodes",
+    }
+    assert "slowest field bridges" in collector.report()
+
+    assert measurements == collector.measurements
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(lines) == len(measurements)
+    assert lines[0] == {
+        "phase": FIELD_BRIDGING,
+        "duration": lines[0]["duration"],
+        "field_type": "integer",
+        "bridge": "NumberOrmar",
+    }
+
+
+def test_uninstrumented_bridge() -> None:
+    bridge = OrmarBridge()
+    assert "get_model" not in vars(bridge)
+    bridge.instrument(Instrumentation())
+    assert "get_model" in vars(bridge)
@@ -0,0 +1,71 @@
+import gc
+
+import pytest
+
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.intern import InternedField, Interner
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+
+
+def mapping(name: str) -> ModelMapping:
+    return ModelMapping(
+        name=name,
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+            FieldMapping(
+                name="status", type=FieldType.STRING, max_length=15, choices={"draft", "done"}
+            ),
+            FieldMapping(name="is_active", type=FieldType.BOOLEAN, default=True),
+        ],
+    )
+
+
+def test_fields_are_shared() -> None:
+    interner = Interner()
+    first, second = interner.intern_catalog([mapping("posts"), mapping("pages")])
+    assert first == mapping("posts")
+    assert all(a is b for a, b in zip(first.fields, second.fields))
+    assert isinstance(first.fields[1].choices, frozenset)
+    assert first.fingerprint() == mapping("posts").fingerprint()
+    assert interner.info().fields == 3
+    assert interner.intern_mapping(mapping("posts")) is first
+
+
+def test_choices_are_shared() -> None:
+    interner = Interner()
+    assert interner.intern_choices({"a", "b"}) is interner.intern_choices(frozenset({"b", "a"}))
+    assert interner.intern_choices({1}) is not interner.intern_choices({True})
+
+
+def test_types_are_kept_apart() -> None:
+    interner = Interner()
+    number = interner.intern_field(FieldMapping(name="x", type=FieldType.FLOAT, default=1))
+    boolean = interner.intern_field(FieldMapping(name="x", type=FieldType.FLOAT, default=True))
+    assert number is not boolean
+    assert boolean.default is True
+
+
+def test_immutable() -> None:
+    field = Interner().intern_field(FieldMapping(name="id", type=FieldType.INTEGER))
+    assert isinstance(field, InternedField)
+    with pytest.raises(TypeError):
+        field.name = "pk"
+
+
+def test_unhashable_values() -> None:
+    field = FieldMapping(name="tags", type=FieldType.STRING, default=["a"])
+    assert Interner().intern_field(field) is field
+
+
+def test_weak_table() -> None:
+    interner = Interner()
+    catalog = interner.intern_catalog([mapping("posts")])
+    assert interner.info().models == 1
+    del catalog
+    gc.collect()
+    assert interner.info()[2:] == (0, 0, 0)
+
+
+def test_translate_interned() -> None:
+    model = TortoiseBridge().get_model(Interner().intern_mapping(mapping("interned_posts")))
+    assert set(TortoiseBridge().get_mapping(model).fields[1].choices) == {"draft", "done"}
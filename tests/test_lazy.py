@@ -0,0 +1,56 @@
+import concurrent.futures
+import threading
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.environment import Environment
+from orm_bridge.lazy import LazyModel
+from orm_bridge.mapping import ModelMapping
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event, Registration, Promocode
+
+
+class CountingTortoiseBridge(TortoiseBridge):
+    def __init__(self) -> None:
+        super().__init__()
+        self.built: list[str] = []
+        self.lock = threading.Lock()
+
+    def get_model(self, mapping: ModelMapping):  # type: ignore
+        with self.lock:
+            self.built.append(mapping.name)
+        return super().get_model(mapping)
+
+
+def test_translate_many_lazy() -> None:
+    bridge = CountingTortoiseBridge()
+    env = Environment()
+    result = Translator(OrmarBridge(), bridge).translate_many(
+        User, Event, Registration, Promocode, environment=env, lazy=True
+    )
+    assert bridge.built == []
+    assert all(isinstance(env.table_models[name], LazyModel) for name in env.table_models)
+
+    registration = result[Registration]
+    assert "user" in registration._meta.fields_map
+    assert bridge.built == ["users", "events", "registrations"]
+    assert env.table_models["registrations"] is registration.materialize()
+    assert env.table_models["users"] is result[User].materialize()
+    assert isinstance(env.table_models["promocodes"], LazyModel)
+
+    user = result[User](id=1, name="admin", is_active=True, role="seller")
+    assert user.name == "admin"
+    assert bridge.built == ["users", "events", "registrations"]
+
+
+def test_lazy_model_threads() -> None:
+    bridge = CountingTortoiseBridge()
+    result = Translator(OrmarBridge(), bridge).translate_many(
+        User, Event, Registration, Promocode, lazy=True
+    )
+    models = [result[model] for model in (Registration, Promocode, User, Event)] * 8
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        built = list(pool.map(LazyModel.materialize, models))
+    assert sorted(bridge.built) == ["events", "promocodes", "registrations", "users"]
+    assert built[:4] == built[4:8]
@@ -0,0 +1,35 @@
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.mapping import (
+    FieldMapping,
+    FieldRecord,
+    FieldType,
+    ModelMapping,
+    ModelRecord,
+)
+
+from tests.ormar_models import User
+
+
+def test_trusted_mapping() -> None:
+    values = dict(
+        name="role", type=FieldType.STRING, max_length=31, choices={"customer", "seller"}
+    )
+    trusted = FieldMapping.trusted(**values)
+    assert trusted == FieldMapping(**values)
+    assert trusted.__fields_set__ == set(values)
+    assert ModelMapping.trusted("users", [trusted]) == ModelMapping(
+        name="users", fields=[values]
+    )
+
+
+def test_mapping_records() -> None:
+    mapping = OrmarBridge().get_mapping(User)
+    record = ModelRecord.from_mapping(mapping)
+    assert record.name == "users"
+    assert record.fields[3] == FieldRecord(
+        type=FieldType.STRING,
+        name="role",
+        max_length=31,
+        choices=frozenset({"customer", "seller"}),
+    )
+    assert record.to_mapping() == mapping
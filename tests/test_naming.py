@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.environment import Environment
+from orm_bridge.errors import NamingConflict
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.naming import NamingStrategy
+
+
+def test_naming_strategy() -> None:
+    naming = NamingStrategy({"models.ProductCategory": "product_categories"})
+    assert naming.get_name("product_categories") == "models.ProductCategory"
+    assert naming.get_tablename("models.ProductCategory") == "product_categories"
+    assert naming.get_name("classes") == "Class"
+    assert naming.get_name("categories") == "Category"
+    assert naming.get_tablename("models.Product") == "products"
+
+    with pytest.raises(NamingConflict):
+        naming.register("models.Category", "product_categories")
+    naming.register("models.ProductCategory", "categories")
+    assert naming.get_name("categories") == "models.ProductCategory"
+    assert naming.get_name("product_categories") == "Product_category"
+
+
+def test_tortoise_naming_environment() -> None:
+    environment: Environment = Environment(
+        tortoise_names={"models.ProductCategory": "product_categories"}
+    )
+    bridge = TortoiseBridge(environment=environment)
+    model = bridge.get_model(
+        ModelMapping(
+            name="products",
+            fields=[
+                FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+                FieldMapping(
+                    name="category",
+                    type=FieldType.FOREIGN_KEY,
+                    tablename="product_categories",
+                ),
+            ],
+        )
+    )
+    assert model.__name__ == "Product"
+    assert model._meta.fk_fields == {"category"}
+    assert model._meta.fields_map["category"].model_name == "models.ProductCategory"
+
+
+def test_naming_memo_is_per_strategy() -> None:
+    first, second = NamingStrategy(), NamingStrategy()
+    assert first.get_name("categories") == "Category"
+    assert first._singulars == {"categories": "Category"}
+    assert second._singulars == {}
+
+
+def test_environment_naming_follows_options() -> None:
+    environment: Environment = Environment(tortoise_names={"models.Person": "people"})
+    naming = environment.naming
+    assert naming.get_name("people") == "models.Person"
+    assert environment.naming is naming
+
+    environment.options["tortoise_names"] = {"models.Human": "people"}
+    assert environment.naming.get_name("people") == "models.Human"
+    names = environment.options["tortoise_names"]
+    names["models.Staff"] = "staff"
+    environment.set_tortoise_names(names)
+    assert environment.naming.get_tablename("models.Staff") == "staff"
+    environment.set_tortoise_names(None)
+    assert environment.naming.get_name("people") == "People"
+    assert "tortoise_names" not in environment.options
+
+    given = NamingStrategy()
+    environment = Environment(naming=given, tortoise_names={"models.Human": "people"})
+    environment.set_tortoise_names({"models.Staff": "staff"})
+    assert environment.naming is given
+
+
+def test_environment_naming_does_not_scan_options() -> None:
+    class CountingNames(dict):
+        compared = 0
+
+        def __eq__(self, other: object) -> bool:
+            CountingNames.compared += 1
+            return super().__eq__(other)
+
+        __hash__ = None  # type: ignore
+
+    names = CountingNames((f"models.Model{i}", f"table_{i}") for i in range(100_000))
+    environment: Environment = Environment(tortoise_names=names)
+    assert environment.naming.get_name("table_7") == "models.Model7"
+    naming = environment.naming
+    for _ in range(1000):
+        assert environment.naming is naming
+    assert CountingNames.compared == 0
+
+    # lookups take as long with one name as with the whole option
+    small: Environment = Environment(tortoise_names={"models.Model7": "table_7"})
+    timings = []
+    for env in (small, environment):
+        env.naming.get_name("table_7")
+        start = time.perf_counter()
+        for _ in range(10_000):
+            env.naming.get_name("table_7")
+        timings.append(time.perf_counter() - start)
+    assert timings[1] < timings[0] * 10
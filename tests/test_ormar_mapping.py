@@ -1,5 +1,5 @@
 from orm_bridge.bridge.ormar import OrmarBridge
-from orm_bridge.mapping import FieldType, FieldMapping
+from orm_bridge.mapping import FieldType, FieldMapping, ModelMapping
 from tests.ormar_models import User, Registration, Promocode
 
 
@@ -61,3 +61,24 @@ def test_ormar_mapping_m2m() -> None:
         type=FieldType.MANY2MANY,
         tablename="events",
     )
+
+
+def test_ormar_model_roundtrip() -> None:
+    mapping = ModelMapping(
+        name="products",
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+            FieldMapping(name="price", type=FieldType.FLOAT, ge=0, nullable=True),
+            FieldMapping(
+                name="source",
+                type=FieldType.STRING,
+                max_length=9,
+                nullable=True,
+                choices={"warehouse", "shop"},
+            ),
+        ],
+    )
+    bridge = OrmarBridge()
+    model = bridge.get_model(mapping)
+    assert model.Meta.tablename == "products"
+    assert bridge.get_mapping(model) == mapping
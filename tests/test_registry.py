@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+from orm_bridge import bridge
+from orm_bridge.bridge import get_bridge, register_bridge
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.errors import BridgeError
+
+
+def test_get_bridge(monkeypatch) -> None:
+    assert get_bridge("ormar") is OrmarBridge
+    assert bridge.OrmarBridge is OrmarBridge
+    with pytest.raises(BridgeError):
+        get_bridge("peewee")
+
+    # registrations of a test must not outlive it
+    backends = bridge.BACKENDS
+    monkeypatch.setattr(bridge, "BACKENDS", dict(backends))
+    monkeypatch.setattr(bridge, "_bridges", dict(bridge._bridges))
+    register_bridge("ormar-copy", "orm_bridge.bridge.ormar:OrmarBridge")
+    assert get_bridge("ormar-copy") is OrmarBridge
+    assert "ormar-copy" in bridge.available_bridges()
+
+    monkeypatch.undo()
+    assert bridge.BACKENDS is backends
+    assert "ormar-copy" not in bridge.available_bridges()
+    with pytest.raises(BridgeError):
+        get_bridge("ormar-copy")
+
+
+def test_backends_are_imported_lazily() -> None:
+    code = (
+        "import sys, orm_bridge\n"
+        "from orm_bridge.bridge import get_bridge\n"
+        "get_bridge('tortoise')\n"
+        "assert 'tortoise' in sys.modules\n"
+        "assert 'sqlalchemy' not in sys.modules and 'ormar' not in sys.modules\n"
+        "import orm_bridge.bridge.sqlalchemy as module\n"
+        "assert module._base is None\n"
+        "assert module.Base is module.get_base()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,94 @@
+import datetime
+
+import pytest
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.errors import SnapshotError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.snapshot import HEADER, Snapshot, dump, dumps
+
+from tests.ormar_models import User, Event, Registration, Promocode
+
+
+def test_snapshot(tmp_path) -> None:
+    bridge = OrmarBridge()
+    mappings = [bridge.get_mapping(model) for model in (User, Event, Registration, Promocode)]
+    mappings.append(
+        ModelMapping(
+            name="prices",
+            fields=[
+                FieldMapping(name="amount", type=FieldType.FLOAT, ge=0.5, le=10, default=1.5),
+            ],
+        )
+    )
+    path = tmp_path / "catalog.snapshot"
+    dump(mappings, path)
+
+    with Snapshot.open(path) as snapshot:
+        assert list(snapshot) == ["users", "events", "registrations", "promocodes", "prices"]
+        assert not snapshot._decoded
+        assert snapshot["registrations"] == mappings[2]
+        assert list(snapshot._decoded) == ["registrations"]
+        assert snapshot["registrations"] is snapshot["registrations"]
+        assert dict(snapshot) == {mapping.name: mapping for mapping in mappings}
+        assert "orders" not in snapshot
+
+
+def test_snapshot_stores_choices_once() -> None:
+    def roles(choices: set) -> ModelMapping:
+        return ModelMapping(
+            name="users",
+            fields=[FieldMapping(name="role", type=FieldType.STRING, choices=choices)],
+        )
+
+    one, many = dumps([roles({"admin"})]), dumps([roles({"admin", "customer", "seller"})])
+    assert b'"customer"' in many and many.count(b'"customer"') == 1
+    assert len(many) - len(one) == len(b', "customer", "seller"')
+    assert Snapshot(many)["users"] == roles({"admin", "customer", "seller"})
+
+
+def test_snapshot_errors(tmp_path) -> None:
+    mapping = ModelMapping(
+        name="events",
+        fields=[
+            FieldMapping(
+                name="date", type=FieldType.DATETIME, default=datetime.date(2022, 12, 1)
+            )
+        ],
+    )
+    with pytest.raises(SnapshotError):
+        dumps([mapping])
+    with pytest.raises(SnapshotError):
+        Snapshot(b"NOPE" + dumps([])[4:])
+    dates = mapping.fields[0].copy(
+        update={"default": None, "choices": {datetime.date(2022, 12, 1)}}
+    )
+    with pytest.raises(SnapshotError):
+        dumps([ModelMapping(name="events", fields=[dates])])
+
+    empty = tmp_path / "empty.snapshot"
+    empty.touch()
+    with pytest.raises(SnapshotError):
+        Snapshot.open(empty)
+
+
+def test_snapshot_corrupted_after_header() -> None:
+    bridge = OrmarBridge()
+    data = dumps(bridge.get_mapping(model) for model in (User, Event, Registration, Promocode))
+
+    def decode(buffer: bytes) -> None:
+        snapshot = Snapshot(buffer)
+        for tablename in snapshot:
+            snapshot[tablename]
+
+    decode(data)
+    for size in range(HEADER.size, len(data)):
+        with pytest.raises(SnapshotError):
+            decode(data[:size])
+    for position in range(HEADER.size, len(data)):
+        corrupted = bytearray(data)
+        corrupted[position] ^= 0xFF
+        try:
+            decode(bytes(corrupted))
+        except SnapshotError:
+            pass
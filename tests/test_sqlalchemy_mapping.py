@@ -1,7 +1,12 @@
+import gc
+import tracemalloc
+
+import sqlalchemy
+
 import orm_bridge
 from orm_bridge.bridge.sqlalchemy import SQLAlchemyBridge
-from orm_bridge.mapping import FieldType, FieldMapping
-from tests.sqlalchemy_models import User
+from orm_bridge.mapping import FieldType, FieldMapping, ModelMapping
+from tests.sqlalchemy_models import User, Note
 
 
 def test_sqlalchemy_mapping() -> None:
@@ -52,13 +57,17 @@ def test_mapping_to_sqlalchemy():
                 max_length=301,
                 name="description",
             ),
+            orm_bridge.FieldMapping(
+                type=orm_bridge.FieldType.FLOAT,
+                name="rating",
+            ),
         ],
     )
     bridge = SQLAlchemyBridge()
     model = bridge.get_model(mapping)
 
     assert model.__tablename__ == "users"
-    assert len(model.__table__.columns) == 3
+    assert len(model.__table__.columns) == 4
     assert model.__table__.columns[0].name == "id"
     assert model.__table__.columns[1].name == "name"
     assert model.__table__.columns[2].name == "description"
@@ -66,3 +75,72 @@ def test_mapping_to_sqlalchemy():
     assert model.__table__.columns[1].type.__class__.__visit_name__ == FieldType.STRING.value
     assert model.__table__.columns[2].type.__class__.__visit_name__ == FieldType.STRING.value
     assert model.__table__.columns[2].__dict__["type"].length == 301
+    assert bridge.get_mapping(model).fields[3].type == FieldType.FLOAT
+
+
+def test_sqlalchemy_field_dispatch() -> None:
+    bridge = SQLAlchemyBridge()
+    assert bridge.resolve_field_type(sqlalchemy.Unicode) == FieldType.STRING
+    assert bridge.resolve_field_type(sqlalchemy.BigInteger) == FieldType.INTEGER
+    assert bridge.resolve_field_type(sqlalchemy.DateTime) is None
+    assert bridge.get_field_bridge(FieldType.INTEGER) is bridge.get_field_bridge(
+        FieldType.INTEGER
+    )
+
+    mapping = bridge.get_mapping(Note)
+    assert [field.type for field in mapping.fields] == [
+        FieldType.INTEGER,
+        FieldType.STRING,
+    ]
+    assert mapping.fields[1].max_length == 1023
+
+
+def rebuilt(max_length: int) -> ModelMapping:
+    return ModelMapping(
+        name="rebuilt",
+        fields=[
+            FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True),
+            FieldMapping(name="text", type=FieldType.STRING, max_length=max_length),
+        ],
+    )
+
+
+def test_sqlalchemy_bridge_registry() -> None:
+    bridge = SQLAlchemyBridge()
+    model = bridge.get_model(rebuilt(10))
+    assert bridge.get_model(rebuilt(10)) is model
+    assert model.__table__.metadata is bridge.metadata
+    assert bridge.metadata is not SQLAlchemyBridge().metadata
+
+    changed = bridge.get_model(rebuilt(20))
+    assert changed is not model
+    assert bridge.metadata.tables["rebuilt"].c.text.type.length == 20
+    assert sqlalchemy.inspect(model, raiseerr=False) is None
+
+    bridge.dispose()
+    assert not bridge.metadata.tables and not bridge.models and not bridge.registries
+    assert sqlalchemy.inspect(changed, raiseerr=False) is None
+
+    metadata = sqlalchemy.MetaData()
+    assert SQLAlchemyBridge(metadata=metadata).get_model(rebuilt(10)).metadata is metadata
+
+
+def test_sqlalchemy_rebuild_memory() -> None:
+    bridge = SQLAlchemyBridge()
+
+    def rebuild(times: int) -> int:
+        for i in range(times):
+            bridge.get_model(rebuilt(10 + i % 7))
+            if i % 10 == 0:
+                bridge.dispose()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    rebuild(100)
+    tracemalloc.start()
+    try:
+        # sqlalchemy caches some per-class state until warmed up
+        baseline = rebuild(400)
+        assert rebuild(800) - baseline < 16 * 1024
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,172 @@
+import sqlite3
+
+import pytest
+
+from orm_bridge.bridge.ormar import OrmarBridge
+from orm_bridge.bridge.tortoise import TortoiseBridge
+from orm_bridge.ddl import apply
+from orm_bridge.errors import BridgeError
+from orm_bridge.mapping import FieldMapping, FieldType
+from orm_bridge.transfer import Checkpoint, transfer
+from orm_bridge.translator import Translator
+
+from tests.ormar_models import User, Event, Registration, Promocode
+
+
+def database(path, mappings) -> str:
+    connection = sqlite3.connect(path)
+    apply(connection, mappings)
+    connection.close()
+    return str(path)
+
+
+def rows(path: str, table: str) -> list[tuple]:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def databases(tmp_path):
+    result = Translator(OrmarBridge(), TortoiseBridge()).translate_many(
+        User, Event, Registration, Promocode
+    )
+    mappings = list(result.mappings().values())
+    source = database(tmp_path / "source.db", mappings)
+    target = database(tmp_path / "target.db", mappings)
+
+    connection = sqlite3.connect(source)
+    connection.executemany(
+        "INSERT INTO users (id, name, is_active, role) VALUES (?, ?, 1, 'customer')",
+        [(i, f"user {i}") for i in range(1, 26)],
+    )
+    connection.executemany(
+        "INSERT INTO events (id, name) VALUES (?, ?)", [(i, f"event {i}") for i in range(1, 6)]
+    )
+    connection.executemany(
+        "INSERT INTO registrations (id, user, event) VALUES (?, ?, ?)",
+        [(i, i, i % 5 + 1) for i in range(1, 26)],
+    )
+    connection.execute("INSERT INTO promocodes (id, code) VALUES (1, 'FREE')")
+    connection.executemany(
+        "INSERT INTO promocodes_events (promocodes_id, events_id) VALUES (1, ?)", [(1,), (2,)]
+    )
+    connection.commit()
+    connection.close()
+    return result, source, target
+
+
+def test_transfer(databases) -> None:
+    result, source, target = databases
+    copied = transfer(source, target, result, batch_size=4, workers=3)
+    assert copied == {
+        "users": 25,
+        "events": 5,
+        "registrations": 25,
+        "promocodes": 1,
+        "promocodes_events": 2,
+    }
+    for table in copied:
+        assert rows(target, table) == rows(source, table)
+
+
+def test_transfer_resume(databases, tmp_path) -> None:
+    result, source, target = databases
+    checkpoint = tmp_path / "checkpoint.json"
+    converted = 0
+
+    def fail_after_ten(row: tuple) -> tuple:
+        nonlocal converted
+        converted += 1
+        if converted > 10:
+            raise RuntimeError("connection lost")
+        return row
+
+    with pytest.raises(RuntimeError):
+        transfer(
+            source,
+            target,
+            result,
+            batch_size=4,
+            checkpoint=Checkpoint(checkpoint),
+            converters={"users": fail_after_ten},
+        )
+    assert Checkpoint(checkpoint).get("users") == {"last": 8, "rows": 8}
+    assert len(rows(target, "users")) == 8
+
+    copied = transfer(source, target, result, batch_size=4, checkpoint=Checkpoint(checkpoint))
+    assert copied["users"] == 17
+    assert rows(target, "users") == rows(source, "users")
+    assert transfer(source, target, result, checkpoint=Checkpoint(checkpoint))["users"] == 0
+
+
+def test_transfer_converts(databases, tmp_path) -> None:
+    result, source, _ = databases
+    events = result.mappings()["events"]
+    renamed = events.copy(
+        update={
+            "name": "happenings",
+            "fields": [
+                events.fields[0],
+                events.fields[1].copy(update={"name": "title"}),
+                FieldMapping(name="capacity", type=FieldType.INTEGER, default=100),
+            ],
+        }
+    )
+    target = database(tmp_path / "renamed.db", [renamed])
+    copied = transfer(
+        source,
+        target,
+        [events],
+        targets={"events": renamed},
+        correspondences={"events": {"title": "name"}},
+    )
+    assert copied == {"events": 5}
+    assert rows(target, "happenings")[-1] == (5, "event 5", 100)
+
+
+def test_transfer_resume_after_commit(databases, tmp_path, monkeypatch) -> None:
+    result, source, target = databases
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json")
+    update = Checkpoint.update
+
+    def crash_before_saving(self, tablename: str, **state) -> None:
+        # the batch of keys 5..8 is committed but its checkpoint is lost
+        if state.get("last") == 8:
+            raise RuntimeError("killed")
+        update(self, tablename, **state)
+
+    monkeypatch.setattr(Checkpoint, "update", crash_before_saving)
+    with pytest.raises(RuntimeError):
+        transfer(source, target, result, batch_size=4, checkpoint=checkpoint)
+    monkeypatch.setattr(Checkpoint, "update", update)
+    assert len(rows(target, "users")) == 8
+
+    copied = transfer(
+        source, target, result, batch_size=4, checkpoint=Checkpoint(checkpoint.path)
+    )
+    assert copied["users"] == 17
+    assert rows(target, "users") == rows(source, "users")
+
+
+def test_transfer_refuses_partly_copied(databases, tmp_path) -> None:
+    result, source, target = databases
+    checkpoint = tmp_path / "checkpoint.json"
+    transfer(source, target, result, checkpoint=Checkpoint(checkpoint))
+
+    # the copy of the table without key committed, but was not marked done
+    state = Checkpoint(checkpoint)
+    state.tables["promocodes_events"] = {"started": True}
+    state.update("promocodes_events")
+    with pytest.raises(BridgeError):
+        transfer(source, target, result, checkpoint=Checkpoint(checkpoint))
+
+    connection = sqlite3.connect(target)
+    connection.execute("DELETE FROM promocodes_events")
+    connection.commit()
+    connection.close()
+    copied = transfer(source, target, result, checkpoint=Checkpoint(checkpoint))
+    assert copied["promocodes_events"] == 2
+    assert rows(target, "promocodes_events") == rows(source, "promocodes_events")
@@ -1,7 +1,13 @@
+import threading
+import time
+
+import pytest
+
 from orm_bridge.bridge.ormar import OrmarBridge
 from orm_bridge.bridge.tortoise import TortoiseBridge
-from orm_bridge.translator import Translator
-from orm_bridge.mapping import FieldMapping, FieldType
+from orm_bridge.errors import TranslationCollision
+from orm_bridge.translator import Translator, TranslationResult
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
 
 from tests.ormar_models import User, Event, Registration, Promocode
 
@@ -51,3 +57,100 @@ def test_translator() -> None:
         type=FieldType.MANY2MANY,
         tablename="events",
     )
+
+
+def test_translation_result_indexes() -> None:
+    translator = Translator(OrmarBridge(), TortoiseBridge())
+    result = translator.translate_many(User, Event, User)
+    assert len(result) == 2
+    assert result.by_tablename("users") is result[User]
+    assert result.by_name("Event") is result[Event]
+    assert result.get_mapping(Event).name == "events"
+    assert list(result.mapping()) == [User, Event]
+    assert set(result.mappings()) == {"users", "events"}
+    assert Registration not in result
+
+
+def test_translation_result_collisions() -> None:
+    first = type("User", (), {})
+    second = type("User", (), {})
+    result: TranslationResult = TranslationResult()
+    result.add(first, object, ModelMapping(name="users", fields=[]))
+    result.add(second, object, ModelMapping(name="accounts", fields=[]))
+
+    assert result[second] is object
+    assert result.collisions == {"User": [first, second]}
+    with pytest.raises(TranslationCollision):
+        result.by_name("User")
+    with pytest.raises(TranslationCollision):
+        result.add(type("Other", (), {}), int, ModelMapping(name="users", fields=[]))
+
+    shared = type("Account", (), {})
+    result.add(shared, object, ModelMapping(name="users", fields=[]))
+    assert result.by_tablename("users") is result[shared] is object
+
+
+def test_translate_many_shared_tablename() -> None:
+    first = type("User", (), {})
+    second = type("Member", (), {})
+    mapping = ModelMapping(
+        name="shared_users",
+        fields=[FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True)],
+    )
+    translator = Translator(OrmarBridge(), TortoiseBridge())
+    translator.from_orm.get_mapping = lambda model: mapping  # type: ignore
+
+    result = translator.translate_many(first, second)
+    assert result[first] is result[second] is result.by_tablename("shared_users")
+    assert result.get_mapping(second) is mapping
+
+
+def test_translate_many_builds_on_pool() -> None:
+    mappings = {
+        type(f"Source{i}", (), {}): ModelMapping(
+            name=f"pooled_{i}",
+            fields=[FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True)],
+        )
+        for i in range(2)
+    }
+    # each barrier is only passed once both models are handled at the same time
+    extracting = threading.Barrier(2, timeout=5)
+    bridging = threading.Barrier(2, timeout=5)
+    creating = 0
+    overlapped = False
+
+    def get_mapping(model: type) -> ModelMapping:
+        extracting.wait()
+        return mappings[model]
+
+    bridge = TortoiseBridge()
+    bridge_fields = bridge.bridge_fields
+
+    def slow_bridge_fields(mapping: ModelMapping) -> dict:
+        bridging.wait()
+        return bridge_fields(mapping)
+
+    class CountingLock:
+        def __init__(self) -> None:
+            self.lock = threading.RLock()
+
+        def __enter__(self) -> None:
+            nonlocal creating, overlapped
+            self.lock.acquire()
+            creating += 1
+            overlapped = overlapped or creating > 1
+            time.sleep(0.01)
+
+        def __exit__(self, *exc_info: object) -> None:
+            nonlocal creating
+            creating -= 1
+            self.lock.release()
+
+    bridge.bridge_fields = slow_bridge_fields  # type: ignore
+    bridge.creation_lock = CountingLock()  # type: ignore
+    translator = Translator(OrmarBridge(), bridge)
+    translator.from_orm.get_mapping = get_mapping  # type: ignore
+
+    result = translator.translate_many(*mappings, workers=2)
+    assert [result[model].__name__ for model in mappings] == ["Pooled_0", "Pooled_1"]
+    assert not overlapped
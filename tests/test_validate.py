@@ -0,0 +1,100 @@
+import enum
+
+import pytest
+
+from orm_bridge import validate
+from orm_bridge.errors import BridgeError, MappingError
+from orm_bridge.mapping import FieldMapping, FieldType, ModelMapping
+from orm_bridge.validate import BatchValidator
+
+numpy = pytest.importorskip("numpy")
+
+
+class Status(enum.Enum):
+    DRAFT = "draft"
+    PUBLISHED = "published"
+
+
+MAPPING = ModelMapping(
+    name="posts",
+    fields=[
+        FieldMapping(name="id", type=FieldType.INTEGER, primary_key=True, autoincrement=True),
+        FieldMapping(name="title", type=FieldType.STRING, max_length=8),
+        FieldMapping(name="rating", type=FieldType.FLOAT, ge=0, le=5, nullable=True),
+        FieldMapping(name="status", type=FieldType.STRING, choices={Status.DRAFT, "published"}),
+        FieldMapping(name="tags", type=FieldType.MANY2MANY, tablename="tags"),
+    ],
+)
+
+RECORDS = [
+    (1, "hello", 4.5, "draft"),
+    (None, "too long title", None, "published"),
+    (3, None, -1, "archived"),
+    (4, "ok", "five", None),
+    (5, "fine", 5, "published"),
+]
+
+
+def test_records() -> None:
+    report = BatchValidator(MAPPING).validate_records(RECORDS)
+    assert report.rows == 5
+    assert not report
+    assert report.invalid_rows() == [1, 2, 3]
+    assert report.summary() == {
+        "title": {"null": 1, "max_length": 1},
+        "rating": {"type": 1, "ge": 1},
+        "status": {"null": 1, "choices": 1},
+    }
+    assert report.errors(2) == [("title", "null"), ("rating", "ge"), ("status", "choices")]
+    assert report.errors(4) == []
+    assert "tags" not in report.masks
+
+
+def test_dict_records() -> None:
+    fields = ("id", "title", "rating", "status")
+    records = [dict(zip(fields, record)) for record in RECORDS]
+    assert validate.validate(MAPPING, records).summary() == (
+        BatchValidator(MAPPING).validate_records(RECORDS).summary()
+    )
+
+
+def test_arrays() -> None:
+    report = BatchValidator(MAPPING).validate(
+        {
+            "title": numpy.array(["a", "abcdefghi", "abc"]),
+            "rating": numpy.array([numpy.nan, 5.5, 0.0]),
+            "status": numpy.array(["draft", "draft", "published"], dtype=object),
+        }
+    )
+    assert report.summary() == {"title": {"max_length": 1}, "rating": {"le": 1}}
+    assert report.invalid.tolist() == [False, True, False]
+
+
+def test_missing_column() -> None:
+    report = BatchValidator(MAPPING).validate({"title": ["a", "b"]})
+    assert report.summary() == {"status": {"null": 2}}
+
+
+def test_empty() -> None:
+    report = BatchValidator(MAPPING).validate_records([])
+    assert report.rows == 0
+    assert report
+
+
+def test_lengths_differ() -> None:
+    with pytest.raises(BridgeError):
+        BatchValidator(MAPPING).validate({"title": ["a"], "status": ["draft", "draft"]})
+
+
+def test_ragged_records() -> None:
+    validator = BatchValidator(MAPPING)
+    with pytest.raises(MappingError):
+        validator.validate_records([RECORDS[0], RECORDS[1][:3]])
+    with pytest.raises(MappingError):
+        validator.validate_records([RECORDS[0] + ("extra",)])
+
+
+def test_without_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(validate, "numpy", None)
+    with pytest.raises(BridgeError):
+        BatchValidator(MAPPING)